@@ -19,6 +19,10 @@ SNOWFLAKE_PAT=your-programmatic-access-token
 # SNOWFLAKE_SCHEMA=your-default-schema
 # SNOWFLAKE_WAREHOUSE=your-default-warehouse
 # SNOWFLAKE_ROLE=your-default-role
+# SNOWFLAKE_WARM_POOL=1
+# MCP_DDL_DEBUG=1
+# MCP_DML_DEBUG=1
+# MCP_OPERATIONS_DEBUG=1
 EOF
     echo "⚠️  Please update .env with your Snowflake credentials before running the server"
     echo "💡 You need:"
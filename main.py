@@ -19,19 +19,33 @@ Snowflake databases.
 """
 
 import logging
+import os
+import anyio
 from fastmcp import FastMCP
-
-# Load environment variables from .env file
 try:
-    from dotenv import load_dotenv
-    load_dotenv()
+    import uvloop
 except ImportError:
-    # python-dotenv not available, skip loading .env file
-    pass
+    uvloop = None
+
+# Load environment variables from .env file, unless every required credential
+# is already provided by the environment (e.g. container deployments). A
+# partial environment still reads .env, without overriding what is exported.
+if not (
+    os.getenv("SNOWFLAKE_ACCOUNT")
+    and os.getenv("SNOWFLAKE_USER")
+    and (os.getenv("SNOWFLAKE_PAT") or os.getenv("SNOWFLAKE_PASSWORD"))
+):
+    try:
+        from dotenv import load_dotenv
+        load_dotenv(override=False)
+    except ImportError:
+        # python-dotenv not available, skip loading .env file
+        pass
 from src.tools.ddl_tools import register_ddl_tools
 from src.tools.dml_tools import register_dml_tools
 from src.tools.operations_tools import register_operations_tools
 from src.middleware.snowflake_middleware import register_middleware
+from src.core.snowflake_utils import warm_pool
 
 # Configure logging
 logging.basicConfig(
@@ -61,14 +75,28 @@ def main():
     register_dml_tools(mcp)
     register_operations_tools(mcp)
     
+    # Optionally authenticate up front so the first tool call hits a warm connection
+    if os.getenv("SNOWFLAKE_WARM_POOL") == "1":
+        logger.info("Warming Snowflake connection pool...")
+        if warm_pool():
+            logger.info("Snowflake connection pool warmed")
+        else:
+            logger.warning("Could not warm Snowflake connection pool; connecting on first request")
+    
     # Start the server
     logger.info("Starting Snowflake Developer MCP Server on stdio...")
     logger.info("Server ready! Available capabilities:")
     logger.info("🔧 Tools: DDL, DML, and Snowflake operations")
-    logger.info("🔗 Connection: Simple per-operation pattern")
+    logger.info("🔗 Connection: Pooled per credential set")
     
     return mcp
 
 if __name__ == "__main__":
     server = main()
-    server.run()
\ No newline at end of file
+    # Serve on uvloop's faster event loop when it is installed. The loop is
+    # handed to anyio as a loop factory rather than installed as the global
+    # event loop policy, which Python 3.12+ deprecates.
+    if uvloop is not None:
+        anyio.run(server.run_async, backend_options={"loop_factory": uvloop.new_event_loop})
+    else:
+        server.run()
@@ -33,24 +33,31 @@ def get_middleware_registration():
     from .middleware import register_middleware
     return register_middleware
 
-# For convenience, provide direct access when FastMCP is available
-try:
-    from .tools.ddl_tools import register_ddl_tools
-    from .tools.dml_tools import register_dml_tools  
-    from .tools.operations_tools import register_operations_tools
-    from .middleware import register_middleware
-    _FASTMCP_AVAILABLE = True
-except ImportError:
-    _FASTMCP_AVAILABLE = False
-    # Provide placeholder functions when FastMCP is not available
-    def register_ddl_tools(*args, **kwargs):
-        raise ImportError("FastMCP is required to register DDL tools")
-    def register_dml_tools(*args, **kwargs):
-        raise ImportError("FastMCP is required to register DML tools")
-    def register_operations_tools(*args, **kwargs):
-        raise ImportError("FastMCP is required to register operations tools")
-    def register_middleware(*args, **kwargs):
-        raise ImportError("FastMCP is required to register middleware")
+# For convenience, provide direct access to the registration functions. They are
+# resolved on first attribute access (PEP 562) so importing the package does not
+# pull in FastMCP and every tool module.
+_LAZY_REGISTRATIONS = {
+    "register_ddl_tools": (get_ddl_tools_registration, "DDL tools"),
+    "register_dml_tools": (get_dml_tools_registration, "DML tools"),
+    "register_operations_tools": (get_operations_tools_registration, "operations tools"),
+    "register_middleware": (get_middleware_registration, "middleware"),
+}
+
+
+def __getattr__(name):
+    if name not in _LAZY_REGISTRATIONS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    loader, label = _LAZY_REGISTRATIONS[name]
+    try:
+        func = loader()
+    except ImportError:
+        # Provide a placeholder function when FastMCP is not available
+        def func(*args, **kwargs):
+            raise ImportError(f"FastMCP is required to register {label}")
+
+    globals()[name] = func
+    return func
 
 __all__ = [
     # Core utilities
@@ -5,8 +5,9 @@ Core utilities for the Snowflake MCP Server:
 
 - Response Handlers: Consistent response parsing and formatting for all operations
 - Exceptions: Comprehensive error handling with specific context for different operations
-- Snowflake Utils: Simple connection utilities for database operations
-- Models: Data models and validation schemas
+- Snowflake Utils: Pooled connection utilities for database operations
+- Models: Dataclass schemas for operation responses
+- Cache: Thread-safe TTL/LRU cache for repeated read-only queries
 
 These utilities provide the foundation for all Snowflake operations across DDL, DML,
 and administrative tools.
@@ -30,8 +31,12 @@ __all__ = [
 # Utility categories
 UTILITY_CATEGORIES = {
     "connection": {
-        "description": "Simple per-operation database connections via snowflake_utils",
-        "components": ["get_snowflake_connection"]
+        "description": "Pooled, health-checked database connections via snowflake_utils",
+        "components": ["get_snowflake_credentials", "get_snowflake_connection", "transaction_connection", "close_all_connections"]
+    },
+    "caching": {
+        "description": "TTL/LRU caching of read-only query results",
+        "components": ["TTLCache"]
     },
     "response_handling": {
         "description": "Response parsing and formatting for consistent tool outputs",
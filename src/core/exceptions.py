@@ -5,41 +5,52 @@ from textwrap import dedent
 class SnowflakeException(Exception):
     """Custom exception class for Snowflake database errors."""
     
+    __slots__ = ("message", "status_code", "tool", "_formatted")
+    
     def __init__(self, tool: str, message, status_code: Optional[int] = None):
         self.message = message
         self.status_code = status_code
         super().__init__(message)
         self.tool = tool
+        
+        # Format error message with tool context and optional status code once
+        if status_code:
+            self._formatted = f"{tool} Error: {message} (Code: {status_code})"
+        else:
+            self._formatted = f"{tool} Error: {message}"
 
     def __str__(self):
-        """Format error message with tool context and optional status code."""
-        if self.status_code:
-            return f"{self.tool} Error: {self.message} (Code: {self.status_code})"
-        else:
-            return f"{self.tool} Error: {self.message}"
+        """Return the error message with tool context and optional status code."""
+        return self._formatted
 
 
 class MissingArgumentsException(Exception):
     """Exception for missing required arguments."""
     
+    __slots__ = ("missing", "_formatted")
+    
     def __init__(self, missing: list):
         self.missing = missing
         super().__init__(missing)
-
-    def __str__(self):
-        missing_str = "\n\t\t".join(["--" + i for i in self.missing])
+        
+        missing_str = "\n\t\t".join(["--" + i for i in missing])
         message = f"""
         -----------------------------------------------------------------------------------
         Required arguments missing:
         \t{missing_str}
         These values must be specified as command-line arguments or environment variables
         -----------------------------------------------------------------------------------"""
-        return dedent(message)
+        self._formatted = dedent(message)
+
+    def __str__(self):
+        return self._formatted
 
 
 class ConnectionException(SnowflakeException):
     """Exception specifically for connection-related errors."""
     
+    __slots__ = ("connection_name",)
+    
     def __init__(self, message: str, connection_name: str = "default"):
         self.connection_name = connection_name
         super().__init__("Connection Manager", message)
@@ -48,15 +59,27 @@ class ConnectionException(SnowflakeException):
 class DDLException(SnowflakeException):
     """Exception for DDL (Data Definition Language) operation errors."""
     
+    __slots__ = ("operation", "ddl_statement")
+    
     def __init__(self, message: str, operation: str = "DDL", ddl_statement: Optional[str] = None):
         self.operation = operation
         self.ddl_statement = ddl_statement
         super().__init__("DDL Manager", message)
 
+    @classmethod
+    def from_snowflake(cls, error: Exception, operation: str = "DDL", ddl_statement: Optional[str] = None) -> "DDLException":
+        """Wrap an error raised while executing DDL, returning it unchanged if it already is a DDLException."""
+        if isinstance(error, cls):
+            return error
+        message = error.message if isinstance(error, SnowflakeException) else str(error)
+        return cls(f"Error executing DDL: {message}", operation, ddl_statement)
+
 
 class DMLException(SnowflakeException):
     """Exception for DML (Data Manipulation Language) operation errors."""
     
+    __slots__ = ("operation", "table_name")
+    
     def __init__(self, message: str, operation: str = "DML", table_name: Optional[str] = None):
         self.operation = operation
         self.table_name = table_name
@@ -66,6 +89,8 @@ class DMLException(SnowflakeException):
 class OperationsException(SnowflakeException):
     """Exception for general Snowflake operations errors."""
     
+    __slots__ = ("operation", "object_name")
+    
     def __init__(self, message: str, operation: str = "Operation", object_name: Optional[str] = None):
         self.operation = operation
         self.object_name = object_name
@@ -75,12 +100,17 @@ class OperationsException(SnowflakeException):
 class ValidationException(Exception):
     """Exception for input validation errors."""
     
+    __slots__ = ("field_name", "provided_value", "_formatted")
+    
     def __init__(self, message: str, field_name: Optional[str] = None, provided_value: Optional[str] = None):
         self.field_name = field_name
         self.provided_value = provided_value
         super().__init__(message)
+        
+        if field_name:
+            self._formatted = f"Validation Error in '{field_name}': {message}"
+        else:
+            self._formatted = f"Validation Error: {message}"
     
     def __str__(self):
-        if self.field_name:
-            return f"Validation Error in '{self.field_name}': {self.args[0]}"
-        return f"Validation Error: {self.args[0]}"
\ No newline at end of file
+        return self._formatted
\ No newline at end of file
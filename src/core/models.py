@@ -1,23 +1,26 @@
-from pydantic import BaseModel
-from typing import Optional, Union, List
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Union, List
 
 
-class DDLResponse(BaseModel):
+@dataclass(slots=True)
+class DDLResponse:
     """Response model for DDL operations."""
     success: bool
     message: str
     results: List[str]
 
 
-class DMLResponse(BaseModel):
+@dataclass(slots=True)
+class DMLResponse:
     """Response model for DML operations."""
     success: bool
     message: str
-    results: List[str]
+    results: List[Dict[str, Any]]
     rows_affected: int
 
 
-class SnowflakeOperationResponse(BaseModel):
+@dataclass(slots=True)
+class SnowflakeOperationResponse:
     """Response model for general Snowflake operations."""
     success: bool
     message: str
@@ -1,21 +1,82 @@
+import json
+from dataclasses import MISSING, fields
+from typing import Any, Dict, Tuple
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from .models import DDLResponse, DMLResponse, SnowflakeOperationResponse
 
+
+# Field names and defaults of each response model, resolved once at import
+_MODEL_FIELDS: Dict[type, Tuple[Tuple[str, Any], ...]] = {
+    model: tuple((field.name, field.default) for field in fields(model))
+    for model in (DDLResponse, DMLResponse, SnowflakeOperationResponse)
+}
+
+
+def _response_payload(model: type, response: dict) -> dict:
+    """Return the fields of a manager response dict with the shape of model.
+
+    Only the model's fields are kept; optional fields missing from the
+    response take their default.
+    """
+    payload = {}
+    for name, default in _MODEL_FIELDS[model]:
+        if name in response:
+            payload[name] = response[name]
+        elif default is MISSING:
+            raise ValueError(f"{model.__name__} is missing required field '{name}'")
+        else:
+            payload[name] = default
+    return payload
+
+
+def _dump_response(model: type, response: dict) -> str:
+    """Serialize a manager response dict to JSON with the shape of model.
+
+    orjson is used when available, with the standard library as fallback
+    for it missing or for values it cannot encode.
+    """
+    payload = _response_payload(model, response)
+
+    if orjson is not None:
+        try:
+            return orjson.dumps(payload, default=str).decode()
+        except TypeError:
+            pass
+    return json.dumps(payload, default=str, separators=(",", ":"))
+
+
 class SnowflakeResponse:
     """Response parser for Snowflake database operations."""
-    
-    
+
+
     def parse_ddl_response(self, response: dict) -> str:
         """Parse DDL operation response."""
-        ret = DDLResponse(**response)
-        return ret.model_dump_json()
+        return _dump_response(DDLResponse, response)
+
+    def parse_ddl_response_dict(self, response: dict) -> dict:
+        """Parse DDL operation response into a dict, without JSON encoding."""
+        return _response_payload(DDLResponse, response)
+
+    def parse_ddl_response_meta(self, response: dict) -> dict:
+        """Summarize a DDL operation response without serializing its results."""
+        return {"row_count": len(response.get("results") or ())}
 
     def parse_dml_response(self, response: dict) -> str:
         """Parse DML operation response."""
-        ret = DMLResponse(**response)
-        return ret.model_dump_json()
+        return _dump_response(DMLResponse, response)
+
+    def parse_dml_response_dict(self, response: dict) -> dict:
+        """Parse DML operation response into a dict, without JSON encoding."""
+        return _response_payload(DMLResponse, response)
 
     def parse_snowflake_operation_response(self, response: dict) -> str:
         """Parse general Snowflake operation response."""
-        ret = SnowflakeOperationResponse(**response)
-        return ret.model_dump_json()
+        return _dump_response(SnowflakeOperationResponse, response)
 
+    def parse_snowflake_operation_response_dict(self, response: dict) -> dict:
+        """Parse general Snowflake operation response into a dict, without JSON encoding."""
+        return _response_payload(SnowflakeOperationResponse, response)
@@ -1,22 +1,281 @@
 """
-Simple Snowflake Connection Utilities
+Snowflake Connection Utilities
 
-This module provides simple, stateless connection utilities for Snowflake operations,
-following the pattern used in the reference implementation.
+This module provides connection utilities for Snowflake operations.
 
-No connection pooling or persistence - each operation gets a fresh connection.
+Connections are pooled per process: each distinct credential/parameter set
+authenticates once and the resulting connection is reused by subsequent
+operations. Pooled connections are health-checked before reuse and
+transparently re-created if they have been closed or dropped.
+
+Shared connections must never hold an open transaction or session state,
+since every concurrent operation runs on them and a silent reconnect would
+drop that state. The managers reject caller-supplied statements that match
+is_session_statement (BEGIN, COMMIT, USE, ALTER SESSION, ...); explicit
+BEGIN ... COMMIT work checks out a connection of its own with
+transaction_connection instead. The one sanctioned session change is
+use_session_context, which records the context per credential set and
+replays it on every new connection for that set.
 """
 
+import atexit
 import os
-from typing import Optional
-try:
-    import snowflake.connector
+import re
+import threading
+import time
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Tuple
+
+from .exceptions import ConnectionException, MissingArgumentsException, ValidationException
+
+if TYPE_CHECKING:
     from snowflake.connector import SnowflakeConnection
-except ImportError:
-    snowflake = None
-    SnowflakeConnection = None
 
-from .exceptions import ConnectionException, MissingArgumentsException
+
+# Environment variables holding the default credentials
+ENV_ACCOUNT = "SNOWFLAKE_ACCOUNT"
+ENV_USER = "SNOWFLAKE_USER"
+ENV_PAT = "SNOWFLAKE_PAT"
+ENV_PASSWORD = "SNOWFLAKE_PASSWORD"
+
+# Seconds credentials read from the environment are reused before re-reading
+CREDENTIALS_TTL = 300.0
+
+# A single unquoted or double-quoted identifier (with "" as an escaped quote)
+IDENTIFIER_PATTERN = r'(?:[A-Za-z_][A-Za-z0-9_$]*|"(?:[^"]|"")+")'
+
+# A possibly dotted object name made of such identifiers, for names that must
+# be interpolated into SQL because Snowflake cannot bind them
+OBJECT_NAME_RE = re.compile(rf"\A{IDENTIFIER_PATTERN}(?:\.{IDENTIFIER_PATTERN})*\Z")
+
+# Statements that start a transaction or change session state, after any
+# leading comments. A bare BEGIN [WORK|TRANSACTION] starts a transaction;
+# BEGIN followed by statements is a Snowflake Scripting block and is allowed.
+_SESSION_STATEMENT_RE = re.compile(
+    r"\A(?:\s|--[^\n]*|/\*.*?\*/)*(?:"
+    r"BEGIN(?:\s+(?:WORK|TRANSACTION))?(?:\s+NAME\s+\S+)?\s*(?:;\s*)?\Z|"
+    r"START\s+TRANSACTION\b|COMMIT\b|ROLLBACK\b|USE\b|ALTER\s+SESSION\b)",
+    re.IGNORECASE | re.DOTALL
+)
+
+# Seconds a connection is trusted after a successful health check before the
+# next reuse issues another lightweight ``SELECT 1``.
+HEALTH_CHECK_TTL = 5.0
+
+# Pooled connections keyed by credential tuple, with the time of their last
+# successful health check.
+_CONNECTION_POOL: Dict[Tuple, Tuple["SnowflakeConnection", float]] = {}
+_POOL_LOCK = threading.Lock()
+
+# Context chosen with use_session_context, per pool key, replayed on each new
+# connection for that key in this order (role first, since it governs access)
+_SESSION_CONTEXT: Dict[Tuple, Dict[str, str]] = {}
+_CONTEXT_ORDER = ("ROLE", "WAREHOUSE", "DATABASE", "SCHEMA")
+
+# Credentials last read by get_snowflake_credentials, and when
+_CREDENTIALS_LOCK = threading.Lock()
+_credentials: Optional[Tuple[str, str, str]] = None
+_credentials_read_at = 0.0
+
+# One lock per pool key, held while that key's connection is health-checked
+# or authenticated, so a slow check or SSO/MFA login only delays callers
+# waiting for the same connection. _POOL_LOCK only guards the dicts.
+_KEY_LOCKS: Dict[Tuple, threading.Lock] = {}
+
+# Idle connections reserved for explicit transactions, keyed like
+# _CONNECTION_POOL. Each is used by one caller at a time.
+_TRANSACTION_POOL: Dict[Tuple, List["SnowflakeConnection"]] = {}
+
+# snowflake.connector is heavy to import, so it is loaded on first connect
+_connector = None
+
+
+def _get_connector():
+    """Import snowflake.connector on first use."""
+    global _connector
+    if _connector is None:
+        try:
+            import snowflake.connector
+        except ImportError:
+            raise ConnectionException("snowflake-connector-python is required but not installed")
+        _connector = snowflake.connector
+    return _connector
+
+
+def get_dict_cursor_class():
+    """Return snowflake.connector.DictCursor, importing the connector on first use."""
+    return _get_connector().DictCursor
+
+
+def _connection_key(account_identifier: str, username: str, password: str, kwargs: dict) -> Tuple:
+    """Build the pool key for a credential/parameter set."""
+    return (account_identifier, username, hash(password), tuple(sorted(kwargs.items())))
+
+
+def credentials_key(params: dict) -> tuple:
+    """Build a hashable key for a set of connection parameters.
+    
+    Used by the manager registries and caches, so one credential set maps to
+    one key without keeping the password itself in it.
+    """
+    return tuple(sorted(
+        (k, hash(v) if k == "password" else v) for k, v in params.items()
+    ))
+
+
+def is_session_statement(sql: str) -> bool:
+    """Return whether sql would open a transaction or change session state.
+    
+    Such statements must not run on a shared pooled connection: their effect
+    would leak to every concurrent caller and vanish on reconnect.
+    """
+    return _SESSION_STATEMENT_RE.match(sql) is not None
+
+
+def _key_lock(key: Tuple) -> threading.Lock:
+    """Return the lock serializing connects and health checks for key."""
+    with _POOL_LOCK:
+        lock = _KEY_LOCKS.get(key)
+        if lock is None:
+            lock = _KEY_LOCKS[key] = threading.Lock()
+        return lock
+
+
+def get_snowflake_credentials(refresh: bool = False) -> Tuple[str, str, str]:
+    """Get Snowflake credentials from environment variables.
+
+    The environment is re-read at most once every CREDENTIALS_TTL seconds
+    (or at once with refresh set), so a rotated PAT is picked up without
+    restarting the server. When the credentials change, pooled connections
+    opened with the previous set are closed.
+
+    Returns
+    -------
+    tuple
+        (account_identifier, username, password or PAT)
+
+    Raises
+    ------
+    ValidationException
+        If any required variable is unset
+    """
+    global _credentials, _credentials_read_at
+    now = time.monotonic()
+    with _CREDENTIALS_LOCK:
+        if not refresh and _credentials is not None and now - _credentials_read_at < CREDENTIALS_TTL:
+            return _credentials
+        credentials = (
+            os.getenv(ENV_ACCOUNT),
+            os.getenv(ENV_USER),
+            os.getenv(ENV_PAT) or os.getenv(ENV_PASSWORD)
+        )
+        if not all(credentials):
+            raise ValidationException("Missing required Snowflake credentials: SNOWFLAKE_ACCOUNT, SNOWFLAKE_USER, and SNOWFLAKE_PAT/SNOWFLAKE_PASSWORD", "credentials", "environment")
+        previous = _credentials
+        _credentials, _credentials_read_at = credentials, now
+
+    if previous is not None and previous != credentials:
+        _retire_credentials(previous, credentials)
+    return credentials
+
+
+def _retire_credentials(previous: Tuple[str, str, str], current: Tuple[str, str, str]) -> None:
+    """Close pooled connections opened with previous credentials.
+
+    Session context chosen with use_session_context carries over to the
+    current credentials when only the password or PAT changed.
+    """
+    old = (previous[0], previous[1], hash(previous[2]))
+    new = (current[0], current[1], hash(current[2]))
+    stale = []
+    with _POOL_LOCK:
+        for key in [key for key in _CONNECTION_POOL if key[:3] == old]:
+            stale.append(_CONNECTION_POOL.pop(key)[0])
+        for key in [key for key in _TRANSACTION_POOL if key[:3] == old]:
+            stale.extend(_TRANSACTION_POOL.pop(key))
+        for key in [key for key in _SESSION_CONTEXT if key[:3] == old]:
+            context = _SESSION_CONTEXT.pop(key)
+            if old[:2] == new[:2]:
+                _SESSION_CONTEXT.setdefault(new + key[3:], context)
+
+    for connection in stale:
+        try:
+            connection.close()
+        except Exception:
+            pass
+
+
+def _resolve_credentials(
+    account_identifier: Optional[str],
+    username: Optional[str],
+    password: Optional[str]
+) -> Tuple[str, str, str]:
+    """Fill in missing credentials from the environment, raising if any are still absent."""
+    account_identifier = account_identifier or os.getenv(ENV_ACCOUNT)
+    username = username or os.getenv(ENV_USER)
+    password = password or os.getenv(ENV_PAT) or os.getenv(ENV_PASSWORD)
+
+    # Check for missing credentials
+    missing = []
+    if not account_identifier:
+        missing.append("account_identifier (or SNOWFLAKE_ACCOUNT env var)")
+    if not username:
+        missing.append("username (or SNOWFLAKE_USER env var)")
+    if not password:
+        missing.append("password (or SNOWFLAKE_PAT/SNOWFLAKE_PASSWORD env var)")
+
+    if missing:
+        raise MissingArgumentsException(missing)
+
+    return account_identifier, username, password
+
+
+def _connect(account_identifier: str, username: str, password: str, kwargs: dict) -> "SnowflakeConnection":
+    """Open a new authenticated connection."""
+    connector = _get_connector()
+    try:
+        return connector.connect(
+            account=account_identifier,
+            user=username,
+            password=password,
+            autocommit=True,  # Enable autocommit for simplicity
+            **kwargs
+        )
+    except Exception as e:
+        raise ConnectionException(f"Failed to establish Snowflake connection: {str(e)}")
+
+
+def _open(key: Tuple, account_identifier: str, username: str, password: str, kwargs: dict) -> "SnowflakeConnection":
+    """Open a new connection for key and apply its recorded session context."""
+    connection = _connect(account_identifier, username, password, kwargs)
+    with _POOL_LOCK:
+        context = dict(_SESSION_CONTEXT.get(key, ()))
+    if context:
+        try:
+            cursor = connection.cursor()
+            for context_type in _CONTEXT_ORDER:
+                if context_type in context:
+                    cursor.execute(f"USE {context_type} {context[context_type]}")
+        except Exception as e:
+            try:
+                connection.close()
+            except Exception:
+                pass
+            raise ConnectionException(f"Failed to restore Snowflake session context: {str(e)}")
+    return connection
+
+
+def _is_alive(connection, last_checked: float) -> bool:
+    """Return whether a pooled connection can be reused."""
+    try:
+        if connection.is_closed():
+            return False
+        if time.monotonic() - last_checked < HEALTH_CHECK_TTL:
+            return True
+        connection.cursor().execute("SELECT 1").fetchall()
+        return True
+    except Exception:
+        return False
 
 
 def get_snowflake_connection(
@@ -24,13 +283,13 @@ def get_snowflake_connection(
     username: Optional[str] = None,
     password: Optional[str] = None,
     **kwargs
-) -> SnowflakeConnection: # type: ignore
+) -> "SnowflakeConnection":
     """Get a Snowflake connection using provided credentials.
-    
-    Creates a fresh Snowflake connection for each call. This follows the
-    simple pattern used in the reference implementation where each operation
-    gets its own connection.
-    
+
+    Returns a pooled connection for the given credentials, authenticating
+    only when no live connection exists yet for that credential set. A
+    pooled connection that fails its health check is closed and replaced.
+
     Parameters
     ----------
     account_identifier : str, optional
@@ -41,12 +300,12 @@ def get_snowflake_connection(
         Snowflake password or PAT. If not provided, reads from SNOWFLAKE_PAT or SNOWFLAKE_PASSWORD env var
     **kwargs
         Additional connection parameters (database, schema, warehouse, role, etc.)
-        
+
     Returns
     -------
     SnowflakeConnection
         An authenticated Snowflake connection
-        
+
     Raises
     ------
     ConnectionException
@@ -54,35 +313,179 @@ def get_snowflake_connection(
     MissingArgumentsException
         If required credentials are not provided
     """
-    if snowflake is None:
-        raise ConnectionException("snowflake-connector-python is required but not installed")
-    
-    # Get credentials from parameters or environment variables
-    account_identifier = account_identifier or os.getenv("SNOWFLAKE_ACCOUNT")
-    username = username or os.getenv("SNOWFLAKE_USER")
-    password = password or os.getenv("SNOWFLAKE_PAT") or os.getenv("SNOWFLAKE_PASSWORD")
-    
-    # Check for missing credentials
-    missing = []
-    if not account_identifier:
-        missing.append("account_identifier (or SNOWFLAKE_ACCOUNT env var)")
-    if not username:
-        missing.append("username (or SNOWFLAKE_USER env var)")
-    if not password:
-        missing.append("password (or SNOWFLAKE_PAT/SNOWFLAKE_PASSWORD env var)")
-        
-    if missing:
-        raise MissingArgumentsException(missing)
-        
+    account_identifier, username, password = _resolve_credentials(account_identifier, username, password)
+    key = _connection_key(account_identifier, username, password, kwargs)
+
+    # The health check and any authentication run outside _POOL_LOCK, so
+    # other credential sets are never held up by this one
+    with _key_lock(key):
+        with _POOL_LOCK:
+            pooled = _CONNECTION_POOL.get(key)
+        if pooled is not None:
+            connection, last_checked = pooled
+            if _is_alive(connection, last_checked):
+                with _POOL_LOCK:
+                    _CONNECTION_POOL[key] = (connection, time.monotonic())
+                return connection
+            # Stale connection - discard it and reconnect below
+            with _POOL_LOCK:
+                _CONNECTION_POOL.pop(key, None)
+            try:
+                connection.close()
+            except Exception:
+                pass
+
+        connection = _open(key, account_identifier, username, password, kwargs)
+        with _POOL_LOCK:
+            _CONNECTION_POOL[key] = (connection, time.monotonic())
+        return connection
+
+
+@contextmanager
+def transaction_connection(
+    account_identifier: Optional[str] = None,
+    username: Optional[str] = None,
+    password: Optional[str] = None,
+    **kwargs
+) -> Iterator["SnowflakeConnection"]:
+    """Check out a connection for the caller's exclusive use.
+
+    Unlike get_snowflake_connection, no other operation runs on the
+    connection while it is checked out, so statements between BEGIN and
+    COMMIT/ROLLBACK cannot pick up or undo anyone else's work. Connections
+    are kept for reuse once returned; one whose block raised is closed
+    instead, in case it still holds an open transaction.
+
+    Parameters
+    ----------
+    account_identifier, username, password, **kwargs
+        As for get_snowflake_connection
+
+    Yields
+    ------
+    SnowflakeConnection
+        An authenticated Snowflake connection owned by the caller
+
+    Raises
+    ------
+    ConnectionException
+        If connection fails
+    MissingArgumentsException
+        If required credentials are not provided
+    """
+    account_identifier, username, password = _resolve_credentials(account_identifier, username, password)
+    key = _connection_key(account_identifier, username, password, kwargs)
+
+    connection = None
+    with _POOL_LOCK:
+        idle = _TRANSACTION_POOL.get(key)
+        while idle:
+            candidate = idle.pop()
+            if not candidate.is_closed():
+                connection = candidate
+                break
+    if connection is None:
+        connection = _open(key, account_identifier, username, password, kwargs)
+
     try:
-        return snowflake.connector.connect(
-            account=account_identifier,
-            user=username,
-            password=password,
-            autocommit=True,  # Enable autocommit for simplicity
-            **kwargs
-        )
-    except Exception as e:
-        raise ConnectionException(f"Failed to establish Snowflake connection: {str(e)}")
+        yield connection
+    except BaseException:
+        try:
+            connection.close()
+        except Exception:
+            pass
+        raise
+
+    with _POOL_LOCK:
+        _TRANSACTION_POOL.setdefault(key, []).append(connection)
+
+
+def use_session_context(
+    context_type: str,
+    context_name: str,
+    account_identifier: Optional[str] = None,
+    username: Optional[str] = None,
+    password: Optional[str] = None,
+    **kwargs
+) -> None:
+    """Set the database, schema, warehouse or role of a credential set's connections.
+
+    The context is applied to the shared pooled connection, so it affects
+    every operation for those credentials, and it is recorded so that any
+    connection opened later for them (after a reconnect, or for a
+    transaction) starts in the same context. Idle transaction connections
+    are closed, since they still hold the previous context.
+
+    Parameters
+    ----------
+    context_type : str
+        One of ROLE, WAREHOUSE, DATABASE or SCHEMA
+    context_name : str
+        Validated name of the object to use
+    account_identifier, username, password, **kwargs
+        As for get_snowflake_connection
+
+    Raises
+    ------
+    ConnectionException
+        If connection fails
+    MissingArgumentsException
+        If required credentials are not provided
+    """
+    account_identifier, username, password = _resolve_credentials(account_identifier, username, password)
+    key = _connection_key(account_identifier, username, password, kwargs)
+    connection = get_snowflake_connection(account_identifier, username, password, **kwargs)
+
+    with _key_lock(key):
+        connection.cursor().execute(f"USE {context_type} {context_name}")
+        with _POOL_LOCK:
+            context = _SESSION_CONTEXT.setdefault(key, {})
+            context[context_type] = context_name
+            # USE DATABASE resets the current schema to PUBLIC
+            if context_type == "DATABASE":
+                context.pop("SCHEMA", None)
+            idle = _TRANSACTION_POOL.pop(key, [])
+
+    for stale in idle:
+        try:
+            stale.close()
+        except Exception:
+            pass
+
+
+def warm_pool(**kwargs) -> bool:
+    """Pre-authenticate a pooled connection so the first operation reuses it.
+
+    Parameters
+    ----------
+    **kwargs
+        Arguments forwarded to get_snowflake_connection
+
+    Returns
+    -------
+    bool
+        True if a live connection is now pooled, False if connecting failed
+    """
+    try:
+        get_snowflake_connection(**kwargs)
+        return True
+    except Exception:
+        return False
+
+
+def close_all_connections() -> None:
+    """Close and discard every pooled Snowflake connection."""
+    with _POOL_LOCK:
+        pooled = [connection for connection, _ in _CONNECTION_POOL.values()]
+        pooled.extend(connection for idle in _TRANSACTION_POOL.values() for connection in idle)
+        _CONNECTION_POOL.clear()
+        _TRANSACTION_POOL.clear()
+
+    for connection in pooled:
+        try:
+            connection.close()
+        except Exception:
+            pass
 
 
+atexit.register(close_all_connections)
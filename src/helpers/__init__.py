@@ -1,7 +1,7 @@
 """Helper modules for the Snowflake MCP Server."""
 
-from .ddl_manager import DDLManager
-from .dml_manager import DMLManager
-from .operations_manager import OperationsManager
+from .ddl_manager import ColumnSpec, DDLManager, get_ddl_manager
+from .dml_manager import DMLManager, get_dml_manager
+from .operations_manager import OperationsManager, get_operations_manager
 
-__all__ = ["DDLManager", "DMLManager", "OperationsManager"]
\ No newline at end of file
+__all__ = ["ColumnSpec", "DDLManager", "DMLManager", "OperationsManager", "get_ddl_manager", "get_dml_manager", "get_operations_manager"]
\ No newline at end of file
@@ -2,15 +2,57 @@
 DDL Manager for Snowflake MCP Server
 
 This module provides a DDLManager class that encapsulates DDL operations,
-following the simple connection pattern from the reference implementation.
+using connections from the process-wide pool in snowflake_utils.
 
-The DDLManager creates fresh connections for each instance, eliminating
-the need for complex connection pooling or persistence.
+Each operation also has an ``*_async`` variant that runs the blocking
+driver call in a worker thread for use from async tool handlers.
 """
 
+import asyncio
+import threading
+from functools import lru_cache
 from typing import Dict, List, Optional, Union
-from ..core.snowflake_utils import get_snowflake_connection
+from typing_extensions import TypedDict
+from ..core.snowflake_utils import OBJECT_NAME_RE, credentials_key, get_snowflake_connection, is_session_statement
 from ..core.exceptions import DDLException
+from .dml_manager import clear_query_cache
+
+
+class ColumnSpec(TypedDict):
+    """A column definition for create_table: {"name": ..., "type": ...}."""
+    
+    name: str
+    type: str
+
+
+# Statement templates for the fixed-shape DDL operations
+_CREATE_DATABASE_DDL = "CREATE DATABASE IF NOT EXISTS {name}"
+_CREATE_SCHEMA_DDL = "CREATE SCHEMA IF NOT EXISTS {database}.{schema}"
+_DROP_OBJECT_DDL = "DROP {object_type} IF EXISTS {name}{cascade}"
+_RENAME_SCHEMA_DDL = "ALTER SCHEMA {name} RENAME TO {new_name}"
+_RENAME_DATABASE_DDL = "ALTER DATABASE {name} RENAME TO {new_name}"
+
+@lru_cache(maxsize=256)
+def _identifier(name: str) -> str:
+    """Validate an object name for interpolation into DDL, returning it stripped.
+    
+    Names are validated once and then served from the cache, so repeated
+    operations on the same objects skip the check.
+    """
+    stripped = name.strip()
+    if not OBJECT_NAME_RE.match(stripped):
+        raise DDLException(f"Invalid object name: {name}", "VALIDATE", name)
+    return stripped
+
+
+def _check_shared_statement(ddl_statement: str) -> None:
+    """Raise a DDLException if ddl_statement would change the shared session."""
+    if is_session_statement(ddl_statement):
+        raise DDLException(
+            "Transaction and session statements (BEGIN, COMMIT, USE, ALTER SESSION, ...) are not allowed on the shared connection; use fully qualified names or connection parameters instead",
+            "EXECUTE",
+            ddl_statement
+        )
 
 
 class DDLManager:
@@ -23,7 +65,10 @@ class DDLManager:
         password: Optional[str] = None,
         **kwargs
     ):
-        """Initialize the DDL manager with a fresh Snowflake connection.
+        """Initialize the DDL manager with the credentials to connect with.
+        
+        The connection itself is fetched lazily from the process-wide pool
+        the first time a statement is executed.
         
         Args:
             account_identifier: Snowflake account identifier (optional, can use env vars)
@@ -31,14 +76,18 @@ class DDLManager:
             password: Snowflake password or PAT (optional, can use env vars)
             **kwargs: Additional connection parameters
         """
+        self._connection_params = dict(
+            account_identifier=account_identifier,
+            username=username,
+            password=password,
+            **kwargs
+        )
+        
+    @property
+    def connection(self):
+        """The pooled Snowflake connection for this manager's credentials."""
         try:
-            # Get a fresh connection using the simple utility
-            self.connection = get_snowflake_connection(
-                account_identifier=account_identifier,
-                username=username,
-                password=password,
-                **kwargs
-            )
+            return get_snowflake_connection(**self._connection_params)
         except Exception as e:
             raise DDLException(f"Failed to establish connection: {str(e)}", "CONNECTION", "")
         
@@ -54,6 +103,7 @@ class DDLManager:
                 - message: Status message
                 - results: List of results if any were returned
         """
+        _check_shared_statement(ddl_statement)
         try:
             cursor = self.connection.cursor()
             results = cursor.execute(ddl_statement).fetchall()
@@ -65,7 +115,52 @@ class DDLManager:
             }
             
         except Exception as e:
-            raise DDLException(f"Error executing DDL: {str(e)}", "EXECUTE", ddl_statement)
+            raise DDLException.from_snowflake(e, "EXECUTE", ddl_statement)
+        finally:
+            # Cached query results may describe objects this statement changed
+            clear_query_cache()
+            
+    def execute_ddl_batch(self, ddl_statements: List[str]) -> Dict[str, Union[bool, str, List[str]]]:
+        """Execute several DDL statements in order over one pooled connection.
+        
+        The statements share a single cursor, so the batch costs one
+        connection checkout rather than one per statement. DDL commits
+        implicitly in Snowflake, so statements that ran before a failure stay
+        applied; the error names the statement that failed.
+        
+        Args:
+            ddl_statements: The DDL statements to execute, in order
+            
+        Returns:
+            Dict containing:
+                - success: Boolean indicating if every statement succeeded
+                - message: Status message
+                - results: Results of all statements, in execution order
+        """
+        for ddl_statement in ddl_statements:
+            _check_shared_statement(ddl_statement)
+        cursor = self.connection.cursor()
+        results = []
+        try:
+            for index, ddl_statement in enumerate(ddl_statements, 1):
+                try:
+                    rows = cursor.execute(ddl_statement).fetchall()
+                except Exception as e:
+                    raise DDLException(
+                        f"Error executing DDL statement {index} of {len(ddl_statements)}: {str(e)}",
+                        "EXECUTE_BATCH",
+                        ddl_statement
+                    )
+                results.extend(str(row) for row in rows)
+        finally:
+            cursor.close()
+            clear_query_cache()
+        
+        return {
+            "success": True,
+            "message": f"{len(ddl_statements)} DDL statements executed successfully",
+            "results": results
+        }
             
     def create_database(self, database_name: str) -> Dict[str, Union[bool, str, List[str]]]:
         """Create a new database.
@@ -76,7 +171,7 @@ class DDLManager:
         Returns:
             Dict containing operation status
         """
-        ddl = f"CREATE DATABASE IF NOT EXISTS {database_name}"
+        ddl = _CREATE_DATABASE_DDL.format(name=_identifier(database_name))
         return self.execute_ddl(ddl)
         
     def create_schema(self, database_name: str, schema_name: str) -> Dict[str, Union[bool, str, List[str]]]:
@@ -89,11 +184,11 @@ class DDLManager:
         Returns:
             Dict containing operation status
         """
-        ddl = f"CREATE SCHEMA IF NOT EXISTS {database_name}.{schema_name}"
+        ddl = _CREATE_SCHEMA_DDL.format(database=_identifier(database_name), schema=_identifier(schema_name))
         return self.execute_ddl(ddl)
         
     def create_table(self, database_name: str, schema_name: str, table_name: str, 
-                    columns: List[Dict[str, str]]) -> Dict[str, Union[bool, str, List[str]]]:
+                    columns: List[ColumnSpec]) -> Dict[str, Union[bool, str, List[str]]]:
         """Create a new table with specified columns.
         
         Args:
@@ -105,12 +200,8 @@ class DDLManager:
         Returns:
             Dict containing operation status
         """
-        column_defs = [f"{col['name']} {col['type']}" for col in columns]
-        ddl = f"""
-        CREATE TABLE IF NOT EXISTS {database_name}.{schema_name}.{table_name} (
-            {', '.join(column_defs)}
-        )
-        """
+        column_defs = ", ".join([f"{col['name']} {col['type']}" for col in columns])
+        ddl = f"CREATE TABLE IF NOT EXISTS {database_name}.{schema_name}.{table_name} ({column_defs})"
         return self.execute_ddl(ddl)
         
     def drop_object(self, object_type: str, object_name: str, 
@@ -125,8 +216,11 @@ class DDLManager:
         Returns:
             Dict containing operation status
         """
-        cascade_str = "CASCADE" if cascade else ""
-        ddl = f"DROP {object_type} IF EXISTS {object_name} {cascade_str}"
+        ddl = _DROP_OBJECT_DDL.format(
+            object_type=object_type,
+            name=_identifier(object_name),
+            cascade=" CASCADE" if cascade else ""
+        )
         return self.execute_ddl(ddl)
 
     def alter_table(
@@ -198,11 +292,12 @@ class DDLManager:
         Returns:
             Dict containing operation status
         """
+        schema_name = _identifier(schema_name)
         if new_name:
-            ddl = f"ALTER SCHEMA {schema_name} RENAME TO {new_name}"
+            ddl = _RENAME_SCHEMA_DDL.format(name=schema_name, new_name=_identifier(new_name))
         elif new_database:
             current_schema = schema_name.split('.')[-1]
-            ddl = f"ALTER SCHEMA {schema_name} RENAME TO {new_database}.{current_schema}"
+            ddl = _RENAME_SCHEMA_DDL.format(name=schema_name, new_name=f"{_identifier(new_database)}.{current_schema}")
         else:
             raise DDLException("Either new_name or new_database must be provided", "ALTER", schema_name)
             
@@ -222,5 +317,71 @@ class DDLManager:
         Returns:
             Dict containing operation status
         """
-        ddl = f"ALTER DATABASE {database_name} RENAME TO {new_name}"
-        return self.execute_ddl(ddl)
\ No newline at end of file
+        ddl = _RENAME_DATABASE_DDL.format(name=_identifier(database_name), new_name=_identifier(new_name))
+        return self.execute_ddl(ddl)
+        
+    async def execute_ddl_async(self, *args, **kwargs) -> Dict[str, Union[bool, str, List[str]]]:
+        """Async variant of execute_ddl; accepts the same arguments."""
+        return await asyncio.to_thread(self.execute_ddl, *args, **kwargs)
+        
+    async def execute_ddl_batch_async(self, *args, **kwargs) -> Dict[str, Union[bool, str, List[str]]]:
+        """Async variant of execute_ddl_batch; accepts the same arguments."""
+        return await asyncio.to_thread(self.execute_ddl_batch, *args, **kwargs)
+        
+    async def create_database_async(self, *args, **kwargs) -> Dict[str, Union[bool, str, List[str]]]:
+        """Async variant of create_database; accepts the same arguments."""
+        return await asyncio.to_thread(self.create_database, *args, **kwargs)
+        
+    async def create_schema_async(self, *args, **kwargs) -> Dict[str, Union[bool, str, List[str]]]:
+        """Async variant of create_schema; accepts the same arguments."""
+        return await asyncio.to_thread(self.create_schema, *args, **kwargs)
+        
+    async def create_table_async(self, *args, **kwargs) -> Dict[str, Union[bool, str, List[str]]]:
+        """Async variant of create_table; accepts the same arguments."""
+        return await asyncio.to_thread(self.create_table, *args, **kwargs)
+        
+    async def drop_object_async(self, *args, **kwargs) -> Dict[str, Union[bool, str, List[str]]]:
+        """Async variant of drop_object; accepts the same arguments."""
+        return await asyncio.to_thread(self.drop_object, *args, **kwargs)
+        
+    async def alter_table_async(self, *args, **kwargs) -> Dict[str, Union[bool, str, List[str]]]:
+        """Async variant of alter_table; accepts the same arguments."""
+        return await asyncio.to_thread(self.alter_table, *args, **kwargs)
+        
+    async def alter_schema_async(self, *args, **kwargs) -> Dict[str, Union[bool, str, List[str]]]:
+        """Async variant of alter_schema; accepts the same arguments."""
+        return await asyncio.to_thread(self.alter_schema, *args, **kwargs)
+        
+    async def alter_database_async(self, *args, **kwargs) -> Dict[str, Union[bool, str, List[str]]]:
+        """Async variant of alter_database; accepts the same arguments."""
+        return await asyncio.to_thread(self.alter_database, *args, **kwargs)
+
+
+_INSTANCES: Dict[tuple, DDLManager] = {}
+_INSTANCES_LOCK = threading.Lock()
+
+
+def get_ddl_manager(
+    account_identifier: Optional[str] = None,
+    username: Optional[str] = None,
+    password: Optional[str] = None,
+    **kwargs
+) -> DDLManager:
+    """Return the shared DDLManager for the given credentials, creating it on first use.
+    
+    Args:
+        account_identifier: Snowflake account identifier (optional, can use env vars)
+        username: Snowflake username (optional, can use env vars)
+        password: Snowflake password or PAT (optional, can use env vars)
+        **kwargs: Additional connection parameters
+        
+    Returns:
+        DDLManager instance shared by all callers using the same credentials
+    """
+    params = dict(account_identifier=account_identifier, username=username, password=password, **kwargs)
+    key = credentials_key(params)
+    with _INSTANCES_LOCK:
+        manager = _INSTANCES.get(key)
+        if manager is None:
+            manager = _INSTANCES[key] = DDLManager(**params)
+        return manager
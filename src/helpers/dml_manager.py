@@ -1,18 +1,181 @@
 """
 DML Manager for Snowflake MCP Server
 
-This module provides a DMLManager class that encapsulates DML operations,
-following the simple connection pattern from the reference implementation.
+This module provides a DMLManager class that encapsulates DML operations.
 
-The DMLManager creates fresh connections for each instance, eliminating
-the need for complex connection pooling or persistence.
+The DMLManager borrows a pooled connection from snowflake_utils when a
+statement is executed, so constructing a manager never authenticates.
+Each operation also has an ``*_async`` variant that runs the blocking
+driver call in a worker thread for use from async tool handlers.
 """
 
-from typing import Dict, List, Optional, Union
-from ..core.snowflake_utils import get_snowflake_connection
+import asyncio
+import csv
+import gzip
+import json
+import re
+import tempfile
+import threading
+import uuid
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Sequence, TypeAlias, Union
+from ..core.cache import TTLCache
+from ..core.snowflake_utils import IDENTIFIER_PATTERN, credentials_key, get_dict_cursor_class, get_snowflake_connection, is_session_statement, transaction_connection
 from ..core.exceptions import DMLException
 
 
+# A single value bound into a DML statement
+DMLValue: TypeAlias = Union[str, int, float, bool, None]
+
+# A MERGE action: {"action": ..., "columns": [...], "values": [...]}
+MergeAction: TypeAlias = Dict[str, Union[str, List[str], List[DMLValue]]]
+
+# Status dict returned by every DMLManager operation
+DMLResult: TypeAlias = Dict[str, Union[bool, str, List[Any], int]]
+
+# Maximum number of rows bound into a single batched statement
+MAX_BATCH_SIZE = 1000
+
+# Text written for NULL values in bulk load files, declared to COPY as NULL_IF
+_CSV_NULL = "\\N"
+
+# Number of rows fetched from the server per round-trip when reading results
+FETCH_BATCH_SIZE = 1000
+
+# Results of select_data, shared by all DMLManager instances and cleared
+# once a statement that may modify data or session context has run, by this
+# manager or by the DDL and operations managers. Reads store their rows only
+# if no clear happened while they were in flight (TTLCache.generation).
+QUERY_CACHE = TTLCache(maxsize=512, ttl=60.0)
+
+_READ_ONLY_PREFIXES = ("SELECT", "SHOW", "DESC")
+
+# Functions whose result changes between calls; queries using them are never cached
+_VOLATILE_RE = re.compile(
+    r"\b(?:NEXTVAL|CURRENT_(?:TIMESTAMP|TIME|DATE)|LOCALTIME(?:STAMP)?|SYSDATE|"
+    r"SYSTIMESTAMP|GETDATE|NOW|RANDOM|RANDSTR|UNIFORM|NORMAL|ZIPF|UUID_STRING|SEQ[1248])\b",
+    re.IGNORECASE
+)
+
+# Quoted literals/identifiers are kept verbatim; comments are dropped and
+# whitespace runs collapse to a single space
+_SQL_NORMALIZE_RE = re.compile(
+    r"""('(?:[^'\\]|\\.|'')*'|"(?:[^"]|"")*")|(?:\s|--[^\n]*|/\*.*?\*/)+""",
+    re.DOTALL
+)
+
+
+def _normalize_sql(sql: str) -> str:
+    """Canonicalize SQL text for use as a cache key."""
+    return _SQL_NORMALIZE_RE.sub(lambda m: m.group(1) or " ", sql).strip()
+
+
+# Fully qualified table name: exactly three dot-separated identifiers
+_FQTN_RE = re.compile(rf"\A({IDENTIFIER_PATTERN})\.({IDENTIFIER_PATTERN})\.({IDENTIFIER_PATTERN})\Z")
+
+_COLUMN_RE = re.compile(rf"\A{IDENTIFIER_PATTERN}\Z")
+
+
+@lru_cache(maxsize=1024)
+def _validate_fqtn(table_name: str, operation: str, label: str = "Table name") -> None:
+    """Raise a DMLException unless table_name is 'database.schema.table'.
+    
+    Only valid names are cached, so the handful of tables a server works
+    with are checked once each.
+    """
+    if not _FQTN_RE.match(table_name):
+        raise DMLException(f"{label} must be fully qualified as 'database.schema.table'", operation, table_name)
+
+
+@lru_cache(maxsize=1024)
+def _valid_column(name: str) -> bool:
+    """Return whether name is a single column identifier."""
+    return _COLUMN_RE.match(name) is not None
+
+
+def _validate_columns(columns: Sequence[str], operation: str, table_name: str) -> None:
+    """Raise a DMLException unless every column name is a valid identifier."""
+    for column in columns:
+        if not isinstance(column, str) or not _valid_column(column):
+            raise DMLException(f"Invalid column name: {column}", operation, table_name)
+
+
+def _check_shared_statement(dml: str) -> None:
+    """Raise a DMLException if dml would change the shared session."""
+    if is_session_statement(dml):
+        raise DMLException(
+            "Transaction and session statements (BEGIN, COMMIT, USE, ALTER SESSION, ...) are not allowed on the shared connection; use fully qualified names or connection parameters instead",
+            "EXECUTE",
+            dml
+        )
+
+
+def clear_query_cache() -> None:
+    """Drop all cached read-only query results."""
+    QUERY_CACHE.clear()
+
+
+def invalidate_query_cache(sql: str) -> None:
+    """Drop cached query results unless sql is a read-only statement.
+    
+    Called by every manager after it runs caller-supplied SQL, so writes,
+    DDL and USE statements issued through any path keep QUERY_CACHE coherent.
+    """
+    if not _normalize_sql(sql).upper().startswith(_READ_ONLY_PREFIXES):
+        QUERY_CACHE.clear()
+
+
+@lru_cache(maxsize=128)
+def _placeholders(count: int) -> str:
+    """Return a comma-separated list of ``count`` bind placeholders."""
+    return ", ".join(["%s"] * count)
+
+
+def _assignments(columns: Sequence[str], separator: str = ", ") -> str:
+    """Return ``col = %s`` bind assignments for columns joined by separator."""
+    return separator.join([f"{col} = %s" for col in columns])
+
+
+def _select_sql(
+    table_name: str,
+    columns: Optional[List[str]],
+    where_clause: Optional[str],
+    order_by: Optional[List[str]],
+    limit: Optional[int],
+    offset: Optional[int]
+) -> str:
+    """Build the SELECT statement shared by select_data and select_data_batches."""
+    # Validate table name format
+    _validate_fqtn(table_name, "SELECT")
+    
+    cols = "*" if not columns else ", ".join(columns)
+    dml = f"SELECT {cols} FROM {table_name}"
+    
+    if where_clause:
+        dml += f" WHERE {where_clause}"
+        
+    if order_by:
+        dml += f" ORDER BY {', '.join(order_by)}"
+        
+    if limit is not None:
+        dml += f" LIMIT {limit}"
+        
+    if offset is not None:
+        dml += f" OFFSET {offset}"
+        
+    return dml
+
+
+def _escape_pyformat(fragment: str) -> str:
+    """Escape literal percent signs in a caller-supplied SQL fragment.
+    
+    Statements executed with bound parameters are interpolated by the
+    connector using pyformat, so any ``%`` in raw SQL must be doubled.
+    """
+    return fragment.replace("%", "%%")
+
+
 class DMLManager:
     """A class to manage DML operations in Snowflake."""
     
@@ -23,7 +186,10 @@ class DMLManager:
         password: Optional[str] = None,
         **kwargs
     ):
-        """Initialize the DML manager with a fresh Snowflake connection.
+        """Initialize the DML manager with the credentials to connect with.
+        
+        The connection itself is fetched lazily from the process-wide pool
+        the first time a statement is executed.
         
         Args:
             account_identifier: Snowflake account identifier (optional, can use env vars)
@@ -31,46 +197,96 @@ class DMLManager:
             password: Snowflake password or PAT (optional, can use env vars)
             **kwargs: Additional connection parameters
         """
+        self._connection_params = dict(
+            account_identifier=account_identifier,
+            username=username,
+            password=password,
+            **kwargs
+        )
+        # Cached results are only shared between managers using the same credentials
+        self._cache_scope = credentials_key(self._connection_params)
+        
+    @property
+    def connection(self):
+        """The pooled Snowflake connection for this manager's credentials."""
         try:
-            # Get a fresh connection using the simple utility
-            self.connection = get_snowflake_connection(
-                account_identifier=account_identifier,
-                username=username,
-                password=password,
-                **kwargs
-            )
+            return get_snowflake_connection(**self._connection_params)
         except Exception as e:
             raise DMLException(f"Failed to establish connection: {str(e)}", "CONNECTION", "")
         
-    def execute_dml(self, dml: str) -> Dict[str, Union[bool, str, List[str], int]]:
+    def execute_dml(
+        self,
+        dml: str,
+        params: Optional[Sequence[DMLValue]] = None,
+        max_rows: Optional[int] = None,
+        cache: bool = False
+    ) -> DMLResult:
         """Execute a DML statement and return the result.
         
+        Result rows are read in chunks of FETCH_BATCH_SIZE and returned as
+        dicts keyed by column name. With cache set, a read-only statement
+        (SELECT, SHOW, DESCRIBE) that calls no volatile function is served
+        from QUERY_CACHE while fresh; any statement that is not read-only
+        clears the cache once it has run.
+        
         Args:
             dml: The DML statement to execute
+            params: Optional values bound to the statement's ``%s`` placeholders
+            max_rows: Optional cap on the number of result rows read
+            cache: Whether a read-only result may be served from and stored in QUERY_CACHE
             
         Returns:
             Dict containing:
                 - success: Boolean indicating if the operation was successful
                 - message: Status message
-                - results: List of results if any were returned
+                - results: List of result rows (column name -> value) if any were returned
                 - rows_affected: Number of rows affected by the operation
         """
+        _check_shared_statement(dml)
+        normalized = _normalize_sql(dml)
+        read_only = normalized.upper().startswith(_READ_ONLY_PREFIXES)
+        cacheable = cache and read_only and not _VOLATILE_RE.search(normalized)
+        if cacheable:
+            cache_key = (self._cache_scope, normalized, tuple(params) if params else None, max_rows)
+            generation = QUERY_CACHE.generation
+            cached = QUERY_CACHE.get(cache_key)
+            if cached is not None:
+                return dict(cached, results=list(cached["results"]))
+            
+        connection = self.connection
         try:
-            cursor = self.connection.cursor()
-            cursor.execute(dml)
-            results = cursor.fetchall()
+            cursor = connection.cursor(get_dict_cursor_class())
+            cursor.arraysize = FETCH_BATCH_SIZE
+            cursor.execute(dml, params)
+            
+            # Statements without a result set have no description - skip the fetch
+            results = []
+            if cursor.description is not None:
+                while chunk := cursor.fetchmany(FETCH_BATCH_SIZE):
+                    results.extend(chunk)
+                    if max_rows is not None and len(results) >= max_rows:
+                        del results[max_rows:]
+                        break
             rows_affected = cursor.rowcount
             
-            return {
+            response = {
                 "success": True,
                 "message": "DML operation executed successfully",
-                "results": [str(row) for row in results] if results else [],
+                "results": results,
                 "rows_affected": rows_affected
             }
             
         except Exception as e:
             raise DMLException(f"Error executing DML: {str(e)}", "EXECUTE", dml)
+        finally:
+            # Cleared after the write, so reads in flight cannot re-cache older rows
+            if not read_only:
+                QUERY_CACHE.clear()
             
+        if cacheable:
+            QUERY_CACHE.set(cache_key, dict(response, results=list(results)), generation)
+        return response
+        
     def select_data(
         self,
         table_name: str,
@@ -79,7 +295,7 @@ class DMLManager:
         order_by: Optional[List[str]] = None,
         limit: Optional[int] = None,
         offset: Optional[int] = None
-    ) -> Dict[str, Union[bool, str, List[str], int]]:
+    ) -> DMLResult:
         """Select data from a table.
         
         Args:
@@ -93,36 +309,70 @@ class DMLManager:
         Returns:
             Dict containing operation status
         """
-        # Validate table name format
-        parts = table_name.split('.')
-        if len(parts) != 3:
-            raise DMLException("Table name must be fully qualified as 'database.schema.table'", "SELECT", table_name)
-            
-        cols = "*" if not columns else ", ".join(columns)
-        dml = f"SELECT {cols} FROM {table_name}"
+        return self.execute_dml(_select_sql(table_name, columns, where_clause, order_by, limit, offset), cache=True)
         
-        if where_clause:
-            dml += f" WHERE {where_clause}"
-            
-        if order_by:
-            dml += f" ORDER BY {', '.join(order_by)}"
-            
-        if limit is not None:
-            dml += f" LIMIT {limit}"
+    def select_data_batches(
+        self,
+        table_name: str,
+        columns: Optional[List[str]] = None,
+        where_clause: Optional[str] = None,
+        order_by: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """Select data from a table, yielding rows in batches as they are fetched.
+        
+        Unlike select_data, the result set is never held in memory as a
+        whole: each batch of up to FETCH_BATCH_SIZE rows is read from the
+        cursor only when the previous one has been consumed. Results are
+        not cached.
+        
+        Args:
+            table_name: Fully qualified table name (database.schema.table)
+            columns: Optional list of columns to select
+            where_clause: Optional WHERE clause
+            order_by: Optional list of columns to order by
+            limit: Optional number of rows to return
+            offset: Optional number of rows to skip
             
-        if offset is not None:
-            dml += f" OFFSET {offset}"
+        Yields:
+            Lists of result rows (column name -> value)
+        """
+        dml = _select_sql(table_name, columns, where_clause, order_by, limit, offset)
+        
+        connection = self.connection
+        try:
+            cursor = connection.cursor(get_dict_cursor_class())
+            cursor.arraysize = FETCH_BATCH_SIZE
+            cursor.execute(dml)
+        except Exception as e:
+            raise DMLException(f"Error executing DML: {str(e)}", "SELECT", dml)
             
-        return self.execute_dml(dml)
+        try:
+            while True:
+                try:
+                    batch = cursor.fetchmany(FETCH_BATCH_SIZE)
+                except Exception as e:
+                    raise DMLException(f"Error fetching results: {str(e)}", "SELECT", dml)
+                if not batch:
+                    return
+                yield batch
+        finally:
+            cursor.close()
         
     def insert_data(
         self,
         table_name: str,
         columns: List[str],
-        values: List[Union[str, int, float, bool, None]]
-    ) -> Dict[str, Union[bool, str, List[str], int]]:
+        values: List[Union[DMLValue, list, dict]]
+    ) -> DMLResult:
         """Insert data into a table.
         
+        Scalar values are bound directly. When any value is a list or dict,
+        all such values are shipped as one JSON array and expanded on the
+        server with ``PARSE_JSON``, so they arrive as semi-structured data
+        rather than as JSON text.
+        
         Args:
             table_name: Fully qualified table name (database.schema.table)
             columns: List of column names
@@ -132,38 +382,44 @@ class DMLManager:
             Dict containing operation status
         """
         # Validate table name format
-        parts = table_name.split('.')
-        if len(parts) != 3:
-            raise DMLException("Table name must be fully qualified as 'database.schema.table'", "INSERT", table_name)
+        _validate_fqtn(table_name, "INSERT")
+        _validate_columns(columns, "INSERT", table_name)
             
         if len(columns) != len(values):
             raise DMLException("Number of columns does not match number of values", "INSERT", table_name)
             
-        # Format values properly based on type
-        formatted_values = []
-        for val in values:
-            if val is None:
-                formatted_values.append("NULL")
-            elif isinstance(val, (int, float)):
-                formatted_values.append(str(val))
-            elif isinstance(val, bool):
-                formatted_values.append("TRUE" if val else "FALSE")
+        if not any(isinstance(value, (list, dict)) for value in values):
+            # Bind values natively instead of formatting them into the SQL
+            dml = f"INSERT INTO {table_name} ({', '.join(columns)}) VALUES ({_placeholders(len(values))})"
+            return self.execute_dml(dml, values)
+            
+        # Complex values are read from one bound JSON array, scalars are bound in place
+        expressions = []
+        params = []
+        payload = []
+        for value in values:
+            if isinstance(value, (list, dict)):
+                expressions.append(f"v[{len(payload)}]")
+                payload.append(value)
             else:
-                formatted_values.append(f"'{str(val)}'")
-                
-        dml = f"""
-        INSERT INTO {table_name} ({', '.join(columns)})
-        VALUES ({', '.join(formatted_values)})
-        """
-        return self.execute_dml(dml)
+                expressions.append("%s")
+                params.append(value)
+        params.append(json.dumps(payload, default=str, separators=(",", ":")))
+        
+        dml = (
+            f"INSERT INTO {table_name} ({', '.join(columns)}) "
+            f"SELECT {', '.join(expressions)} FROM (SELECT PARSE_JSON(%s) AS v)"
+        )
+        return self.execute_dml(dml, params)
         
     def update_data(
         self,
         table_name: str,
         set_columns: List[str],
-        set_values: List[Union[str, int, float, bool, None]],
-        where_clause: str
-    ) -> Dict[str, Union[bool, str, List[str], int]]:
+        set_values: List[DMLValue],
+        where_clause: str,
+        where_params: Optional[Sequence[DMLValue]] = None
+    ) -> DMLResult:
         """Update data in a table.
         
         Args:
@@ -171,73 +427,66 @@ class DMLManager:
             set_columns: List of column names to update
             set_values: List of new values
             where_clause: WHERE clause to identify rows to update
+            where_params: Optional values bound to ``%s`` placeholders in where_clause;
+                without them any ``%`` in where_clause is taken literally
             
         Returns:
             Dict containing operation status
         """
         # Validate table name format
-        parts = table_name.split('.')
-        if len(parts) != 3:
-            raise DMLException("Table name must be fully qualified as 'database.schema.table'", "UPDATE", table_name)
+        _validate_fqtn(table_name, "UPDATE")
             
         if len(set_columns) != len(set_values):
             raise DMLException("Number of columns does not match number of values", "UPDATE", table_name)
             
-        # Format values properly based on type
-        set_clauses = []
-        for col, val in zip(set_columns, set_values):
-            if val is None:
-                set_clauses.append(f"{col} = NULL")
-            elif isinstance(val, (int, float)):
-                set_clauses.append(f"{col} = {str(val)}")
-            elif isinstance(val, bool):
-                set_clauses.append(f"{col} = {'TRUE' if val else 'FALSE'}")
-            else:
-                set_clauses.append(f"{col} = '{str(val)}'")
-                
-        dml = f"""
-        UPDATE {table_name}
-        SET {', '.join(set_clauses)}
-        WHERE {where_clause}
-        """
-        return self.execute_dml(dml)
+        if not set_columns:
+            raise DMLException("At least one column is required for UPDATE operations", "UPDATE", table_name)
+            
+        _validate_columns(set_columns, "UPDATE", table_name)
+            
+        # Bind values natively instead of formatting them into the SQL
+        if where_params:
+            where_sql = where_clause
+            params = [*set_values, *where_params]
+        else:
+            where_sql = _escape_pyformat(where_clause)
+            params = set_values
+        dml = f"UPDATE {table_name} SET {_assignments(set_columns)} WHERE {where_sql}"
+        return self.execute_dml(dml, params)
         
     def delete_data(
         self,
         table_name: str,
-        where_clause: str
-    ) -> Dict[str, Union[bool, str, List[str], int]]:
+        where_clause: str,
+        where_params: Optional[Sequence[DMLValue]] = None
+    ) -> DMLResult:
         """Delete data from a table.
         
         Args:
             table_name: Fully qualified table name (database.schema.table)
             where_clause: WHERE clause to identify rows to delete
+            where_params: Optional values bound to ``%s`` placeholders in where_clause
             
         Returns:
             Dict containing operation status
         """
         # Validate table name format
-        parts = table_name.split('.')
-        if len(parts) != 3:
-            raise DMLException("Table name must be fully qualified as 'database.schema.table'", "DELETE", table_name)
+        _validate_fqtn(table_name, "DELETE")
             
-        if not where_clause or where_clause.strip() == "":
+        if not where_clause or where_clause.isspace():
             raise DMLException("WHERE clause is required for DELETE operations to prevent accidental data loss", "DELETE", table_name)
             
-        dml = f"""
-        DELETE FROM {table_name}
-        WHERE {where_clause}
-        """
-        return self.execute_dml(dml)
+        dml = f"DELETE FROM {table_name} WHERE {where_clause}"
+        return self.execute_dml(dml, where_params or None)
         
     def merge_data(
         self,
         target_table: str,
         source_table: str,
         merge_condition: str,
-        match_actions: List[Dict[str, Union[str, List[str], List[Union[str, int, float, bool, None]]]]],
-        not_match_actions: Optional[List[Dict[str, Union[str, List[str], List[Union[str, int, float, bool, None]]]]]] = None
-    ) -> Dict[str, Union[bool, str, List[str], int]]:
+        match_actions: List[MergeAction],
+        not_match_actions: Optional[List[MergeAction]] = None
+    ) -> DMLResult:
         """Perform a MERGE operation.
         
         Args:
@@ -251,15 +500,10 @@ class DMLManager:
             Dict containing operation status
         """
         # Validate target table name format
-        parts = target_table.split('.')
-        if len(parts) != 3:
-            raise DMLException("Target table name must be fully qualified as 'database.schema.table'", "MERGE", target_table)
-            
-        dml = f"""
-        MERGE INTO {target_table} AS target
-        USING {source_table} AS source
-        ON {merge_condition}
-        """
+        _validate_fqtn(target_table, "MERGE", "Target table name")
+            
+        clauses = []
+        params = []
         
         # Add WHEN MATCHED clauses
         for action in match_actions:
@@ -269,23 +513,14 @@ class DMLManager:
                 values = action["values"]
                 if len(columns) != len(values):
                     raise DMLException("Number of columns does not match number of values in WHEN MATCHED UPDATE action", "MERGE", target_table)
+                _validate_columns(columns, "MERGE", target_table)
                     
-                # Format values properly based on type
-                set_clauses = []
-                for col, val in zip(columns, values):
-                    if val is None:
-                        set_clauses.append(f"{col} = NULL")
-                    elif isinstance(val, (int, float)):
-                        set_clauses.append(f"{col} = {str(val)}")
-                    elif isinstance(val, bool):
-                        set_clauses.append(f"{col} = {'TRUE' if val else 'FALSE'}")
-                    else:
-                        set_clauses.append(f"{col} = '{str(val)}'")
-                        
-                dml += f"\nWHEN MATCHED THEN UPDATE SET {', '.join(set_clauses)}"
+                # Bind values natively instead of formatting them into the SQL
+                params.extend(values)
+                clauses.append(f"WHEN MATCHED THEN UPDATE SET {_assignments(columns)}")
                 
             elif action_type == "DELETE":
-                dml += "\nWHEN MATCHED THEN DELETE"
+                clauses.append("WHEN MATCHED THEN DELETE")
                 
         # Add WHEN NOT MATCHED clauses
         if not_match_actions:
@@ -296,19 +531,439 @@ class DMLManager:
                     values = action["values"]
                     if len(columns) != len(values):
                         raise DMLException("Number of columns does not match number of values in WHEN NOT MATCHED INSERT action", "MERGE", target_table)
+                    _validate_columns(columns, "MERGE", target_table)
                         
-                    # Format values properly based on type
-                    formatted_values = []
-                    for val in values:
-                        if val is None:
-                            formatted_values.append("NULL")
-                        elif isinstance(val, (int, float)):
-                            formatted_values.append(str(val))
-                        elif isinstance(val, bool):
-                            formatted_values.append("TRUE" if val else "FALSE")
-                        else:
-                            formatted_values.append(f"'{str(val)}'")
-                            
-                    dml += f"\nWHEN NOT MATCHED THEN INSERT ({', '.join(columns)}) VALUES ({', '.join(formatted_values)})"
+                    # Bind values natively instead of formatting them into the SQL
+                    params.extend(values)
+                    clauses.append(f"WHEN NOT MATCHED THEN INSERT ({', '.join(columns)}) VALUES ({_placeholders(len(values))})")
                     
-        return self.execute_dml(dml)
\ No newline at end of file
+        # Raw SQL fragments are only interpolated when values are bound
+        if params:
+            source_table = _escape_pyformat(source_table)
+            merge_condition = _escape_pyformat(merge_condition)
+            
+        dml = "\n".join([
+            f"MERGE INTO {target_table} AS target",
+            f"USING {source_table} AS source",
+            f"ON {merge_condition}",
+            *clauses
+        ])
+        
+        return self.execute_dml(dml, params or None)
+        
+    def _execute_batch(
+        self,
+        operation: str,
+        table_name: str,
+        statements: List[tuple]
+    ) -> DMLResult:
+        """Execute batched statements in a single transaction.
+        
+        The transaction runs on a connection checked out for this batch
+        alone, so concurrent operations on the shared pooled connection
+        neither join it nor commit or roll it back.
+        
+        Args:
+            operation: Operation name used in error context (INSERT, UPDATE, ...)
+            table_name: Table the batch targets, used in error context
+            statements: List of (sql, params, executemany, first_row) tuples
+            
+        Returns:
+            Dict containing operation status
+        """
+        rows_affected = 0
+        first_row = 0
+        try:
+            # The transaction runs on a connection no other call can use until it ends
+            with transaction_connection(**self._connection_params) as connection:
+                cursor = connection.cursor()
+                try:
+                    cursor.execute("BEGIN")
+                    for sql, params, many, first_row in statements:
+                        if many:
+                            cursor.executemany(sql, params)
+                        else:
+                            cursor.execute(sql, params)
+                        rows_affected += cursor.rowcount or 0
+                    cursor.execute("COMMIT")
+                except Exception:
+                    try:
+                        cursor.execute("ROLLBACK")
+                    except Exception:
+                        pass
+                    raise
+        except Exception as e:
+            raise DMLException(
+                f"Error executing batch {operation} (batch starting at row {first_row}, "
+                f"{rows_affected} rows applied before failure were rolled back): {str(e)}",
+                operation,
+                table_name
+            )
+        finally:
+            QUERY_CACHE.clear()
+            
+        return {
+            "success": True,
+            "message": f"Batch {operation} executed successfully",
+            "results": [],
+            "rows_affected": rows_affected
+        }
+        
+    def bulk_insert(
+        self,
+        table_name: str,
+        columns: List[str],
+        rows: List[List[DMLValue]],
+        batch_size: int = MAX_BATCH_SIZE
+    ) -> DMLResult:
+        """Insert many rows into a table with bound parameters.
+        
+        Each batch of at most ``batch_size`` rows is passed to one
+        ``executemany`` call on a single-row INSERT template. With the
+        connector's default pyformat paramstyle this is rewritten client-side
+        into one multi-row ``INSERT ... VALUES`` statement with the values
+        escaped and inlined, so each batch costs one round trip; there is no
+        server-side array bind. Large loads should go through bulk_load
+        instead. All batches run inside one transaction.
+        
+        Args:
+            table_name: Fully qualified table name (database.schema.table)
+            columns: List of column names
+            rows: List of rows, each a list of values in column order
+            batch_size: Maximum number of rows per executemany call, capped
+                at MAX_BATCH_SIZE to bound the size of each INSERT's text
+            
+        Returns:
+            Dict containing operation status
+        """
+        # Validate table name format
+        _validate_fqtn(table_name, "INSERT")
+            
+        if not rows:
+            raise DMLException("At least one row is required for bulk insert", "INSERT", table_name)
+            
+        _validate_columns(columns, "INSERT", table_name)
+            
+        if batch_size < 1:
+            raise DMLException("Batch size must be at least 1", "INSERT", table_name)
+        batch_size = min(batch_size, MAX_BATCH_SIZE)
+            
+        for i, row in enumerate(rows):
+            if len(row) != len(columns):
+                raise DMLException(f"Number of columns does not match number of values in row {i}", "INSERT", table_name)
+                
+        dml = f"INSERT INTO {table_name} ({', '.join(columns)}) VALUES ({_placeholders(len(columns))})"
+        
+        statements = [
+            (dml, rows[start:start + batch_size], True, start)
+            for start in range(0, len(rows), batch_size)
+        ]
+        return self._execute_batch("INSERT", table_name, statements)
+        
+    def bulk_load(
+        self,
+        table_name: str,
+        columns: List[str],
+        rows: List[List[DMLValue]]
+    ) -> DMLResult:
+        """Load many rows into a table through its stage with PUT and COPY INTO.
+        
+        The rows are written to a gzip-compressed CSV file, uploaded to the
+        table's stage and loaded with a single COPY INTO, which scales far
+        beyond what fits into INSERT statement text. The staged file is
+        purged once loaded.
+        
+        Args:
+            table_name: Fully qualified table name (database.schema.table)
+            columns: List of column names
+            rows: List of rows, each a list of values in column order
+            
+        Returns:
+            Dict containing operation status
+        """
+        # Validate table name format
+        _validate_fqtn(table_name, "COPY")
+            
+        if not rows:
+            raise DMLException("At least one row is required for bulk load", "COPY", table_name)
+            
+        _validate_columns(columns, "COPY", table_name)
+            
+        for i, row in enumerate(rows):
+            if len(row) != len(columns):
+                raise DMLException(f"Number of columns does not match number of values in row {i}", "COPY", table_name)
+                
+        database, schema, table = _FQTN_RE.match(table_name).groups()
+        stage = f"@{database}.{schema}.%{table}"
+        
+        connection = self.connection
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / f"bulk_load_{uuid.uuid4().hex}.csv.gz"
+            with gzip.open(path, "wt", newline="", encoding="utf-8") as handle:
+                writer = csv.writer(handle, lineterminator="\n")
+                writer.writerows(
+                    [_CSV_NULL if value is None else value for value in row]
+                    for row in rows
+                )
+                
+            try:
+                cursor = connection.cursor(get_dict_cursor_class())
+                cursor.execute(f"PUT '{path.as_uri()}' {stage} PARALLEL=8 AUTO_COMPRESS=FALSE")
+                cursor.execute(
+                    f"COPY INTO {table_name} ({', '.join(columns)}) FROM {stage} "
+                    f"FILES = ('{path.name}') "
+                    f"FILE_FORMAT = (TYPE = CSV COMPRESSION = GZIP FIELD_OPTIONALLY_ENCLOSED_BY = '\"' "
+                    f"NULL_IF = ('\\\\N') EMPTY_FIELD_AS_NULL = FALSE) "
+                    f"PURGE = TRUE"
+                )
+                results = cursor.fetchall()
+            except Exception as e:
+                raise DMLException(f"Error executing bulk load: {str(e)}", "COPY", table_name)
+            finally:
+                QUERY_CACHE.clear()
+                
+        return {
+            "success": True,
+            "message": "Bulk load executed successfully",
+            "results": results,
+            "rows_affected": sum(result.get("rows_loaded") or 0 for result in results)
+        }
+        
+    def bulk_update(
+        self,
+        table_name: str,
+        set_columns: List[str],
+        key_columns: List[str],
+        rows: List[List[DMLValue]]
+    ) -> DMLResult:
+        """Update many rows in a table with bound parameters.
+        
+        Each row holds the new values for ``set_columns`` followed by the
+        values of ``key_columns`` identifying the row to update.
+        
+        Args:
+            table_name: Fully qualified table name (database.schema.table)
+            set_columns: List of column names to update
+            key_columns: List of column names matched with equality in the WHERE clause
+            rows: List of rows, each set values followed by key values
+            
+        Returns:
+            Dict containing operation status
+        """
+        # Validate table name format
+        _validate_fqtn(table_name, "UPDATE")
+            
+        if not set_columns or not key_columns:
+            raise DMLException("Both set columns and key columns are required for bulk update", "UPDATE", table_name)
+            
+        if not rows:
+            raise DMLException("At least one row is required for bulk update", "UPDATE", table_name)
+            
+        _validate_columns(set_columns, "UPDATE", table_name)
+        _validate_columns(key_columns, "UPDATE", table_name)
+            
+        width = len(set_columns) + len(key_columns)
+        for i, row in enumerate(rows):
+            if len(row) != width:
+                raise DMLException(f"Number of columns does not match number of values in row {i}", "UPDATE", table_name)
+                
+        dml = f"UPDATE {table_name} SET {_assignments(set_columns)} WHERE {_assignments(key_columns, ' AND ')}"
+        
+        statements = [
+            (dml, rows[start:start + MAX_BATCH_SIZE], True, start)
+            for start in range(0, len(rows), MAX_BATCH_SIZE)
+        ]
+        return self._execute_batch("UPDATE", table_name, statements)
+        
+    def bulk_delete(
+        self,
+        table_name: str,
+        key_columns: List[str],
+        rows: List[List[DMLValue]]
+    ) -> DMLResult:
+        """Delete many rows from a table with bound parameters.
+        
+        Args:
+            table_name: Fully qualified table name (database.schema.table)
+            key_columns: List of column names matched with equality in the WHERE clause
+            rows: List of rows, each the key values identifying a row to delete
+            
+        Returns:
+            Dict containing operation status
+        """
+        # Validate table name format
+        _validate_fqtn(table_name, "DELETE")
+            
+        if not key_columns:
+            raise DMLException("Key columns are required for bulk delete to prevent accidental data loss", "DELETE", table_name)
+            
+        if not rows:
+            raise DMLException("At least one row is required for bulk delete", "DELETE", table_name)
+            
+        _validate_columns(key_columns, "DELETE", table_name)
+            
+        for i, row in enumerate(rows):
+            if len(row) != len(key_columns):
+                raise DMLException(f"Number of key columns does not match number of values in row {i}", "DELETE", table_name)
+                
+        dml = f"DELETE FROM {table_name} WHERE {_assignments(key_columns, ' AND ')}"
+        
+        statements = [
+            (dml, rows[start:start + MAX_BATCH_SIZE], True, start)
+            for start in range(0, len(rows), MAX_BATCH_SIZE)
+        ]
+        return self._execute_batch("DELETE", table_name, statements)
+        
+    def bulk_merge(
+        self,
+        target_table: str,
+        columns: List[str],
+        key_columns: List[str],
+        rows: List[List[DMLValue]]
+    ) -> DMLResult:
+        """Upsert many rows with one MERGE per batch.
+        
+        The rows are bound into an inline VALUES table used as the MERGE
+        source; rows matching on ``key_columns`` are updated and the rest
+        are inserted.
+        
+        Args:
+            target_table: Fully qualified target table name (database.schema.table)
+            columns: List of column names, in row order
+            key_columns: Subset of ``columns`` used to match source and target rows
+            rows: List of rows, each a list of values in column order
+            
+        Returns:
+            Dict containing operation status
+        """
+        # Validate target table name format
+        _validate_fqtn(target_table, "MERGE", "Target table name")
+            
+        if not key_columns or any(col not in columns for col in key_columns):
+            raise DMLException("Key columns must be a non-empty subset of the merged columns", "MERGE", target_table)
+            
+        if not rows:
+            raise DMLException("At least one row is required for bulk merge", "MERGE", target_table)
+            
+        _validate_columns(columns, "MERGE", target_table)
+            
+        for i, row in enumerate(rows):
+            if len(row) != len(columns):
+                raise DMLException(f"Number of columns does not match number of values in row {i}", "MERGE", target_table)
+                
+        row_placeholder = f"({_placeholders(len(columns))})"
+        on_clause = " AND ".join(f"target.{col} = source.{col}" for col in key_columns)
+        update_columns = [col for col in columns if col not in key_columns]
+        insert_columns = ", ".join(columns)
+        insert_values = ", ".join(f"source.{col}" for col in columns)
+        
+        statements = []
+        for start in range(0, len(rows), MAX_BATCH_SIZE):
+            batch = rows[start:start + MAX_BATCH_SIZE]
+            dml = (
+                f"MERGE INTO {target_table} AS target "
+                f"USING (SELECT * FROM VALUES {', '.join([row_placeholder] * len(batch))}) "
+                f"AS source ({insert_columns}) "
+                f"ON {on_clause}"
+            )
+            if update_columns:
+                set_clause = ", ".join(f"target.{col} = source.{col}" for col in update_columns)
+                dml += f" WHEN MATCHED THEN UPDATE SET {set_clause}"
+            dml += f" WHEN NOT MATCHED THEN INSERT ({insert_columns}) VALUES ({insert_values})"
+            
+            params = [val for row in batch for val in row]
+            statements.append((dml, params, False, start))
+            
+        return self._execute_batch("MERGE", target_table, statements)
+        
+    # Async variants. The Snowflake connector is synchronous, so these run the
+    # blocking call in a worker thread via asyncio.to_thread rather than
+    # stalling the event loop for the round-trip.
+    
+    async def execute_dml_async(self, *args, **kwargs) -> DMLResult:
+        """Async variant of execute_dml; accepts the same arguments."""
+        return await asyncio.to_thread(self.execute_dml, *args, **kwargs)
+        
+    async def select_data_async(self, *args, **kwargs) -> DMLResult:
+        """Async variant of select_data; accepts the same arguments."""
+        return await asyncio.to_thread(self.select_data, *args, **kwargs)
+        
+    async def select_data_batches_async(self, *args, **kwargs) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Async variant of select_data_batches; accepts the same arguments.
+        
+        Each batch is fetched in a worker thread, so the event loop is free
+        while the next batch is read from the server.
+        """
+        batches = self.select_data_batches(*args, **kwargs)
+        try:
+            while (batch := await asyncio.to_thread(next, batches, None)) is not None:
+                yield batch
+        finally:
+            batches.close()
+        
+    async def insert_data_async(self, *args, **kwargs) -> DMLResult:
+        """Async variant of insert_data; accepts the same arguments."""
+        return await asyncio.to_thread(self.insert_data, *args, **kwargs)
+        
+    async def update_data_async(self, *args, **kwargs) -> DMLResult:
+        """Async variant of update_data; accepts the same arguments."""
+        return await asyncio.to_thread(self.update_data, *args, **kwargs)
+        
+    async def delete_data_async(self, *args, **kwargs) -> DMLResult:
+        """Async variant of delete_data; accepts the same arguments."""
+        return await asyncio.to_thread(self.delete_data, *args, **kwargs)
+        
+    async def merge_data_async(self, *args, **kwargs) -> DMLResult:
+        """Async variant of merge_data; accepts the same arguments."""
+        return await asyncio.to_thread(self.merge_data, *args, **kwargs)
+        
+    async def bulk_insert_async(self, *args, **kwargs) -> DMLResult:
+        """Async variant of bulk_insert; accepts the same arguments."""
+        return await asyncio.to_thread(self.bulk_insert, *args, **kwargs)
+        
+    async def bulk_load_async(self, *args, **kwargs) -> DMLResult:
+        """Async variant of bulk_load; accepts the same arguments."""
+        return await asyncio.to_thread(self.bulk_load, *args, **kwargs)
+        
+    async def bulk_update_async(self, *args, **kwargs) -> DMLResult:
+        """Async variant of bulk_update; accepts the same arguments."""
+        return await asyncio.to_thread(self.bulk_update, *args, **kwargs)
+        
+    async def bulk_delete_async(self, *args, **kwargs) -> DMLResult:
+        """Async variant of bulk_delete; accepts the same arguments."""
+        return await asyncio.to_thread(self.bulk_delete, *args, **kwargs)
+        
+    async def bulk_merge_async(self, *args, **kwargs) -> DMLResult:
+        """Async variant of bulk_merge; accepts the same arguments."""
+        return await asyncio.to_thread(self.bulk_merge, *args, **kwargs)
+
+
+# Shared DMLManager instances, one per credential set
+_INSTANCES: Dict[tuple, DMLManager] = {}
+_INSTANCES_LOCK = threading.Lock()
+
+
+def get_dml_manager(
+    account_identifier: Optional[str] = None,
+    username: Optional[str] = None,
+    password: Optional[str] = None,
+    **kwargs
+) -> DMLManager:
+    """Return the shared DMLManager for the given credentials, creating it on first use.
+    
+    Args:
+        account_identifier: Snowflake account identifier (optional, can use env vars)
+        username: Snowflake username (optional, can use env vars)
+        password: Snowflake password or PAT (optional, can use env vars)
+        **kwargs: Additional connection parameters
+        
+    Returns:
+        DMLManager instance shared by all callers using the same credentials
+    """
+    params = dict(account_identifier=account_identifier, username=username, password=password, **kwargs)
+    key = credentials_key(params)
+    with _INSTANCES_LOCK:
+        manager = _INSTANCES.get(key)
+        if manager is None:
+            manager = _INSTANCES[key] = DMLManager(**params)
+        return manager
@@ -2,15 +2,47 @@
 Operations Manager for Snowflake MCP Server
 
 This module provides an OperationsManager class that encapsulates Snowflake operations,
-following the simple connection pattern from the reference implementation.
+using connections from the process-wide pool in snowflake_utils.
 
-The OperationsManager creates fresh connections for each instance, eliminating
-the need for complex connection pooling or persistence.
+Each operation also has an ``*_async`` variant that runs the blocking
+driver call in a worker thread for use from async tool handlers.
 """
 
-from typing import Dict, List, Optional, Union
-from ..core.snowflake_utils import get_snowflake_connection
+import asyncio
+import threading
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Union
+from ..core.snowflake_utils import OBJECT_NAME_RE, credentials_key, get_snowflake_connection, is_session_statement, use_session_context
 from ..core.exceptions import OperationsException
+from .dml_manager import invalidate_query_cache
+
+
+# Statement templates for the privilege operations
+_GRANT_SQL = "GRANT {privileges} ON {on_type} {on_name} TO {to_type} {to_name}"
+_REVOKE_SQL = "REVOKE {privileges} ON {on_type} {on_name} FROM {from_type} {from_name}"
+
+
+@lru_cache(maxsize=256)
+def _identifier(name: str, operation: str) -> str:
+    """Validate an object name for interpolation into SQL, returning it stripped.
+    
+    Snowflake cannot bind object names in GRANT and REVOKE, so names are
+    checked instead; each is validated once and then served from the cache.
+    """
+    stripped = name.strip()
+    if not OBJECT_NAME_RE.match(stripped):
+        raise OperationsException(f"Invalid object name: {name}", operation, name)
+    return stripped
+
+
+def _check_shared_statement(query: str, operation: str) -> None:
+    """Raise an OperationsException if query would change the shared session."""
+    if is_session_statement(query):
+        raise OperationsException(
+            "Transaction and session statements (BEGIN, COMMIT, USE, ALTER SESSION, ...) are not allowed on the shared connection; use fully qualified names or connection parameters instead",
+            operation,
+            query
+        )
 
 
 class OperationsManager:
@@ -23,7 +55,10 @@ class OperationsManager:
         password: Optional[str] = None,
         **kwargs
     ):
-        """Initialize the Snowflake operations manager with a fresh connection.
+        """Initialize the Snowflake operations manager with the credentials to connect with.
+        
+        The connection itself is fetched lazily from the process-wide pool
+        the first time a query is executed.
         
         Args:
             account_identifier: Snowflake account identifier (optional, can use env vars)
@@ -31,60 +66,148 @@ class OperationsManager:
             password: Snowflake password or PAT (optional, can use env vars)
             **kwargs: Additional connection parameters
         """
+        self._connection_params = dict(
+            account_identifier=account_identifier,
+            username=username,
+            password=password,
+            **kwargs
+        )
+        
+    @property
+    def connection(self):
+        """The pooled Snowflake connection for this manager's credentials."""
         try:
-            # Get a fresh connection using the simple utility
-            self.connection = get_snowflake_connection(
-                account_identifier=account_identifier,
-                username=username,
-                password=password,
-                **kwargs
-            )
+            return get_snowflake_connection(**self._connection_params)
         except Exception as e:
             raise OperationsException(f"Failed to establish connection: {str(e)}", "CONNECTION", "")
         
-    def execute_query(self, query: str) -> Dict[str, Union[bool, str, List[str]]]:
+    def execute_query(
+        self,
+        query: str,
+        max_rows: Optional[int] = None,
+        params: Optional[Sequence[Any]] = None
+    ) -> Dict[str, Union[bool, str, List[str]]]:
         """Execute a Snowflake query and return the result.
         
+        Values passed in params fill the query's %s placeholders. The
+        connector escapes and inlines them client-side (pyformat), so params
+        make values safe to pass but each distinct set of values is still a
+        distinct statement to Snowflake.
+        
         Args:
             query: The query to execute
+            params: Values for the query's %s placeholders, in order
+            max_rows: Read at most this many rows from the cursor (None reads all)
             
         Returns:
             Dict containing:
                 - success: Boolean indicating if the operation was successful
                 - message: Status message
                 - results: List of results if any were returned
+                - truncated: Whether rows beyond max_rows were left unread
         """
+        _check_shared_statement(query, "EXECUTE")
         try:
             cursor = self.connection.cursor()
-            results = cursor.execute(query).fetchall()
+            try:
+                if params is None:
+                    cursor.execute(query)
+                else:
+                    cursor.execute(query, tuple(params))
+                if max_rows is None:
+                    results = cursor.fetchall()
+                    truncated = False
+                else:
+                    # One extra row tells whether the result was cut short
+                    results = cursor.fetchmany(max_rows + 1)
+                    truncated = len(results) > max_rows
+                    del results[max_rows:]
+            finally:
+                cursor.close()
+                # Writes, DDL and USE statements make cached query results stale
+                invalidate_query_cache(query)
             
             return {
                 "success": True,
                 "message": "Query executed successfully",
-                "results": [str(row) for row in results] if results else []
+                "results": [str(row) for row in results] if results else [],
+                "truncated": truncated
             }
             
         except Exception as e:
             raise OperationsException(f"Error executing query: {str(e)}", "EXECUTE", query)
             
+    def execute_query_batch(self, queries: List[str]) -> Dict[str, Union[bool, str, List[str]]]:
+        """Execute several queries in a single Snowflake round trip.
+        
+        The queries are sent as one multi-statement request, so the batch
+        costs one network round trip rather than one per query. Statements
+        that ran before a failure stay applied.
+        
+        Args:
+            queries: The queries to execute, in order
+            
+        Returns:
+            Dict containing:
+                - success: Boolean indicating if every query succeeded
+                - message: Status message
+                - results: Results of all queries, in execution order
+        """
+        statements = [query.strip().rstrip(";") for query in queries]
+        for statement in statements:
+            _check_shared_statement(statement, "EXECUTE_BATCH")
+        batch = ";\n".join(statements)
+        cursor = self.connection.cursor()
+        results = []
+        try:
+            cursor.execute(batch, num_statements=len(statements))
+            while True:
+                results.extend(str(row) for row in cursor.fetchall())
+                if not cursor.nextset():
+                    break
+        except Exception as e:
+            raise OperationsException(f"Error executing query batch: {str(e)}", "EXECUTE_BATCH", batch)
+        finally:
+            cursor.close()
+            for statement in statements:
+                invalidate_query_cache(statement)
+        
+        return {
+            "success": True,
+            "message": f"{len(statements)} queries executed successfully",
+            "results": results
+        }
+            
     def show_objects(
         self,
         object_type: str,
-        pattern: Optional[str] = None
+        pattern: Optional[str] = None,
+        scope_type: Optional[str] = None,
+        scope_name: Optional[str] = None
     ) -> Dict[str, Union[bool, str, List[str]]]:
         """Show Snowflake objects of a specific type.
         
         Args:
             object_type: Type of objects to show (DATABASES, SCHEMAS, TABLES, etc.)
-            pattern: Optional pattern to filter objects by name
+            pattern: Optional pattern to filter objects by name, bound as a
+                parameter so it cannot end the LIKE literal
+            scope_type: Optional container to list objects in (ACCOUNT,
+                DATABASE, SCHEMA, TABLE, VIEW)
+            scope_name: Name of the container; required unless scope_type is ACCOUNT
             
         Returns:
             Dict containing operation status and results
         """
         query = f"SHOW {object_type}"
+        params = None
         if pattern:
-            query += f" LIKE '{pattern}'"
-        return self.execute_query(query)
+            query += " LIKE %s"
+            params = [pattern]
+        if scope_type:
+            query += f" IN {scope_type}"
+            if scope_name:
+                query += f" {_identifier(scope_name, 'SHOW')}"
+        return self.execute_query(query, params=params)
         
     def describe_object(self, object_name: str) -> Dict[str, Union[bool, str, List[str]]]:
         """Describe a Snowflake object.
@@ -101,6 +224,9 @@ class OperationsManager:
     def use_context(self, context_type: str, context_name: str) -> Dict[str, Union[bool, str, List[str]]]:
         """Set the current context (database, schema, warehouse, role).
         
+        USE is rejected by execute_query, so the context is set through
+        use_session_context, which keeps it across reconnects.
+        
         Args:
             context_type: Type of context to set (DATABASE, SCHEMA, WAREHOUSE, ROLE)
             context_name: Name of the context to use
@@ -108,12 +234,26 @@ class OperationsManager:
         Returns:
             Dict containing operation status
         """
+        context_name = _identifier(context_name, "USE")
         query = f"USE {context_type} {context_name}"
-        return self.execute_query(query)
+        try:
+            use_session_context(context_type, context_name, **self._connection_params)
+        except Exception as e:
+            raise OperationsException(f"Error executing query: {str(e)}", "USE", query)
+        finally:
+            # Unqualified names in cached query results now resolve differently
+            invalidate_query_cache(query)
+        
+        return {
+            "success": True,
+            "message": "Query executed successfully",
+            "results": [],
+            "truncated": False
+        }
         
     def grant_privilege(
         self,
-        privileges: Union[str, List[str]],
+        privileges: Union[str, Sequence[str]],
         on_type: str,
         on_name: str,
         to_type: str,
@@ -122,7 +262,7 @@ class OperationsManager:
         """Grant privileges to a role or user.
         
         Args:
-            privileges: Single privilege or list of privileges to grant
+            privileges: Single privilege or sequence of privileges to grant
             on_type: Type of object to grant privileges on (DATABASE, SCHEMA, TABLE, etc.)
             on_name: Name of the object to grant privileges on
             to_type: Type of grantee (ROLE, USER)
@@ -131,17 +271,20 @@ class OperationsManager:
         Returns:
             Dict containing operation status
         """
-        if isinstance(privileges, list):
-            privileges_str = ", ".join(privileges)
-        else:
-            privileges_str = privileges
+        privileges_str = privileges if isinstance(privileges, str) else ", ".join(privileges)
             
-        query = f"GRANT {privileges_str} ON {on_type} {on_name} TO {to_type} {to_name}"
+        query = _GRANT_SQL.format(
+            privileges=privileges_str,
+            on_type=on_type,
+            on_name=_identifier(on_name, "GRANT"),
+            to_type=to_type,
+            to_name=_identifier(to_name, "GRANT")
+        )
         return self.execute_query(query)
         
     def revoke_privilege(
         self,
-        privileges: Union[str, List[str]],
+        privileges: Union[str, Sequence[str]],
         on_type: str,
         on_name: str,
         from_type: str,
@@ -150,7 +293,7 @@ class OperationsManager:
         """Revoke privileges from a role or user.
         
         Args:
-            privileges: Single privilege or list of privileges to revoke
+            privileges: Single privilege or sequence of privileges to revoke
             on_type: Type of object to revoke privileges from (DATABASE, SCHEMA, TABLE, etc.)
             on_name: Name of the object to revoke privileges from
             from_type: Type of grantee (ROLE, USER)
@@ -159,12 +302,15 @@ class OperationsManager:
         Returns:
             Dict containing operation status
         """
-        if isinstance(privileges, list):
-            privileges_str = ", ".join(privileges)
-        else:
-            privileges_str = privileges
+        privileges_str = privileges if isinstance(privileges, str) else ", ".join(privileges)
             
-        query = f"REVOKE {privileges_str} ON {on_type} {on_name} FROM {from_type} {from_name}"
+        query = _REVOKE_SQL.format(
+            privileges=privileges_str,
+            on_type=on_type,
+            on_name=_identifier(on_name, "REVOKE"),
+            from_type=from_type,
+            from_name=_identifier(from_name, "REVOKE")
+        )
         return self.execute_query(query)
         
     def alter_warehouse(
@@ -220,4 +366,67 @@ class OperationsManager:
             raise OperationsException("No warehouse properties specified to alter", "ALTER_WAREHOUSE", warehouse_name)
             
         query = f"ALTER WAREHOUSE {warehouse_name} SET {', '.join(alter_clauses)}"
-        return self.execute_query(query)
\ No newline at end of file
+        return self.execute_query(query)
+        
+    async def execute_query_async(self, *args, **kwargs) -> Dict[str, Union[bool, str, List[str]]]:
+        """Async variant of execute_query; accepts the same arguments."""
+        return await asyncio.to_thread(self.execute_query, *args, **kwargs)
+        
+    async def execute_query_batch_async(self, *args, **kwargs) -> Dict[str, Union[bool, str, List[str]]]:
+        """Async variant of execute_query_batch; accepts the same arguments."""
+        return await asyncio.to_thread(self.execute_query_batch, *args, **kwargs)
+        
+    async def show_objects_async(self, *args, **kwargs) -> Dict[str, Union[bool, str, List[str]]]:
+        """Async variant of show_objects; accepts the same arguments."""
+        return await asyncio.to_thread(self.show_objects, *args, **kwargs)
+        
+    async def describe_object_async(self, *args, **kwargs) -> Dict[str, Union[bool, str, List[str]]]:
+        """Async variant of describe_object; accepts the same arguments."""
+        return await asyncio.to_thread(self.describe_object, *args, **kwargs)
+        
+    async def use_context_async(self, *args, **kwargs) -> Dict[str, Union[bool, str, List[str]]]:
+        """Async variant of use_context; accepts the same arguments."""
+        return await asyncio.to_thread(self.use_context, *args, **kwargs)
+        
+    async def grant_privilege_async(self, *args, **kwargs) -> Dict[str, Union[bool, str, List[str]]]:
+        """Async variant of grant_privilege; accepts the same arguments."""
+        return await asyncio.to_thread(self.grant_privilege, *args, **kwargs)
+        
+    async def revoke_privilege_async(self, *args, **kwargs) -> Dict[str, Union[bool, str, List[str]]]:
+        """Async variant of revoke_privilege; accepts the same arguments."""
+        return await asyncio.to_thread(self.revoke_privilege, *args, **kwargs)
+        
+    async def alter_warehouse_async(self, *args, **kwargs) -> Dict[str, Union[bool, str, List[str]]]:
+        """Async variant of alter_warehouse; accepts the same arguments."""
+        return await asyncio.to_thread(self.alter_warehouse, *args, **kwargs)
+
+
+# Shared OperationsManager instances, one per credential set
+_INSTANCES: Dict[tuple, OperationsManager] = {}
+_INSTANCES_LOCK = threading.Lock()
+
+
+def get_operations_manager(
+    account_identifier: Optional[str] = None,
+    username: Optional[str] = None,
+    password: Optional[str] = None,
+    **kwargs
+) -> OperationsManager:
+    """Return the shared OperationsManager for the given credentials, creating it on first use.
+    
+    Args:
+        account_identifier: Snowflake account identifier (optional, can use env vars)
+        username: Snowflake username (optional, can use env vars)
+        password: Snowflake password or PAT (optional, can use env vars)
+        **kwargs: Additional connection parameters
+        
+    Returns:
+        OperationsManager instance shared by all callers using the same credentials
+    """
+    params = dict(account_identifier=account_identifier, username=username, password=password, **kwargs)
+    key = credentials_key(params)
+    with _INSTANCES_LOCK:
+        manager = _INSTANCES.get(key)
+        if manager is None:
+            manager = _INSTANCES[key] = OperationsManager(**params)
+        return manager
@@ -1,7 +1,7 @@
 """
 Snowflake MCP Server - Middleware Package
 
-This package contains middleware components for validation, logging, security, and connection management.
+This package contains middleware components for validation, logging, security, and caching.
 """
 
 from .snowflake_middleware import register_middleware
@@ -10,8 +10,6 @@ __all__ = ["register_middleware"]
 
 # Available middleware components
 AVAILABLE_MIDDLEWARE = [
-    "SnowflakeValidationMiddleware",
-    "SnowflakeLoggingMiddleware", 
-    "SnowflakeSecurityMiddleware",
-    "SnowflakeConnectionMiddleware"
+    "SnowflakeMiddleware",
+    "SnowflakeValidationMiddleware"
 ]
\ No newline at end of file
@@ -1,135 +1,320 @@
 """
 Snowflake Middleware for MCP Server
 
-This module provides comprehensive middleware components for Snowflake database operations.
-It implements a layered security and monitoring approach with four specialized middleware classes:
+This module provides comprehensive middleware components for Snowflake database operations:
 
-1. **SnowflakeValidationMiddleware**: Input validation and sanitization
-2. **SnowflakeSecurityMiddleware**: Security monitoring and threat detection  
-3. **SnowflakeLoggingMiddleware**: Execution logging and performance monitoring
-4. **SnowflakeConnectionMiddleware**: Connection health and management
+1. **SnowflakeMiddleware**: A single layer combining
+   - Security monitoring and threat detection
+   - Short-lived response caching for read-only tools
+   - Execution logging and performance monitoring
+2. **SnowflakeValidationMiddleware**: Input validation and sanitization (not registered until it has rules)
+
+Connection health is handled by the connection pool in ``core.snowflake_utils``
+rather than by a middleware layer.
 
 Middleware Architecture:
 - Uses FastMCP's middleware system for tool execution interception
 - Middleware executes in registration order around tool calls
 - Each middleware can inspect, modify, or halt tool execution
-- Provides consistent cross-cutting concerns across all Snowflake tools
+- Cross-cutting concerns are combined in one layer so each tool call awaits
+  a single middleware frame
 
 Execution Flow:
-    Tool Call -> Validation -> Security -> Logging -> Connection -> Actual Tool -> Connection -> Logging -> Security -> Validation -> Response
+    Tool Call -> SnowflakeMiddleware (security scan, cache lookup, timer) -> Actual Tool -> SnowflakeMiddleware (cache store, timing record) -> Response
 
 This ensures all Snowflake operations are properly validated, secured, logged, and monitored.
 """
 
 from fastmcp.server.middleware import Middleware, MiddlewareContext
 from fastmcp import FastMCP
+import atexit
+import functools
+import json
+import queue
+import re
 import time
 import logging
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from ..core.cache import TTLCache
 
-# Configure logger for middleware operations with appropriate formatting
+# Configure logger for middleware operations; timestamps come from the handler's
+# formatter (see _configure_async_logging) and messages use lazy %-style args
 logger = logging.getLogger(__name__)
 
-# TODO: Configure structured logging format for better parsing
-# logging.basicConfig(
-#     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-#     level=logging.INFO
-# )
 
-def register_middleware(mcp: FastMCP):
+class DedupFilter(logging.Filter):
+    """Drops log records identical to one already emitted within a short window.
+    
+    Warnings and errors are always emitted: they double as the audit trail
+    (e.g. every dangerous-SQL warning), so none of them may be collapsed.
     """
-    Register the complete middleware stack for Snowflake operations.
     
-    This function registers four specialized middleware components that provide
-    comprehensive request processing, security, logging, and monitoring for all
-    Snowflake database operations.
+    def __init__(self, maxsize: int = 1024, ttl: float = 5.0):
+        super().__init__()
+        self.seen = TTLCache(maxsize=maxsize, ttl=ttl)
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING:
+            return True
+        key = (record.levelno, record.msg, record.args)
+        try:
+            if self.seen.get(key) is not None:
+                return False
+            self.seen.set(key, True)
+        except TypeError:
+            # Unhashable arguments - always emit
+            pass
+        return True
+
+
+logger.addFilter(DedupFilter())
+
+# Per-call timing events, one JSON record per tool call. A child of the
+# middleware logger so records share its queue handler.
+perf_logger = logging.getLogger(f"{__name__}.perf")
+
+
+def _encode_event(event: dict) -> str:
+    """Encode a telemetry event as compact JSON, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(event).decode()
+    return json.dumps(event, separators=(",", ":"))
+
+# Potentially dangerous SQL operations that should be monitored
+DANGEROUS_KEYWORDS = (
+    'drop database', 'drop warehouse', 'truncate', 'delete from',
+    'alter user', 'create user', 'drop user', 'grant', 'revoke'
+)
+
+# All keywords compiled once into a single case-insensitive pattern so each
+# statement is scanned in one pass however long the keyword list grows. Words
+# within a keyword may be separated by any whitespace.
+DANGEROUS_RE = re.compile(
+    r"\b(?:%s)\b" % "|".join(
+        r"\s+".join(map(re.escape, keyword.split()))
+        for keyword in sorted(DANGEROUS_KEYWORDS, key=len, reverse=True)
+    ),
+    re.IGNORECASE
+)
+
+# Tool arguments that may carry raw SQL text, either one statement or a list of them
+_SQL_FIELDS = frozenset(('ddl_statement', 'dml_statement', 'sql_statement', 'query', 'queries', 'statement', 'statements'))
+
+
+@functools.lru_cache(maxsize=1024)
+def _scan_sql(sql: str) -> Optional[str]:
+    """Return the first dangerous keyword in sql, or None.
+
+    Memoized on the statement text so repeated statements skip the regex scan.
+    """
+    match = DANGEROUS_RE.search(sql)
+    return match.group(0) if match else None
+
+
+class SnowflakeValidationMiddleware(Middleware):
+    """Validates Snowflake tool inputs before execution.
+
+    Not registered by register_middleware while it performs no checks, so
+    tool calls don't pay for an extra pass-through layer.
+    """
     
-    Middleware Registration Order (execution flows in this order):
-    1. ValidationMiddleware - Validates inputs before any processing
-    2. SecurityMiddleware - Applies security controls and threat detection
-    3. LoggingMiddleware - Logs execution details and performance metrics
-    4. ConnectionMiddleware - Manages connection health and monitoring
+    __slots__ = ()
     
-    Args:
-        mcp (FastMCP): The FastMCP server instance to register middleware on
-        
-    Note:
-        The order of registration determines the execution order. Each middleware
-        wraps the next, creating an "onion" pattern where the first registered
-        is the outermost layer.
+    async def on_call_tool(self, context: MiddlewareContext, call_next):
+        # For now, pass through all requests - add specific validation later.
+        # Tool start/finish is already recorded by SnowflakeMiddleware.
+        return await call_next(context)
+
+
+class SnowflakeMiddleware(Middleware):
+    """Security scanning, response caching and timing for Snowflake tools.
+
+    The checks run in a single on_call_tool so each tool call passes through
+    one middleware layer instead of one per concern.
     """
     
-    class SnowflakeValidationMiddleware(Middleware):
-        """Validates Snowflake tool inputs before execution."""
+    # Tools whose results depend only on their arguments and database state.
+    # query_data is left out: its rows are cached by the DML manager's
+    # QUERY_CACHE, which also sees writes made outside the tool layer.
+    CACHEABLE_TOOLS = frozenset({
+        'show_database_objects',
+        'describe_database_object',
+        'describe_database_objects'
+    })
+    
+    __slots__ = ("cache",)
+    
+    def __init__(self, maxsize: int = 1024, ttl: float = 30.0):
+        self.cache = TTLCache(maxsize=maxsize, ttl=ttl)
+    
+    async def on_call_tool(self, context: MiddlewareContext, call_next):
+        message = context.message
+        tool_name = getattr(message, 'name', None) or 'unknown'
+        args = getattr(message, 'arguments', None)
+        
+        # Security - most tools carry no SQL argument at all, and the scan
+        # only produces warnings, so skip it when nobody would see them
+        if args and logger.isEnabledFor(logging.WARNING):
+            for field in args.keys() & _SQL_FIELDS:
+                value = args[field]
+                # Each statement of a list is scanned (and memoized) on its own
+                statements = value if isinstance(value, (list, tuple)) else (value,)
+                for sql in statements:
+                    if sql:
+                        keyword = _scan_sql(str(sql))
+                        if keyword:
+                            logger.warning(
+                                "Potentially dangerous SQL operation detected in tool '%s': %s",
+                                tool_name, keyword
+                            )
+                            # For now, just log - could add approval workflow later
         
-        async def on_call_tool(self, context: MiddlewareContext, call_next):
-            # Basic validation for Snowflake operations
-            tool_name = getattr(context, 'tool_name', 'unknown')
-            
-            # Log validation attempt
-            logger.debug(f"Validating tool: {tool_name}")
-            
-            # For now, pass through all requests - add specific validation later
-            return await call_next(context)
-
-    class SnowflakeLoggingMiddleware(Middleware):
-        """Logs Snowflake tool execution details with timing."""
+        start_ns = time.time_ns()
+        start = time.perf_counter_ns()
         
-        async def on_call_tool(self, context: MiddlewareContext, call_next):
-            start_time = time.time()
-            tool_name = getattr(context, 'tool_name', 'unknown')
-            
-            # Log tool execution start
-            logger.info(f"[{time.strftime('%Y-%m-%d %H:%M:%S')}] Snowflake tool '{tool_name}' started")
-            
+        # Caching - serve repeated read-only calls, and drop cached reads
+        # once any other tool may have changed data or context
+        key = None
+        result = None
+        if tool_name in self.CACHEABLE_TOOLS:
+            key = (tool_name, json.dumps(args or {}, sort_keys=True, default=str))
+            generation = self.cache.generation
+            result = self.cache.get(key)
+            if result is not None:
+                logger.debug("Serving cached result for tool: %s", tool_name)
+        
+        if result is None:
             try:
                 result = await call_next(context)
-                execution_time = time.time() - start_time
-                logger.info(f"[{time.strftime('%Y-%m-%d %H:%M:%S')}] Snowflake tool '{tool_name}' completed successfully in {execution_time:.2f}s")
-                return result
             except Exception as e:
-                execution_time = time.time() - start_time
-                logger.error(f"[{time.strftime('%Y-%m-%d %H:%M:%S')}] Snowflake tool '{tool_name}' failed after {execution_time:.2f}s: {str(e)}")
+                if perf_logger.isEnabledFor(logging.ERROR):
+                    perf_logger.error("%s", _encode_event({
+                        "tool": tool_name,
+                        "start_ns": start_ns,
+                        "dur_ns": time.perf_counter_ns() - start,
+                        "ok": False,
+                        "error": str(e)
+                    }))
                 raise
-
-    class SnowflakeSecurityMiddleware(Middleware):
-        """Provides security checks for Snowflake operations."""
+            finally:
+                # Cleared after the call, so reads in flight cannot re-cache older results
+                if key is None:
+                    self.cache.clear()
+            if key is not None:
+                self.cache.set(key, result, generation)
         
-        # List of dangerous SQL keywords that should be monitored
-        DANGEROUS_KEYWORDS = {
-            'drop database', 'drop warehouse', 'truncate', 'delete from',
-            'alter user', 'create user', 'drop user', 'grant', 'revoke'
-        }
-        
-        async def on_call_tool(self, context: MiddlewareContext, call_next):
-            tool_name = getattr(context, 'tool_name', 'unknown')
-            
-            # Check for potentially dangerous operations
-            if hasattr(context, 'arguments'):
-                args = context.arguments or {}
-                
-                # Check SQL statements for dangerous keywords
-                sql_fields = ['ddl_statement', 'sql_statement', 'query', 'statement']
-                for field in sql_fields:
-                    if field in args and args[field]:
-                        sql = str(args[field]).lower()
-                        for keyword in self.DANGEROUS_KEYWORDS:
-                            if keyword in sql:
-                                logger.warning(f"Potentially dangerous SQL operation detected in tool '{tool_name}': {keyword}")
-                                # For now, just log - could add approval workflow later
-                                break
-            
-            return await call_next(context)
-
-    class SnowflakeConnectionMiddleware(Middleware):
-        """Monitors and manages Snowflake connection health."""
+        # Timing - one structured record per successful call
+        if perf_logger.isEnabledFor(logging.INFO):
+            perf_logger.info("%s", _encode_event({
+                "tool": tool_name,
+                "start_ns": start_ns,
+                "dur_ns": time.perf_counter_ns() - start,
+                "ok": True
+            }))
+        return result
+
+
+# Middleware instances in registration order, built once and shared
+_MIDDLEWARES = (
+    SnowflakeMiddleware(),
+)
+
+# Upper bound on queued middleware log records awaiting the listener thread
+LOG_QUEUE_SIZE = 8192
+
+# Background listener that formats and writes middleware log records
+_log_listener = None
+
+# Records discarded because the log queue was full
+_dropped_records = 0
+
+
+class NonBlockingQueueHandler(QueueHandler):
+    """QueueHandler that drops records instead of blocking when the queue is full.
+    
+    Records are enqueued as logged. QueueHandler.prepare would merge
+    ``msg % args`` and render tracebacks on the logging thread (the event
+    loop); the listener's handler does that work instead. The queue never
+    leaves the process, so the record needs no pickling-safe preparation.
+    """
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+    
+    def enqueue(self, record: logging.LogRecord) -> None:
+        global _dropped_records
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            _dropped_records += 1
+
+
+def dropped_log_records() -> int:
+    """Return how many middleware log records were dropped under backpressure."""
+    return _dropped_records
+
+
+def _stop_async_logging():
+    """Flush and stop the background log listener."""
+    try:
+        _log_listener.stop()
+    except queue.Full:
+        # Queue still saturated at shutdown - the daemon listener thread exits with the process
+        pass
+
+
+def _configure_async_logging():
+    """Route middleware log records through a queue drained on a background thread.
+
+    Tool calls only enqueue records; formatting and stream I/O happen on the
+    listener thread so they stay off the event loop. The queue is bounded and
+    records are dropped (and counted) rather than blocking a tool call when
+    the writer falls behind. Safe to call repeatedly.
+    """
+    global _log_listener
+    if _log_listener is not None:
+        return
+
+    log_queue = queue.Queue(maxsize=LOG_QUEUE_SIZE)
+    logger.addHandler(NonBlockingQueueHandler(log_queue))
+    # Records are written by the listener - don't also emit them synchronously upstream
+    logger.propagate = False
+
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+    _log_listener = QueueListener(log_queue, handler, respect_handler_level=True)
+    _log_listener.start()
+    atexit.register(_stop_async_logging)
+
+
+def register_middleware(mcp: FastMCP):
+    """
+    Register the complete middleware stack for Snowflake operations.
+    
+    This function registers SnowflakeMiddleware, which provides security
+    scanning, caching, and logging for all Snowflake database operations in a
+    single layer. SnowflakeValidationMiddleware is a pass-through for now and
+    is left unregistered.
+    
+    Args:
+        mcp (FastMCP): The FastMCP server instance to register middleware on
         
-        async def on_call_tool(self, context: MiddlewareContext, call_next):
-            # This middleware could add connection health checks
-            # For now, just pass through
-            return await call_next(context)
-
-    # Register middleware with the server in order of execution
-    mcp.add_middleware(SnowflakeValidationMiddleware())
-    mcp.add_middleware(SnowflakeSecurityMiddleware())
-    mcp.add_middleware(SnowflakeLoggingMiddleware())
-    mcp.add_middleware(SnowflakeConnectionMiddleware())
\ No newline at end of file
+    Note:
+        The order of registration determines the execution order. Each middleware
+        wraps the next, creating an "onion" pattern where the first registered
+        is the outermost layer.
+    """
+    _configure_async_logging()
+
+    # Register middleware with the server in order of execution, skipping any
+    # already present if this is called more than once for the same server
+    registered = getattr(mcp, 'middleware', ())
+    for middleware in _MIDDLEWARES:
+        if middleware not in registered:
+            mcp.add_middleware(middleware)
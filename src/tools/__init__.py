@@ -11,6 +11,8 @@ All tools follow a consistent pattern using manager classes for database operati
 and provide comprehensive error handling and response formatting.
 """
 
+from types import MappingProxyType
+
 from .ddl_tools import register_ddl_tools
 from .dml_tools import register_dml_tools
 from .operations_tools import register_operations_tools
@@ -21,42 +23,48 @@ __all__ = [
     "register_operations_tools",
 ]
 
-# Available tool categories
-AVAILABLE_TOOL_CATEGORIES = {
-    "ddl": {
+# Available tool categories (read-only)
+AVAILABLE_TOOL_CATEGORIES = MappingProxyType({
+    "ddl": MappingProxyType({
         "description": "Data Definition Language tools for database structure management",
-        "tools": [
+        "tools": (
             "execute_ddl_statement",
+            "batch_execute_ddl",
             "create_database",
             "create_schema", 
+            "batch_create_schemas",
             "create_table",
             "drop_database_object",
             "alter_table",
             "alter_schema",
             "alter_database"
-        ]
-    },
-    "dml": {
+        )
+    }),
+    "dml": MappingProxyType({
         "description": "Data Manipulation Language tools for data operations",
-        "tools": [
+        "tools": (
             "insert_data",
+            "insert_data_bulk",
+            "bulk_load_data",
             "query_data",
             "update_data",
             "delete_data",
             "execute_dml_statement",
             "merge_data"
-        ]
-    },
-    "operations": {
+        )
+    }),
+    "operations": MappingProxyType({
         "description": "Administrative and utility tools for Snowflake operations",
-        "tools": [
+        "tools": (
             "execute_sql_query",
+            "execute_sql_batch",
             "show_database_objects",
             "describe_database_object", 
+            "describe_database_objects",
             "set_context",
             "alter_warehouse",
             "grant_privileges",
             "revoke_privileges"
-        ]
-    }
-}
\ No newline at end of file
+        )
+    })
+})
@@ -10,12 +10,80 @@ These tools directly use the connection manager for SQL execution.
 
 from fastmcp import FastMCP, Context
 from fastmcp.exceptions import ToolError
-from typing import Dict, List, Optional
+from typing import List, NoReturn, Optional, Tuple
 from ..core.exceptions import SnowflakeException, DDLException, ValidationException
 from ..core.response_handlers import SnowflakeResponse
-from ..helpers.ddl_manager import DDLManager
-import json
+from ..core.snowflake_utils import get_snowflake_credentials
+from ..helpers.ddl_manager import ColumnSpec, DDLManager, get_ddl_manager
+import asyncio
+import functools
 import os
+import re
+
+
+# Response handler for consistent DDL response formatting, shared by all tools
+response_handler = SnowflakeResponse()
+
+# A DDL statement must open with a DDL keyword, after optional comments
+_DDL_HEAD_RE = re.compile(
+    r"\A(?:\s|--[^\n]*(?:\n|\Z)|/\*.*?\*/)*"
+    r"(?:CREATE|ALTER|DROP|UNDROP|TRUNCATE|RENAME|COMMENT|GRANT|REVOKE)\b",
+    re.IGNORECASE | re.DOTALL
+)
+
+# Progress messages to the client (ctx.info) cost a protocol round-trip each,
+# so they are only sent when MCP_DDL_DEBUG=1
+_DEBUG = os.getenv("MCP_DDL_DEBUG") == "1"
+
+
+async def _handle_ddl_error(ctx: Context, error: Exception, failure: str) -> NoReturn:
+    """Report a failed DDL tool call to the client and raise it as a ToolError.
+    
+    Args:
+        ctx: Tool context to report the error on
+        error: The exception raised by the tool body
+        failure: Description used for Snowflake errors, e.g. "Table creation failed"
+    """
+    if isinstance(error, SnowflakeException):
+        message = f"{failure}: {error.message}"
+    elif isinstance(error, ValidationException):
+        message = f"Validation error: {str(error)}"
+    else:
+        message = f"Unexpected error: {str(error)}"
+    await ctx.error(message)
+    raise ToolError(message)
+
+
+def _ddl_tool(failure: str, errors: Tuple[type, ...] = (Exception,)):
+    """Decorate a DDL tool so errors it raises are reported through _handle_ddl_error.
+    
+    functools.wraps keeps the tool's signature, which FastMCP builds the
+    tool's schema from, so the decorator sits between @mcp.tool and the
+    tool function.
+    
+    Args:
+        failure: Description used for Snowflake errors, e.g. "Table creation failed"
+        errors: Exception types that are reported; others propagate unchanged
+    """
+    def decorate(tool):
+        @functools.wraps(tool)
+        async def wrapper(*args, **kwargs):
+            try:
+                return await tool(*args, **kwargs)
+            except errors as e:
+                await _handle_ddl_error(kwargs.get("ctx"), e, failure)
+        return wrapper
+    return decorate
+
+
+def _ddl_manager() -> DDLManager:
+    """Return the shared DDL manager for the environment's Snowflake credentials."""
+    account_identifier, username, pat = get_snowflake_credentials()
+    return get_ddl_manager(
+        account_identifier=account_identifier,
+        username=username,
+        password=pat
+    )
 
 
 def register_ddl_tools(mcp: FastMCP):
@@ -26,25 +94,12 @@ def register_ddl_tools(mcp: FastMCP):
         mcp: FastMCP server instance
     """
     
-    # Initialize response handler for consistent DDL response formatting
-    response_handler = SnowflakeResponse()
-    
-    def get_snowflake_credentials():
-        """Get Snowflake credentials from environment variables."""
-        account_identifier = os.getenv("SNOWFLAKE_ACCOUNT")
-        username = os.getenv("SNOWFLAKE_USER") 
-        pat = os.getenv("SNOWFLAKE_PAT") or os.getenv("SNOWFLAKE_PASSWORD")
-        
-        if not account_identifier or not username or not pat:
-            raise ValidationException("Missing required Snowflake credentials: SNOWFLAKE_ACCOUNT, SNOWFLAKE_USER, and SNOWFLAKE_PAT/SNOWFLAKE_PASSWORD", "credentials", "environment")
-        
-        return account_identifier, username, pat
-    
     @mcp.tool(
         name="execute_ddl_statement",
         description="Execute a custom DDL statement for database structure changes",
         tags={"database", "ddl", "custom", "structure"}
     )
+    @_ddl_tool("DDL execution failed")
     async def execute_ddl_statement(
         ddl_statement: str,
         connection_name: str = "default",
@@ -67,55 +122,99 @@ def register_ddl_tools(mcp: FastMCP):
         Example:
             ddl_statement = "CREATE TABLE my_table (id INT, name VARCHAR(100))"
         """
-        try:
-            # Validate DDL statement
-            if not ddl_statement or not ddl_statement.strip():
-                raise ValidationException("DDL statement cannot be empty", "ddl_statement", ddl_statement)
-            
+        # Validate DDL statement
+        if not ddl_statement or not ddl_statement.strip():
+            raise ValidationException("DDL statement cannot be empty", "ddl_statement", ddl_statement)
+        if not _DDL_HEAD_RE.match(ddl_statement):
+            raise ValidationException("Statement does not start with a DDL keyword", "ddl_statement", ddl_statement)
+        
+        if _DEBUG:
             await ctx.info(f"Executing DDL statement: {ddl_statement}")
+        
+        ddl_manager = _ddl_manager()
+        
+        # Execute DDL using manager
+        ddl_response = await ddl_manager.execute_ddl_async(ddl_statement)
+        
+        meta = response_handler.parse_ddl_response_meta(ddl_response)
+        
+        if _DEBUG:
+            await ctx.info("DDL statement executed successfully")
+        return "\n".join([
+            "DDL statement executed successfully!",
+            "",
+            f"📝 Statement: {ddl_statement}",
+            "✅ Operation completed successfully",
+            f"📊 Results: {meta['row_count']} rows affected"
+        ])
+    
+    @mcp.tool(
+        name="batch_execute_ddl",
+        description="Execute several DDL statements in order over a single connection",
+        tags={"database", "ddl", "custom", "structure", "batch"}
+    )
+    @_ddl_tool("DDL batch failed")
+    async def batch_execute_ddl(
+        statements: List[str],
+        connection_name: str = "default",
+        ctx: Context = None
+    ) -> str:
+        """
+        Execute a list of DDL statements in order as one batch.
+        
+        This tool runs several Data Definition Language statements back to back
+        over one connection, which is faster than calling execute_ddl_statement
+        once per statement. Execution stops at the first failing statement;
+        statements before it remain applied since DDL commits implicitly.
+        
+        Args:
+            statements: The DDL SQL statements to execute, in order
+            connection_name: Which connection to use for the operation
             
-            # Get Snowflake credentials and create DDL manager
-            account_identifier, username, pat = get_snowflake_credentials()
-            ddl_manager = DDLManager(
-                account_identifier=account_identifier,
-                username=username,
-                password=pat
-            )
-            
-            # Execute DDL using manager
-            ddl_response = ddl_manager.execute_ddl(ddl_statement)
-            
-            parsed_response = response_handler.parse_ddl_response(ddl_response)
-            response_data = json.loads(parsed_response)
+        Returns:
+            Success message with execution details
             
-            await ctx.info("DDL statement executed successfully")
-            return f"""DDL statement executed successfully!
-
-            📝 Statement: {ddl_statement}
-            ✅ Operation completed successfully
-            📊 Results: {len(response_data['results'])} rows affected"""
-                
-        except ValidationException as e:
-            await ctx.error(f"Validation error: {str(e)}")
-            raise ToolError(f"Validation error: {str(e)}")
-        except DDLException as e:
-            await ctx.error(f"DDL operation failed: {e.message}")
-            raise ToolError(f"DDL operation failed: {e.message}")
-        except SnowflakeException as e:
-            # Convert generic Snowflake exceptions to DDL exceptions for better context
-            ddl_error = DDLException(f"DDL execution failed: {e.message}", "EXECUTE", ddl_statement)
-            await ctx.error(f"DDL execution failed: {ddl_error.message}")
-            raise ToolError(f"DDL execution failed: {ddl_error.message}")
-        except Exception as e:
-            ddl_error = DDLException(f"Unexpected error during DDL execution: {str(e)}", "EXECUTE", ddl_statement)
-            await ctx.error(f"Unexpected DDL error: {ddl_error.message}")
-            raise ToolError(f"Unexpected DDL error: {ddl_error.message}")
+        Example:
+            statements = [
+                "CREATE SCHEMA IF NOT EXISTS MY_DB.STAGING",
+                "CREATE TABLE IF NOT EXISTS MY_DB.STAGING.EVENTS (id INT, payload VARIANT)"
+            ]
+        """
+        # Validate DDL statements
+        if not statements:
+            raise ValidationException("At least one DDL statement is required", "statements", statements)
+        for ddl_statement in statements:
+            if not ddl_statement or not ddl_statement.strip():
+                raise ValidationException("DDL statement cannot be empty", "statements", ddl_statement)
+            if not _DDL_HEAD_RE.match(ddl_statement):
+                raise ValidationException("Statement does not start with a DDL keyword", "statements", ddl_statement)
+        
+        if _DEBUG:
+            await ctx.info(f"Executing batch of {len(statements)} DDL statements")
+        
+        ddl_manager = _ddl_manager()
+        
+        # Execute DDL batch using manager
+        ddl_response = await ddl_manager.execute_ddl_batch_async(statements)
+        
+        meta = response_handler.parse_ddl_response_meta(ddl_response)
+        
+        if _DEBUG:
+            await ctx.info("DDL batch executed successfully")
+        return "\n".join([
+            "DDL batch executed successfully!",
+            "",
+            f"📝 Statements: {len(statements)}",
+            "✅ All statements completed successfully",
+            f"📊 Results: {meta['row_count']} rows returned"
+        ])
     
     @mcp.tool(
         name="create_database",
         description="Create a new Snowflake database",
         tags={"database", "ddl", "create", "database"}
     )
+    @_ddl_tool("Database creation failed")
     async def create_database(
         database_name: str,
         connection_name: str = "default",
@@ -138,42 +237,33 @@ def register_ddl_tools(mcp: FastMCP):
         Example:
             database_name = "MY_NEW_DATABASE"
         """
-        try:
+        if _DEBUG:
             await ctx.info(f"Creating database: {database_name}")
+        
+        ddl_manager = _ddl_manager()
+        
+        # Create database using manager
+        ddl_response = await ddl_manager.create_database_async(database_name)
+        
+        if not ddl_response["success"]:
+            raise DDLException(ddl_response["message"], "CREATE_DATABASE", database_name)
             
-            # Get Snowflake credentials and create DDL manager
-            account_identifier, username, pat = get_snowflake_credentials()
-            ddl_manager = DDLManager(
-                account_identifier=account_identifier,
-                username=username,
-                password=pat
-            )
-            
-            # Create database using manager
-            ddl_response = ddl_manager.create_database(database_name)
-            
-            if not ddl_response["success"]:
-                raise DDLException(ddl_response["message"], "CREATE_DATABASE", database_name)
-                
+        if _DEBUG:
             await ctx.info(f"Database {database_name} created successfully")
-            return f"""Database '{database_name}' created successfully!
-
-            🏗️ Database: {database_name}
-            ✅ Ready for schemas and tables
-            📍 Connection: {connection_name}"""
-                            
-        except SnowflakeException as e:
-            await ctx.error(f"Database creation failed: {e.message}")
-            raise ToolError(f"Database creation failed: {e.message}")
-        except Exception as e:
-            await ctx.error(f"Unexpected error: {str(e)}")
-            raise ToolError(f"Unexpected error: {str(e)}")
+        return "\n".join([
+            f"Database '{database_name}' created successfully!",
+            "",
+            f"🏗️ Database: {database_name}",
+            "✅ Ready for schemas and tables",
+            f"📍 Connection: {connection_name}"
+        ])
     
     @mcp.tool(
         name="create_schema",
         description="Create a new schema within a database",
         tags={"database", "ddl", "create", "schema"}
     )
+    @_ddl_tool("Schema creation failed")
     async def create_schema(
         database_name: str,
         schema_name: str,
@@ -198,47 +288,108 @@ def register_ddl_tools(mcp: FastMCP):
             database_name = "MY_DATABASE"
             schema_name = "ANALYTICS"
         """
-        try:
+        if _DEBUG:
             await ctx.info(f"Creating schema {database_name}.{schema_name}")
+        
+        ddl_manager = _ddl_manager()
+        
+        # Create schema using manager
+        ddl_response = await ddl_manager.create_schema_async(database_name, schema_name)
+        
+        if not ddl_response["success"]:
+            raise DDLException(ddl_response["message"], "CREATE_SCHEMA", f"{database_name}.{schema_name}")
             
-            # Get Snowflake credentials and create DDL manager
-            account_identifier, username, pat = get_snowflake_credentials()
-            ddl_manager = DDLManager(
-                account_identifier=account_identifier,
-                username=username,
-                password=pat
-            )
+        if _DEBUG:
+            await ctx.info(f"Schema {database_name}.{schema_name} created successfully")
+        return "\n".join([
+            f"Schema '{database_name}.{schema_name}' created successfully!",
+            "",
+            f"🏗️ Schema: {database_name}.{schema_name}",
+            "✅ Ready for tables and views",
+            f"📍 Connection: {connection_name}"
+        ])
+    
+    @mcp.tool(
+        name="batch_create_schemas",
+        description="Create several schemas within a database concurrently",
+        tags={"database", "ddl", "create", "schema", "batch"}
+    )
+    @_ddl_tool("Schema creation failed")
+    async def batch_create_schemas(
+        database_name: str,
+        schema_names: List[str],
+        connection_name: str = "default",
+        ctx: Context = None
+    ) -> str:
+        """
+        Create several schemas within a specified database at once.
+        
+        The CREATE SCHEMA statements are issued concurrently, so creating N
+        schemas takes roughly as long as the slowest one rather than the sum
+        of all of them. Each schema is created independently; failures are
+        reported per schema and do not undo the schemas that were created.
+        
+        Args:
+            database_name: Name of the database to create the schemas in
+            schema_names: Names of the schemas to create
+            connection_name: Which connection to use for the operation
             
-            # Create schema using manager
-            ddl_response = ddl_manager.create_schema(database_name, schema_name)
+        Returns:
+            Success message with schema creation details
             
-            if not ddl_response["success"]:
-                raise DDLException(ddl_response["message"], "CREATE_SCHEMA", f"{database_name}.{schema_name}")
-                
-            await ctx.info(f"Schema {database_name}.{schema_name} created successfully")
-            return f"""Schema '{database_name}.{schema_name}' created successfully!
-
-            🏗️ Schema: {database_name}.{schema_name}
-            ✅ Ready for tables and views
-            📍 Connection: {connection_name}"""
-                
-        except SnowflakeException as e:
-            await ctx.error(f"Schema creation failed: {e.message}")
-            raise ToolError(f"Schema creation failed: {e.message}")
-        except Exception as e:
-            await ctx.error(f"Unexpected error: {str(e)}")
-            raise ToolError(f"Unexpected error: {str(e)}")
+        Example:
+            database_name = "MY_DATABASE"
+            schema_names = ["RAW", "STAGING", "ANALYTICS"]
+        """
+        if not schema_names:
+            raise ValidationException("At least one schema name is required", "schema_names", schema_names)
+        
+        if _DEBUG:
+            await ctx.info(f"Creating {len(schema_names)} schemas in {database_name}")
+        
+        ddl_manager = _ddl_manager()
+        
+        # Create schemas concurrently; each blocking call runs in a worker thread
+        outcomes = await asyncio.gather(
+            *(ddl_manager.create_schema_async(database_name, schema_name)
+              for schema_name in schema_names),
+            return_exceptions=True
+        )
+        
+        failures = [
+            f"{database_name}.{schema_name}: {getattr(outcome, 'message', str(outcome))}"
+            for schema_name, outcome in zip(schema_names, outcomes)
+            if isinstance(outcome, BaseException)
+        ]
+        if failures:
+            created = len(schema_names) - len(failures)
+            raise DDLException(
+                f"{len(failures)} of {len(schema_names)} schemas failed ({created} created): " + "; ".join(failures),
+                "CREATE_SCHEMA",
+                database_name
+            )
+        
+        if _DEBUG:
+            await ctx.info(f"{len(schema_names)} schemas created in {database_name}")
+        return "\n".join([
+            f"{len(schema_names)} schemas created successfully in '{database_name}'!",
+            "",
+            *(f"🏗️ Schema: {database_name}.{schema_name}" for schema_name in schema_names),
+            "✅ Ready for tables and views",
+            f"📍 Connection: {connection_name}"
+        ])
     
     @mcp.tool(
         name="create_table",
         description="Create a new table with specified columns",
         tags={"database", "ddl", "create", "table"}
     )
+    @_ddl_tool("Table creation failed")
     async def create_table(
         database_name: str,
         schema_name: str,
         table_name: str,
-        columns: List[Dict[str, str]],
+        columns: List[ColumnSpec],
         connection_name: str = "default",
         ctx: Context = None
     ) -> str:
@@ -265,55 +416,42 @@ def register_ddl_tools(mcp: FastMCP):
                 {"name": "created_at", "type": "TIMESTAMP DEFAULT CURRENT_TIMESTAMP()"}
             ]
         """
-        try:
+        if _DEBUG:
             await ctx.info(f"Creating table {database_name}.{schema_name}.{table_name}")
+        
+        ddl_manager = _ddl_manager()
+        
+        # Create table using manager
+        ddl_response = await ddl_manager.create_table_async(
+            database_name=database_name,
+            schema_name=schema_name,
+            table_name=table_name,
+            columns=columns
+        )
+        
+        if not ddl_response["success"]:
+            raise DDLException(ddl_response["message"], "CREATE_TABLE", f"{database_name}.{schema_name}.{table_name}")
             
-            # Get Snowflake credentials and create DDL manager
-            account_identifier, username, pat = get_snowflake_credentials()
-            ddl_manager = DDLManager(
-                account_identifier=account_identifier,
-                username=username,
-                password=pat
-            )
-            
-            # Create table using manager
-            ddl_response = ddl_manager.create_table(
-                database_name=database_name,
-                schema_name=schema_name,
-                table_name=table_name,
-                columns=columns
-            )
-            
-            if not ddl_response["success"]:
-                raise DDLException(ddl_response["message"], "CREATE_TABLE", f"{database_name}.{schema_name}.{table_name}")
-                
+        if _DEBUG:
             await ctx.info(f"Table {database_name}.{schema_name}.{table_name} created successfully")
-            
-            # Format column info for display
-            column_info = []
-            for col in columns:
-                column_info.append(f"  • {col['name']}: {col['type']}")
-            
-            return f"""Table '{database_name}.{schema_name}.{table_name}' created successfully!
-
-            🏗️ Table: {database_name}.{schema_name}.{table_name}
-            📊 Columns ({len(columns)}):
-            {chr(10).join(column_info)}
-            ✅ Ready for data
-            📍 Connection: {connection_name}"""
-                
-        except SnowflakeException as e:
-            await ctx.error(f"Table creation failed: {e.message}")
-            raise ToolError(f"Table creation failed: {e.message}")
-        except Exception as e:
-            await ctx.error(f"Unexpected error: {str(e)}")
-            raise ToolError(f"Unexpected error: {str(e)}")
+        
+        return "\n".join([
+            f"Table '{database_name}.{schema_name}.{table_name}' created successfully!",
+            "",
+            f"🏗️ Table: {database_name}.{schema_name}.{table_name}",
+            f"📊 Columns ({len(columns)}):",
+            # Column info for display
+            *(f"  • {col['name']}: {col['type']}" for col in columns),
+            "✅ Ready for data",
+            f"📍 Connection: {connection_name}"
+        ])
     
     @mcp.tool(
         name="drop_database_object",
         description="Drop a database object (database, schema, table, etc.)",
         tags={"database", "ddl", "drop", "delete"}
     )
+    @_ddl_tool("Drop operation failed")
     async def drop_database_object(
         object_type: str,
         object_name: str,
@@ -341,52 +479,43 @@ def register_ddl_tools(mcp: FastMCP):
             object_name = "MY_DATABASE.PUBLIC.OLD_TABLE"
             cascade = False
         """
-        try:
+        if _DEBUG:
             await ctx.info(f"Dropping {object_type}: {object_name}")
+        
+        if cascade:
+            await ctx.warning("CASCADE option enabled - dependent objects will also be dropped")
+        
+        ddl_manager = _ddl_manager()
+        
+        # Drop object using manager
+        ddl_response = await ddl_manager.drop_object_async(
+            object_type=object_type,
+            object_name=object_name,
+            cascade=cascade
+        )
+        
+        if not ddl_response["success"]:
+            raise DDLException(ddl_response["message"], "DROP", object_name)
             
-            if cascade:
-                await ctx.warning("CASCADE option enabled - dependent objects will also be dropped")
-            
-            # Get Snowflake credentials and create DDL manager
-            account_identifier, username, pat = get_snowflake_credentials()
-            ddl_manager = DDLManager(
-                account_identifier=account_identifier,
-                username=username,
-                password=pat
-            )
-            
-            # Drop object using manager
-            ddl_response = ddl_manager.drop_object(
-                object_type=object_type,
-                object_name=object_name,
-                cascade=cascade
-            )
-            
-            if not ddl_response["success"]:
-                raise DDLException(ddl_response["message"], "DROP", object_name)
-                
+        if _DEBUG:
             await ctx.info(f"{object_type} {object_name} dropped successfully")
-            cascade_msg = " (with CASCADE)" if cascade else ""
-            return f"""{object_type} '{object_name}' dropped successfully!
-
-            🗑️ Object: {object_name}
-            🔧 Type: {object_type}
-            ⚠️ Operation: DROP{cascade_msg}
-            ✅ Completed successfully
-            📍 Connection: {connection_name}"""
-                
-        except SnowflakeException as e:
-            await ctx.error(f"Drop operation failed: {e.message}")
-            raise ToolError(f"Drop operation failed: {e.message}")
-        except Exception as e:
-            await ctx.error(f"Unexpected error: {str(e)}")
-            raise ToolError(f"Unexpected error: {str(e)}")
+        cascade_msg = " (with CASCADE)" if cascade else ""
+        return "\n".join([
+            f"{object_type} '{object_name}' dropped successfully!",
+            "",
+            f"🗑️ Object: {object_name}",
+            f"🔧 Type: {object_type}",
+            f"⚠️ Operation: DROP{cascade_msg}",
+            "✅ Completed successfully",
+            f"📍 Connection: {connection_name}"
+        ])
     
     @mcp.tool(
         name="alter_table",
         description="Alter a table's structure (add, drop, rename, or modify columns)",
         tags={"database", "ddl", "alter", "table"}
     )
+    @_ddl_tool("Table alteration failed")
     async def alter_table(
         table_name: str,
         alter_type: str,
@@ -428,55 +557,51 @@ def register_ddl_tools(mcp: FastMCP):
             alter_type = "DROP"
             column_name = "old_column"
         """
-        try:
+        if _DEBUG:
             await ctx.info(f"Altering table {table_name}: {alter_type} {column_name}")
+        
+        ddl_manager = _ddl_manager()
+        
+        # Alter table using manager
+        ddl_response = await ddl_manager.alter_table_async(
+            table_name=table_name,
+            alter_type=alter_type,
+            column_name=column_name,
+            new_name=new_name,
+            data_type=data_type,
+            default_value=default_value,
+            not_null=not_null
+        )
+        
+        if not ddl_response["success"]:
+            raise DDLException(ddl_response["message"], "ALTER_TABLE", table_name)
             
-            # Get Snowflake credentials and create DDL manager
-            account_identifier, username, pat = get_snowflake_credentials()
-            ddl_manager = DDLManager(
-                account_identifier=account_identifier,
-                username=username,
-                password=pat
-            )
-            
-            # Alter table using manager
-            ddl_response = ddl_manager.alter_table(
-                table_name=table_name,
-                alter_type=alter_type,
-                column_name=column_name,
-                new_name=new_name,
-                data_type=data_type,
-                default_value=default_value,
-                not_null=not_null
-            )
-            
-            if not ddl_response["success"]:
-                raise DDLException(ddl_response["message"], "ALTER_TABLE", table_name)
-                
+        if _DEBUG:
             await ctx.info(f"Table {table_name} altered successfully")
-            return f"""Table '{table_name}' altered successfully!
-
-            🔧 Operation: {alter_type.upper()}
-            📊 Column: {column_name}
-            {f'🆕 New name: {new_name}' if new_name else ''}
-            {f'🏷️ Data type: {data_type}' if data_type else ''}
-            {f'📌 Default: {default_value}' if default_value else ''}
-            {f'⚠️ NOT NULL: {not_null}' if not_null else ''}
-            ✅ Completed successfully
-            📍 Connection: {connection_name}"""
-                
-        except SnowflakeException as e:
-            await ctx.error(f"Table alteration failed: {e.message}")
-            raise ToolError(f"Table alteration failed: {e.message}")
-        except Exception as e:
-            await ctx.error(f"Unexpected error: {str(e)}")
-            raise ToolError(f"Unexpected error: {str(e)}")
+        lines = [
+            f"Table '{table_name}' altered successfully!",
+            "",
+            f"🔧 Operation: {alter_type.upper()}",
+            f"📊 Column: {column_name}"
+        ]
+        if new_name:
+            lines.append(f"🆕 New name: {new_name}")
+        if data_type:
+            lines.append(f"🏷️ Data type: {data_type}")
+        if default_value:
+            lines.append(f"📌 Default: {default_value}")
+        if not_null:
+            lines.append(f"⚠️ NOT NULL: {not_null}")
+        lines.append("✅ Completed successfully")
+        lines.append(f"📍 Connection: {connection_name}")
+        return "\n".join(lines)
     
     @mcp.tool(
         name="alter_schema",
         description="Alter a schema (rename or move to different database)",
         tags={"database", "ddl", "alter", "schema"}
     )
+    @_ddl_tool("Schema alteration failed")
     async def alter_schema(
         schema_name: str,
         new_name: Optional[str] = None,
@@ -504,48 +629,42 @@ def register_ddl_tools(mcp: FastMCP):
             schema_name = "MY_DATABASE.OLD_SCHEMA"
             new_name = "NEW_SCHEMA"
         """
-        try:
+        if _DEBUG:
             await ctx.info(f"Altering schema: {schema_name}")
+        
+        ddl_manager = _ddl_manager()
+        
+        # Alter schema using manager
+        ddl_response = await ddl_manager.alter_schema_async(
+            schema_name=schema_name,
+            new_name=new_name,
+            new_database=new_database
+        )
+        
+        if not ddl_response["success"]:
+            raise DDLException(ddl_response["message"], "ALTER_SCHEMA", schema_name)
             
-            # Get Snowflake credentials and create DDL manager
-            account_identifier, username, pat = get_snowflake_credentials()
-            ddl_manager = DDLManager(
-                account_identifier=account_identifier,
-                username=username,
-                password=pat
-            )
-            
-            # Alter schema using manager
-            ddl_response = ddl_manager.alter_schema(
-                schema_name=schema_name,
-                new_name=new_name,
-                new_database=new_database
-            )
-            
-            if not ddl_response["success"]:
-                raise DDLException(ddl_response["message"], "ALTER_SCHEMA", schema_name)
-                
+        if _DEBUG:
             await ctx.info(f"Schema {schema_name} altered successfully")
-            return f"""Schema '{schema_name}' altered successfully!
-
-            🔧 Original: {schema_name}
-            {f'🆕 New name: {new_name}' if new_name else ''}
-            {f'🏗️ New database: {new_database}' if new_database else ''}
-            ✅ Completed successfully
-            📍 Connection: {connection_name}"""
-                
-        except SnowflakeException as e:
-            await ctx.error(f"Schema alteration failed: {e.message}")
-            raise ToolError(f"Schema alteration failed: {e.message}")
-        except Exception as e:
-            await ctx.error(f"Unexpected error: {str(e)}")
-            raise ToolError(f"Unexpected error: {str(e)}")
+        lines = [
+            f"Schema '{schema_name}' altered successfully!",
+            "",
+            f"🔧 Original: {schema_name}"
+        ]
+        if new_name:
+            lines.append(f"🆕 New name: {new_name}")
+        if new_database:
+            lines.append(f"🏗️ New database: {new_database}")
+        lines.append("✅ Completed successfully")
+        lines.append(f"📍 Connection: {connection_name}")
+        return "\n".join(lines)
     
     @mcp.tool(
         name="alter_database",
         description="Alter a database (rename)",
         tags={"database", "ddl", "alter", "database"}
     )
+    @_ddl_tool("Database alteration failed")
     async def alter_database(
         database_name: str,
         new_name: str,
@@ -571,37 +690,27 @@ def register_ddl_tools(mcp: FastMCP):
             database_name = "OLD_DATABASE"
             new_name = "NEW_DATABASE"
         """
-        try:
+        if _DEBUG:
             await ctx.info(f"Renaming database {database_name} to {new_name}")
+        
+        ddl_manager = _ddl_manager()
+        
+        # Alter database using manager
+        ddl_response = await ddl_manager.alter_database_async(
+            database_name=database_name,
+            new_name=new_name
+        )
+        
+        if not ddl_response["success"]:
+            raise DDLException(ddl_response["message"], "ALTER_DATABASE", database_name)
             
-            # Get Snowflake credentials and create DDL manager
-            account_identifier, username, pat = get_snowflake_credentials()
-            ddl_manager = DDLManager(
-                account_identifier=account_identifier,
-                username=username,
-                password=pat
-            )
-            
-            # Alter database using manager
-            ddl_response = ddl_manager.alter_database(
-                database_name=database_name,
-                new_name=new_name
-            )
-            
-            if not ddl_response["success"]:
-                raise DDLException(ddl_response["message"], "ALTER_DATABASE", database_name)
-                
+        if _DEBUG:
             await ctx.info(f"Database {database_name} renamed to {new_name} successfully")
-            return f"""Database '{database_name}' renamed successfully!
-
-            🔧 Original name: {database_name}
-            🆕 New name: {new_name}
-            ✅ All schemas and data preserved
-            📍 Connection: {connection_name}"""
-                
-        except SnowflakeException as e:
-            await ctx.error(f"Database alteration failed: {e.message}")
-            raise ToolError(f"Database alteration failed: {e.message}")
-        except Exception as e:
-            await ctx.error(f"Unexpected error: {str(e)}")
-            raise ToolError(f"Unexpected error: {str(e)}")
\ No newline at end of file
+        return "\n".join([
+            f"Database '{database_name}' renamed successfully!",
+            "",
+            f"🔧 Original name: {database_name}",
+            f"🆕 New name: {new_name}",
+            "✅ All schemas and data preserved",
+            f"📍 Connection: {connection_name}"
+        ])
\ No newline at end of file
@@ -10,14 +10,145 @@ These tools directly use the connection manager.
 
 from fastmcp import FastMCP, Context
 from fastmcp.exceptions import ToolError
-from typing import Dict, List, Optional, Union
+from typing import Any, Dict, List, Literal, NoReturn, Optional, Tuple, TypeAlias
+import functools
+import io
 import json
+import time
+try:
+    import orjson
+except ImportError:
+    orjson = None
 from ..core.exceptions import SnowflakeException, DMLException, ValidationException
 from ..core.response_handlers import SnowflakeResponse
-from ..helpers.dml_manager import DMLManager
+from ..core.snowflake_utils import get_snowflake_credentials
+from ..helpers.dml_manager import MAX_BATCH_SIZE, DMLManager, MergeAction, _validate_fqtn, get_dml_manager
 import os
 
 
+# Progress messages to the client (ctx.info) cost a protocol round-trip each,
+# so they are only sent when MCP_DML_DEBUG=1
+_DEBUG = os.getenv("MCP_DML_DEBUG") == "1"
+
+# Queries with no limit, or a limit above this many rows, stream their results
+STREAM_ROW_THRESHOLD = 1000
+
+# Streamed reads still build one response string, so they return at most this
+# many rows and report truncation when the table holds more
+MAX_STREAM_ROWS = 100_000
+
+# Bulk inserts of more than this many rows are loaded with PUT + COPY INTO;
+# smaller ones use batched multi-row INSERTs built by the connector's executemany
+BULK_LOAD_ROW_THRESHOLD = 16_384
+
+# Tool tag sets, built once at import and shared by every registration
+_INSERT_TAGS = frozenset({"database", "dml", "insert", "data"})
+_BULK_INSERT_TAGS = frozenset({"database", "dml", "insert", "data", "bulk"})
+_BULK_LOAD_TAGS = frozenset({"database", "dml", "insert", "data", "bulk", "load"})
+_QUERY_TAGS = frozenset({"database", "dml", "select", "query"})
+_UPDATE_TAGS = frozenset({"database", "dml", "update", "modify"})
+_DELETE_TAGS = frozenset({"database", "dml", "delete", "remove"})
+_EXECUTE_TAGS = frozenset({"database", "dml", "custom", "query"})
+_MERGE_TAGS = frozenset({"database", "dml", "merge", "upsert"})
+
+# Output of the DML tools: compact JSON for programs, or a formatted summary
+ResponseFormat: TypeAlias = Literal["json", "pretty"]
+
+# Response handler for consistent DML response formatting
+response_handler = SnowflakeResponse()
+
+
+def _dumps(value) -> str:
+    """Encode a value as compact JSON text, using orjson when available.
+    
+    Values orjson cannot encode fall back to the standard library, which
+    stringifies anything that is not natively JSON-serializable.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(value, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:
+            pass
+    return json.dumps(value, default=str, separators=(",", ":"))
+
+
+def _rows_to_values(rows: List[dict]) -> Tuple[List[str], List[list]]:
+    """Split a list of row dicts into a column list and rows of values.
+    
+    Column order is taken from the first row and every row must have the
+    same keys. List and dict values are converted to JSON strings.
+    """
+    if not rows or not isinstance(rows, list) or not all(isinstance(row, dict) for row in rows):
+        raise ValidationException("Rows must be a non-empty list of dictionaries", "rows", str(rows)[:200])
+    
+    columns = list(rows[0].keys())
+    column_set = rows[0].keys()
+    for i, row in enumerate(rows):
+        if row.keys() != column_set:
+            raise ValidationException(f"Row {i} does not have the same columns as row 0", "rows", str(row)[:200])
+    
+    values = [
+        [_dumps(value) if isinstance(value, (list, dict)) else value for value in map(row.get, columns)]
+        for row in rows
+    ]
+    return columns, values
+
+
+def _json_result(**fields) -> str:
+    """Encode a successful tool result as a compact JSON object."""
+    return _dumps({"status": "ok", **fields})
+
+
+async def _handle_dml_error(ctx: Context, error: Exception, failure: str) -> NoReturn:
+    """Report a failed DML tool call to the client and raise it as a ToolError.
+    
+    Args:
+        ctx: Tool context to report the error on
+        error: The exception raised by the tool body
+        failure: Description used for Snowflake errors, e.g. "Data update failed"
+    """
+    if isinstance(error, SnowflakeException):
+        message = f"{failure}: {error.message}"
+    elif isinstance(error, ValidationException):
+        message = f"Validation error: {str(error)}"
+    else:
+        message = f"Unexpected error: {str(error)}"
+    await ctx.error(message)
+    raise ToolError(message)
+
+
+def _dml_tool(failure: str, errors: Tuple[type, ...] = (Exception,)):
+    """Decorate a DML tool so errors it raises are reported through _handle_dml_error.
+    
+    functools.wraps keeps the tool's signature, which FastMCP builds the
+    tool's schema from, so the decorator sits between @mcp.tool and the
+    tool function.
+    
+    Args:
+        failure: Description used for Snowflake errors, e.g. "Data update failed"
+        errors: Exception types that are reported; others propagate unchanged
+    """
+    def decorate(tool):
+        @functools.wraps(tool)
+        async def wrapper(*args, **kwargs):
+            try:
+                return await tool(*args, **kwargs)
+            except errors as e:
+                await _handle_dml_error(kwargs.get("ctx"), e, failure)
+        return wrapper
+    return decorate
+
+
+def _dml_manager() -> DMLManager:
+    """Return the shared DML manager for the environment's Snowflake credentials."""
+    account_identifier, username, pat = get_snowflake_credentials()
+    return get_dml_manager(
+        account_identifier=account_identifier,
+        username=username,
+        password=pat
+    )
+
+
 def register_dml_tools(mcp: FastMCP):
     """
     Register DML operations as FastMCP tools.
@@ -26,29 +157,17 @@ def register_dml_tools(mcp: FastMCP):
         mcp: FastMCP server instance
     """
     
-    # Initialize response handler for consistent DML response formatting
-    response_handler = SnowflakeResponse()
-    
-    def get_snowflake_credentials():
-        """Get Snowflake credentials from environment variables."""
-        account_identifier = os.getenv("SNOWFLAKE_ACCOUNT")
-        username = os.getenv("SNOWFLAKE_USER") 
-        pat = os.getenv("SNOWFLAKE_PAT") or os.getenv("SNOWFLAKE_PASSWORD")
-        
-        if not account_identifier or not username or not pat:
-            raise ValidationException("Missing required Snowflake credentials: SNOWFLAKE_ACCOUNT, SNOWFLAKE_USER, and SNOWFLAKE_PAT/SNOWFLAKE_PASSWORD", "credentials", "environment")
-        
-        return account_identifier, username, pat
-    
     @mcp.tool(
         name="insert_data",
         description="Insert new data into a Snowflake table",
-        tags={"database", "dml", "insert", "data"}
+        tags=_INSERT_TAGS
     )
+    @_dml_tool("Insert failed")
     async def insert_data(
         table_name: str,
         data: dict,
         connection_name: str = "default",
+        response_format: ResponseFormat = "json",
         ctx: Context = None
     ) -> str:
         """
@@ -56,12 +175,15 @@ def register_dml_tools(mcp: FastMCP):
         
         This tool inserts a new record into the specified table. The data should
         be provided as a dictionary where keys are column names and values are
-        the data to insert. Complex data types will be automatically converted to JSON.
+        the data to insert. Lists and dictionaries are stored as semi-structured
+        values via PARSE_JSON.
         
         Args:
             table_name: Full table name (DATABASE.SCHEMA.TABLE)
             data: Dictionary containing column names and values to insert
             connection_name: Which connection to use for the operation
+            response_format: "json" for a compact JSON result (default) or
+                "pretty" for a formatted, human-readable summary
             
         Returns:
             Success message with insertion details
@@ -70,80 +192,223 @@ def register_dml_tools(mcp: FastMCP):
             table_name = "MY_DATABASE.PUBLIC.CUSTOMERS"
             data = {"id": "CUST_001", "name": "John Doe", "email": "john@example.com"}
         """
-        try:
+        if _DEBUG:
             await ctx.info(f"Inserting data into table: {table_name}")
+        
+        # Validate inputs with specific exceptions
+        if not table_name or not table_name.strip():
+            raise ValidationException("Table name cannot be empty", "table_name", table_name)
+        
+        if not data or not isinstance(data, dict):
+            raise ValidationException("Data must be a non-empty dictionary", "data", str(data))
+        
+        # Prepare data for insertion; complex values are parsed as JSON by the manager
+        columns = list(data.keys())
+        values = list(data.values())
+        
+        dml_manager = _dml_manager()
+        
+        # Insert data using manager
+        dml_response = await dml_manager.insert_data_async(
+            table_name=table_name,
+            columns=columns,
+            values=values
+        )
+        
+        if not dml_response["success"]:
+            raise DMLException(dml_response["message"], "INSERT", table_name)
+        
+        response_data = response_handler.parse_dml_response_dict(dml_response)
+        
+        if _DEBUG:
+            await ctx.info(f"Data inserted successfully into {table_name}")
+        if response_format == "json":
+            return _json_result(table=table_name, columns=columns, rows_affected=response_data["rows_affected"])
+        return f"""Data inserted successfully into '{table_name}'!
+
+            📊 Columns: {', '.join(columns)}
+            📝 Rows affected: {response_data['rows_affected']}
+            ✅ Operation completed successfully"""
+    
+    @mcp.tool(
+        name="insert_data_bulk",
+        description="Insert many rows into a Snowflake table with batched multi-row INSERTs",
+        tags=_BULK_INSERT_TAGS
+    )
+    @_dml_tool("Bulk insert failed")
+    async def insert_data_bulk(
+        table_name: str,
+        rows: List[dict],
+        batch_size: int = MAX_BATCH_SIZE,
+        connection_name: str = "default",
+        response_format: ResponseFormat = "json",
+        ctx: Context = None
+    ) -> str:
+        """
+        Insert many rows into a Snowflake table in batches.
+        
+        Each batch of up to batch_size rows is sent as one multi-row INSERT,
+        so N rows cost one round-trip per batch instead of one per row. All
+        batches run in a single transaction. Inserts of more than 16,384 rows
+        are loaded through the table stage instead, as with bulk_load_data.
+        Every row must have the same keys; complex data types are converted
+        to JSON.
+        
+        Args:
+            table_name: Full table name (DATABASE.SCHEMA.TABLE)
+            rows: List of dictionaries mapping column names to values
+            batch_size: Maximum number of rows per INSERT batch (default and maximum: 1000)
+            connection_name: Which connection to use for the operation
+            response_format: "json" for a compact JSON result (default) or
+                "pretty" for a formatted, human-readable summary
             
-            # Validate inputs with specific exceptions
-            if not table_name or not table_name.strip():
-                raise ValidationException("Table name cannot be empty", "table_name", table_name)
-            
-            if not data or not isinstance(data, dict):
-                raise ValidationException("Data must be a non-empty dictionary", "data", str(data))
-            
-            # Prepare data for insertion
-            columns = list(data.keys())
-            values = list(data.values())
-            
-            # Convert complex objects to JSON strings
-            for i, value in enumerate(values):
-                if isinstance(value, (list, dict)):
-                    values[i] = json.dumps(value)
+        Returns:
+            Success message with insertion details
             
-            # Get Snowflake credentials and create DML manager
-            account_identifier, username, pat = get_snowflake_credentials()
-            dml_manager = DMLManager(
-                account_identifier=account_identifier,
-                username=username,
-                password=pat
+        Example:
+            table_name = "MY_DATABASE.PUBLIC.CUSTOMERS"
+            rows = [{"id": "CUST_001", "name": "John Doe"}, {"id": "CUST_002", "name": "Jane Doe"}]
+        """
+        if _DEBUG:
+            await ctx.info(f"Bulk inserting {len(rows) if rows else 0} rows into table: {table_name}")
+        
+        # Validate inputs with specific exceptions
+        if not table_name or not table_name.strip():
+            raise ValidationException("Table name cannot be empty", "table_name", table_name)
+        
+        if batch_size < 1:
+            raise ValidationException("Batch size must be at least 1", "batch_size", str(batch_size))
+        batch_size = min(batch_size, MAX_BATCH_SIZE)
+        
+        columns, values = _rows_to_values(rows)
+        
+        dml_manager = _dml_manager()
+        
+        # Very large inserts outgrow INSERT statement text - load them through the table stage
+        start = time.perf_counter()
+        if len(values) > BULK_LOAD_ROW_THRESHOLD:
+            dml_response = await dml_manager.bulk_load_async(
+                table_name=table_name,
+                columns=columns,
+                rows=values
             )
-            
-            # Insert data using manager
-            dml_response = dml_manager.insert_data(
+            batches = 0
+            method = "📦 Method: PUT + COPY INTO via table stage"
+        else:
+            dml_response = await dml_manager.bulk_insert_async(
                 table_name=table_name,
                 columns=columns,
-                values=values
+                rows=values,
+                batch_size=batch_size
             )
+            batches = -(-len(values) // batch_size)
+            method = f"📦 Batches: {batches} (up to {batch_size} rows each)"
+        elapsed = time.perf_counter() - start
+        
+        if not dml_response["success"]:
+            raise DMLException(dml_response["message"], "INSERT", table_name)
+        
+        if _DEBUG:
+            await ctx.info(f"Inserted {len(values)} rows into {table_name} ({elapsed:.3f}s)")
+        if response_format == "json":
+            return _json_result(
+                table=table_name,
+                columns=columns,
+                rows_affected=dml_response["rows_affected"],
+                batches=batches
+            )
+        return "\n".join([
+            f"Data inserted successfully into '{table_name}'!",
+            "",
+            f"📊 Columns: {', '.join(columns)}",
+            method,
+            f"📝 Rows affected: {dml_response['rows_affected']}",
+            "✅ Operation completed successfully"
+        ])
+    
+    @mcp.tool(
+        name="bulk_load_data",
+        description="Load many rows into a Snowflake table through its stage with PUT and COPY INTO",
+        tags=_BULK_LOAD_TAGS
+    )
+    @_dml_tool("Bulk load failed")
+    async def bulk_load_data(
+        table_name: str,
+        rows: List[dict],
+        connection_name: str = "default",
+        response_format: ResponseFormat = "json",
+        ctx: Context = None
+    ) -> str:
+        """
+        Load many rows into a Snowflake table via PUT and COPY INTO.
+        
+        The rows are written to a compressed CSV file, uploaded to the table's
+        stage and loaded with a single COPY INTO. This is the fastest way to
+        insert large row counts. Every row must have the same keys; complex
+        data types are converted to JSON.
+        
+        Args:
+            table_name: Full table name (DATABASE.SCHEMA.TABLE)
+            rows: List of dictionaries mapping column names to values
+            connection_name: Which connection to use for the operation
+            response_format: "json" for a compact JSON result (default) or
+                "pretty" for a formatted, human-readable summary
             
-            if not dml_response["success"]:
-                raise DMLException(dml_response["message"], "INSERT", table_name)
-            
-            parsed_response = response_handler.parse_dml_response(dml_response)
-            response_data = json.loads(parsed_response)
+        Returns:
+            Success message with load details
             
-            await ctx.info(f"Data inserted successfully into {table_name}")
-            return f"""Data inserted successfully into '{table_name}'!
-
-            📊 Columns: {', '.join(columns)}
-            📝 Rows affected: {response_data['rows_affected']}
-            ✅ Operation completed successfully"""
-                
-        except ValidationException as e:
-            await ctx.error(f"Validation error: {str(e)}")
-            raise ToolError(f"Validation error: {str(e)}")
-        except DMLException as e:
-            await ctx.error(f"DML operation failed: {e.message}")
-            raise ToolError(f"DML operation failed: {e.message}")
-        except SnowflakeException as e:
-            # Convert generic Snowflake exceptions to DML exceptions for better context
-            dml_error = DMLException(f"Insert operation failed: {e.message}", "INSERT", table_name)
-            await ctx.error(f"Insert failed: {dml_error.message}")
-            raise ToolError(f"Insert failed: {dml_error.message}")
-        except Exception as e:
-            dml_error = DMLException(f"Unexpected error during insert: {str(e)}", "INSERT", table_name)
-            await ctx.error(f"Unexpected insert error: {dml_error.message}")
-            raise ToolError(f"Unexpected insert error: {dml_error.message}")
+        Example:
+            table_name = "MY_DATABASE.PUBLIC.EVENTS"
+            rows = [{"id": 1, "kind": "click"}, {"id": 2, "kind": "view"}]
+        """
+        if _DEBUG:
+            await ctx.info(f"Bulk loading {len(rows) if rows else 0} rows into table: {table_name}")
+        
+        # Validate inputs with specific exceptions
+        if not table_name or not table_name.strip():
+            raise ValidationException("Table name cannot be empty", "table_name", table_name)
+        
+        columns, values = _rows_to_values(rows)
+        
+        dml_manager = _dml_manager()
+        
+        # Stage and copy the rows using manager
+        start = time.perf_counter()
+        dml_response = await dml_manager.bulk_load_async(
+            table_name=table_name,
+            columns=columns,
+            rows=values
+        )
+        elapsed = time.perf_counter() - start
+        
+        if not dml_response["success"]:
+            raise DMLException(dml_response["message"], "COPY", table_name)
+        
+        if _DEBUG:
+            await ctx.info(f"Loaded {len(values)} rows into {table_name} ({elapsed:.3f}s)")
+        if response_format == "json":
+            return _json_result(table=table_name, columns=columns, rows_affected=dml_response["rows_affected"])
+        return "\n".join([
+            f"Data loaded successfully into '{table_name}'!",
+            "",
+            f"📊 Columns: {', '.join(columns)}",
+            f"📝 Rows loaded: {dml_response['rows_affected']}",
+            "✅ Operation completed successfully"
+        ])
     
     @mcp.tool(
         name="query_data",
         description="Query data from a Snowflake table with filtering options",
-        tags={"database", "dml", "select", "query"}
+        tags=_QUERY_TAGS
     )
+    @_dml_tool("Data query failed")
     async def query_data(
         table_name: str,
         columns: Optional[List[str]] = None,
         where_clause: Optional[str] = None,
         limit: Optional[int] = 100,
         connection_name: str = "default",
+        response_format: ResponseFormat = "json",
         ctx: Context = None
     ) -> str:
         """
@@ -156,8 +421,14 @@ def register_dml_tools(mcp: FastMCP):
             table_name: Full table name (DATABASE.SCHEMA.TABLE)
             columns: List of column names to retrieve (None for all columns)
             where_clause: SQL WHERE clause for filtering (None for all rows)
-            limit: Maximum number of rows to return (default: 100)
+            limit: Maximum number of rows to return (default: 100). With no
+                limit, or one above 1000, rows are fetched in batches and the
+                pretty format lists them as NDJSON, one JSON object per line.
+                Streamed reads return at most 100,000 rows and say so when
+                more are available
             connection_name: Which connection to use for the operation
+            response_format: "json" for a compact JSON result (default) or
+                "pretty" for a formatted, human-readable summary
             
         Returns:
             Formatted results with the queried data
@@ -168,159 +439,209 @@ def register_dml_tools(mcp: FastMCP):
             where_clause = "created_at > '2024-01-01'"
             limit = 50
         """
-        try:
+        if _DEBUG:
             await ctx.info(f"Querying data from table: {table_name}")
-            
-            # Get Snowflake credentials and create DML manager
-            account_identifier, username, pat = get_snowflake_credentials()
-            dml_manager = DMLManager(
-                account_identifier=account_identifier,
-                username=username,
-                password=pat
-            )
-            
-            # Select data using manager
-            dml_response = dml_manager.select_data(
+        
+        dml_manager = _dml_manager()
+        
+        # Large or unbounded reads are streamed batch by batch and rendered
+        # as NDJSON, one compact JSON object per line
+        if limit is None or limit > STREAM_ROW_THRESHOLD:
+            # When the cap applies, one row past it tells a truncated read from a complete one
+            capped = limit is None or limit > MAX_STREAM_ROWS
+            max_rows = MAX_STREAM_ROWS if capped else limit
+            lines = []
+            async for batch in dml_manager.select_data_batches_async(
                 table_name=table_name,
                 columns=columns,
                 where_clause=where_clause,
-                order_by=None,  # Will add order_by to tool parameters if needed
-                limit=limit,
-                offset=None   # Will add offset to tool parameters if needed
-            )
-            
-            if not dml_response["success"]:
-                raise DMLException(dml_response["message"], "SELECT", table_name)
-            
-            # Convert results back to formatted results for display
-            results_strings = dml_response.get("results", [])
-            formatted_results = []
-            for result_str in results_strings:
-                try:
-                    # Try to parse as JSON if it looks like structured data
-                    if result_str.startswith('(') and result_str.endswith(')'):
-                        # Handle tuple-like string representation
-                        formatted_results.append({"data": result_str})
-                    else:
-                        formatted_results.append({"data": result_str})
-                except:
-                    formatted_results.append({"data": result_str})
-            
-            parsed_response = response_handler.parse_dml_response(dml_response)
-            response_data = json.loads(parsed_response)
-            
-            await ctx.info(f"Data retrieved successfully from {table_name}")
-            
-            # Format the results for display
-            if formatted_results:
-                results_text = []
-                for i, row in enumerate(formatted_results, 1):
-                    results_text.append(f"Row {i}: {json.dumps(row, indent=2, default=str)}")
-                
-                results_display = "\n\n".join(results_text)
-                    
-                return f"""Data retrieved from '{table_name}':
-
-                📊 Total rows: {len(formatted_results)}
-                📋 Columns: {', '.join(columns) if columns else 'All columns'}
-                🔍 Filter: {where_clause if where_clause else 'No filter'}
-                📄 Limit: {limit if limit else 'No limit'}
-
-                📈 Results:
-                {results_display}"""
-            else:
+                limit=max_rows + 1 if capped else max_rows
+            ):
+                lines.extend([_dumps(row) for row in batch])
+            truncated = len(lines) > max_rows
+            if truncated:
+                del lines[max_rows:]
+            
+            if _DEBUG:
+                await ctx.info(f"Data streamed successfully from {table_name}")
+            
+            if response_format == "json":
+                # Rows are already encoded - splice them into the result object
+                return (
+                    f'{{"status":"ok","table":{_dumps(table_name)},"row_count":{len(lines)},'
+                    f'"truncated":{_dumps(truncated)},"rows":[{",".join(lines)}]}}'
+                )
+            if not lines:
                 return f"No data found in '{table_name}' matching the specified criteria."
-                
-        except SnowflakeException as e:
-            await ctx.error(f"Data query failed: {e.message}")
-            raise ToolError(f"Data query failed: {e.message}")
-        except Exception as e:
-            await ctx.error(f"Unexpected error: {str(e)}")
-            raise ToolError(f"Unexpected error: {str(e)}")
+            output = [
+                f"Data retrieved from '{table_name}':",
+                "",
+                f"📊 Total rows: {len(lines)}",
+                f"📋 Columns: {', '.join(columns) if columns else 'All columns'}",
+                f"🔍 Filter: {where_clause if where_clause else 'No filter'}",
+                f"📄 Limit: {limit if limit else 'No limit'}",
+                "",
+                "📈 Results (NDJSON):",
+                *lines
+            ]
+            if truncated:
+                output.extend(["", f"⚠️ Output truncated to the first {max_rows} rows; more rows are available (narrow where_clause to see them)"])
+            return "\n".join(output)
+        
+        # Select data using manager
+        dml_response = await dml_manager.select_data_async(
+            table_name=table_name,
+            columns=columns,
+            where_clause=where_clause,
+            order_by=None,  # Will add order_by to tool parameters if needed
+            limit=limit,
+            offset=None   # Will add offset to tool parameters if needed
+        )
+        
+        if not dml_response["success"]:
+            raise DMLException(dml_response["message"], "SELECT", table_name)
+        
+        results = dml_response.get("results") or []
+        
+        if _DEBUG:
+            await ctx.info(f"Data retrieved successfully from {table_name}")
+        
+        if response_format == "json":
+            return _json_result(table=table_name, row_count=len(results), rows=results)
+        
+        if not results:
+            return f"No data found in '{table_name}' matching the specified criteria."
+        
+        # Format the results for display in a single pass, one compact JSON row per line
+        buf = io.StringIO()
+        write = buf.write
+        write(f"Data retrieved from '{table_name}':\n\n")
+        write(f"📊 Total rows: {len(results)}\n")
+        write(f"📋 Columns: {', '.join(columns) if columns else 'All columns'}\n")
+        write(f"🔍 Filter: {where_clause if where_clause else 'No filter'}\n")
+        write(f"📄 Limit: {limit if limit else 'No limit'}\n\n")
+        write("📈 Results:")
+        for i, row in enumerate(results, 1):
+            write("\nRow ")
+            write(str(i))
+            write(": ")
+            write(_dumps(row))
+        return buf.getvalue()
     
     @mcp.tool(
         name="update_data",
         description="Update existing data in a Snowflake table",
-        tags={"database", "dml", "update", "modify"}
+        tags=_UPDATE_TAGS
     )
+    @_dml_tool("Data update failed")
     async def update_data(
         table_name: str,
-        set_clause: str,
-        where_clause: str,
+        set_clause: Optional[str] = None,
+        where_clause: str = "",
+        set_params: Optional[Dict[str, Any]] = None,
+        where_params: Optional[List[Any]] = None,
         connection_name: str = "default",
+        response_format: ResponseFormat = "json",
         ctx: Context = None
     ) -> str:
         """
         Update existing data in a Snowflake table.
         
         This tool modifies existing records in the specified table. You must
-        provide both the SET clause (what to update) and WHERE clause (which
-        records to update) for safety.
+        provide both what to update and a WHERE clause (which records to
+        update) for safety. New values are best passed as set_params, which
+        binds them instead of embedding literals in SQL.
         
         Args:
             table_name: Full table name (DATABASE.SCHEMA.TABLE)
-            set_clause: SQL SET clause (e.g., "name = 'New Name', status = 'Active'")
-            where_clause: SQL WHERE clause to identify records to update
+            set_clause: SQL SET clause (e.g., "name = 'New Name', status = 'Active'");
+                ignored when set_params is given
+            where_clause: SQL WHERE clause to identify records to update (REQUIRED),
+                optionally with %s placeholders filled from where_params
+            set_params: Dictionary of column names and new values, bound as parameters
+            where_params: Values bound to the %s placeholders in where_clause, in order
             connection_name: Which connection to use for the operation
+            response_format: "json" for a compact JSON result (default) or
+                "pretty" for a formatted, human-readable summary
             
         Returns:
             Success message with update details
             
         Example:
             table_name = "MY_DATABASE.PUBLIC.CUSTOMERS"
-            set_clause = "status = 'Premium', updated_at = CURRENT_TIMESTAMP()"
-            where_clause = "id = 'CUST_001'"
+            set_params = {"status": "Premium"}
+            where_clause = "id = %s"
+            where_params = ["CUST_001"]
         """
-        try:
-            await ctx.info(f"Updating data in table: {table_name}")
-            await ctx.info(f"SET: {set_clause}")
-            await ctx.info(f"WHERE: {where_clause}")
-            
-            # Parse set_clause into columns and values
-            # For now, we'll execute the raw SET clause since the current API expects it
-            # This maintains backward compatibility while using the manager
-            
-            # Get Snowflake credentials and create DML manager
-            account_identifier, username, pat = get_snowflake_credentials()
-            dml_manager = DMLManager(
-                account_identifier=account_identifier,
-                username=username,
-                password=pat
+        if _DEBUG:
+            await ctx.info(
+                f"Updating data in table: {table_name}\n"
+                f"SET: {set_params if set_params else set_clause}\n"
+                f"WHERE: {where_clause}"
             )
-            
-            # Execute raw UPDATE using manager's execute_dml method
-            update_sql = f"UPDATE {table_name} SET {set_clause} WHERE {where_clause}"
-            dml_response = dml_manager.execute_dml(update_sql)
-            
-            if not dml_response["success"]:
-                raise DMLException(dml_response["message"], "UPDATE", table_name)
-            
-            rows_affected = dml_response["rows_affected"]
-            
+        
+        # Validate inputs with specific exceptions
+        if not set_params and (not set_clause or not set_clause.strip()):
+            raise ValidationException("Either set_params or set_clause is required for UPDATE operations", "set_clause", set_clause)
+        
+        if not where_clause or not where_clause.strip():
+            raise ValidationException("WHERE clause is required for UPDATE operations", "where_clause", where_clause)
+        
+        dml_manager = _dml_manager()
+        
+        if set_params:
+            # Bind the new values using manager
+            dml_response = await dml_manager.update_data_async(
+                table_name=table_name,
+                set_columns=list(set_params.keys()),
+                set_values=[
+                    _dumps(value) if isinstance(value, (list, dict)) else value
+                    for value in set_params.values()
+                ],
+                where_clause=where_clause,
+                where_params=where_params
+            )
+        else:
+            # Execute the raw SET clause using manager's execute_dml method;
+            # with binds, literal % in the SET clause must be doubled
+            _validate_fqtn(table_name, "UPDATE")
+            if where_params:
+                update_sql = f"UPDATE {table_name} SET {set_clause.replace('%', '%%')} WHERE {where_clause}"
+                dml_response = await dml_manager.execute_dml_async(update_sql, where_params)
+            else:
+                update_sql = f"UPDATE {table_name} SET {set_clause} WHERE {where_clause}"
+                dml_response = await dml_manager.execute_dml_async(update_sql)
+        
+        if not dml_response["success"]:
+            raise DMLException(dml_response["message"], "UPDATE", table_name)
+        
+        rows_affected = dml_response["rows_affected"]
+        
+        if _DEBUG:
             await ctx.info(f"Data updated successfully in {table_name}")
-            return f"""Data updated successfully in '{table_name}'!
-
-            🔄 SET clause: {set_clause}
-            🎯 WHERE clause: {where_clause}
-            📝 Rows affected: {rows_affected}
-            ✅ Operation completed successfully"""
-                
-        except SnowflakeException as e:
-            await ctx.error(f"Data update failed: {e.message}")
-            raise ToolError(f"Data update failed: {e.message}")
-        except Exception as e:
-            await ctx.error(f"Unexpected error: {str(e)}")
-            raise ToolError(f"Unexpected error: {str(e)}")
+        if response_format == "json":
+            return _json_result(table=table_name, rows_affected=rows_affected)
+        return "\n".join([
+            f"Data updated successfully in '{table_name}'!",
+            "",
+            f"🔄 SET: {', '.join(set_params) if set_params else set_clause}",
+            f"🎯 WHERE clause: {where_clause}",
+            f"📝 Rows affected: {rows_affected}",
+            "✅ Operation completed successfully"
+        ])
     
     @mcp.tool(
         name="delete_data",
         description="Delete data from a Snowflake table with safety checks",
-        tags={"database", "dml", "delete", "remove"}
+        tags=_DELETE_TAGS
     )
+    @_dml_tool("Data deletion failed")
     async def delete_data(
         table_name: str,
         where_clause: str,
+        where_params: Optional[List[Any]] = None,
         connection_name: str = "default",
+        response_format: ResponseFormat = "json",
         ctx: Context = None
     ) -> str:
         """
@@ -332,8 +653,12 @@ def register_dml_tools(mcp: FastMCP):
         
         Args:
             table_name: Full table name (DATABASE.SCHEMA.TABLE)
-            where_clause: SQL WHERE clause to identify records to delete (REQUIRED)
+            where_clause: SQL WHERE clause to identify records to delete (REQUIRED),
+                optionally with %s placeholders filled from where_params
+            where_params: Values bound to the %s placeholders in where_clause, in order
             connection_name: Which connection to use for the operation
+            response_format: "json" for a compact JSON result (default) or
+                "pretty" for a formatted, human-readable summary
             
         Returns:
             Success message with deletion details
@@ -342,68 +667,66 @@ def register_dml_tools(mcp: FastMCP):
             table_name = "MY_DATABASE.PUBLIC.CUSTOMERS"
             where_clause = "status = 'Inactive' AND last_login < '2023-01-01'"
         """
-        try:
-            await ctx.info(f"Deleting data from table: {table_name}")
-            await ctx.warning(f"WHERE clause: {where_clause}")
-            await ctx.warning("This operation will permanently delete data!")
-            
-            # Validate WHERE clause
-            if not where_clause or where_clause.strip() == "":
-                raise ValidationException("WHERE clause is required for DELETE operations to prevent accidental data loss", "where_clause", where_clause)
-            
-            # Get Snowflake credentials and create DML manager
-            account_identifier, username, pat = get_snowflake_credentials()
-            dml_manager = DMLManager(
-                account_identifier=account_identifier,
-                username=username,
-                password=pat
-            )
-            
-            # Delete data using manager
-            dml_response = dml_manager.delete_data(
-                table_name=table_name,
-                where_clause=where_clause
-            )
-            
-            if not dml_response["success"]:
-                raise DMLException(dml_response["message"], "DELETE", table_name)
-            
-            rows_affected = dml_response["rows_affected"]
-            
+        await ctx.warning(
+            f"Deleting data from table: {table_name}\n"
+            f"WHERE clause: {where_clause}\n"
+            "This operation will permanently delete data!"
+        )
+        
+        # Validate WHERE clause
+        if not where_clause or where_clause.strip() == "":
+            raise ValidationException("WHERE clause is required for DELETE operations to prevent accidental data loss", "where_clause", where_clause)
+        
+        dml_manager = _dml_manager()
+        
+        # Delete data using manager
+        dml_response = await dml_manager.delete_data_async(
+            table_name=table_name,
+            where_clause=where_clause,
+            where_params=where_params
+        )
+        
+        if not dml_response["success"]:
+            raise DMLException(dml_response["message"], "DELETE", table_name)
+        
+        rows_affected = dml_response["rows_affected"]
+        
+        if _DEBUG:
             await ctx.info(f"Data deleted successfully from {table_name}")
-            return f"""Data deleted successfully from '{table_name}'!
+        if response_format == "json":
+            return _json_result(table=table_name, rows_affected=rows_affected)
+        return f"""Data deleted successfully from '{table_name}'!
 
             🎯 WHERE clause: {where_clause}
             📝 Rows affected: {rows_affected}
             ⚠️ This operation cannot be undone
             ✅ Operation completed successfully"""
-                
-        except SnowflakeException as e:
-            await ctx.error(f"Data deletion failed: {e.message}")
-            raise ToolError(f"Data deletion failed: {e.message}")
-        except Exception as e:
-            await ctx.error(f"Unexpected error: {str(e)}")
-            raise ToolError(f"Unexpected error: {str(e)}")
     
     @mcp.tool(
         name="execute_dml_statement",
         description="Execute a custom DML statement for data operations",
-        tags={"database", "dml", "custom", "query"}
+        tags=_EXECUTE_TAGS
     )
+    @_dml_tool("DML execution failed")
     async def execute_dml_statement(
         dml_statement: str,
         connection_name: str = "default",
+        response_format: ResponseFormat = "json",
         ctx: Context = None
     ) -> str:
         """
         Execute a custom DML statement for data operations.
         
         This tool allows you to execute any Data Manipulation Language statement
-        to insert, update, delete, or query data using custom SQL.
+        to insert, update, delete, or query data using custom SQL. Transaction
+        and session statements (BEGIN, COMMIT, USE, ALTER SESSION) are rejected,
+        since the connection is shared by every caller.
         
         Args:
             dml_statement: The DML SQL statement to execute
             connection_name: Which connection to use for the operation
+            response_format: "json" for a compact JSON result (default) or
+                "pretty" for a formatted, human-readable summary
             
         Returns:
             Success message with execution details
@@ -411,67 +734,52 @@ def register_dml_tools(mcp: FastMCP):
         Example:
             dml_statement = "SELECT COUNT(*) FROM my_table WHERE status = 'active'"
         """
-        try:
-            # Validate DML statement
-            if not dml_statement or not dml_statement.strip():
-                raise ValidationException("DML statement cannot be empty", "dml_statement", dml_statement)
-            
+        # Validate DML statement
+        if not dml_statement or not dml_statement.strip():
+            raise ValidationException("DML statement cannot be empty", "dml_statement", dml_statement)
+        
+        if _DEBUG:
             await ctx.info(f"Executing DML statement: {dml_statement}")
-            
-            # Get Snowflake credentials and create DML manager
-            account_identifier, username, pat = get_snowflake_credentials()
-            dml_manager = DMLManager(
-                account_identifier=account_identifier,
-                username=username,
-                password=pat
-            )
-            
-            # Execute DML using manager
-            dml_response = dml_manager.execute_dml(dml_statement)
-            
-            if not dml_response["success"]:
-                raise DMLException(dml_response["message"], "EXECUTE", dml_statement)
-            
-            # Use response handler for consistent formatting
-            parsed_response = response_handler.parse_dml_response(dml_response)
-            response_data = json.loads(parsed_response)
-            
+        
+        dml_manager = _dml_manager()
+        
+        # Execute DML using manager
+        dml_response = await dml_manager.execute_dml_async(dml_statement)
+        
+        if not dml_response["success"]:
+            raise DMLException(dml_response["message"], "EXECUTE", dml_statement)
+        
+        # Use response handler for consistent formatting
+        response_data = response_handler.parse_dml_response_dict(dml_response)
+        
+        if _DEBUG:
             await ctx.info("DML statement executed successfully")
-            return f"""DML statement executed successfully!
+        if response_format == "json":
+            return _json_result(
+                rows_affected=response_data["rows_affected"],
+                row_count=len(response_data["results"])
+            )
+        return f"""DML statement executed successfully!
 
             📝 Statement: {dml_statement}
             ✅ Operation completed successfully
             📊 Rows affected: {response_data['rows_affected']}
             📈 Results: {len(response_data['results'])} rows returned"""
-                
-        except ValidationException as e:
-            await ctx.error(f"Validation error: {str(e)}")
-            raise ToolError(f"Validation error: {str(e)}")
-        except DMLException as e:
-            await ctx.error(f"DML operation failed: {e.message}")
-            raise ToolError(f"DML operation failed: {e.message}")
-        except SnowflakeException as e:
-            # Convert generic Snowflake exceptions to DML exceptions for better context
-            dml_error = DMLException(f"DML execution failed: {e.message}", "EXECUTE", dml_statement)
-            await ctx.error(f"DML execution failed: {dml_error.message}")
-            raise ToolError(f"DML execution failed: {dml_error.message}")
-        except Exception as e:
-            dml_error = DMLException(f"Unexpected error during DML execution: {str(e)}", "EXECUTE", dml_statement)
-            await ctx.error(f"Unexpected DML error: {dml_error.message}")
-            raise ToolError(f"Unexpected DML error: {dml_error.message}")
     
     @mcp.tool(
         name="merge_data",
         description="Perform a MERGE operation to synchronize data between tables",
-        tags={"database", "dml", "merge", "upsert"}
+        tags=_MERGE_TAGS
     )
+    @_dml_tool("MERGE failed")
     async def merge_data(
         target_table: str,
         source_table: str,
         merge_condition: str,
-        match_actions: List[Dict[str, Union[str, List[str], List[Union[str, int, float, bool, None]]]]],
-        not_match_actions: Optional[List[Dict[str, Union[str, List[str], List[Union[str, int, float, bool, None]]]]]] = None,
+        match_actions: List[MergeAction],
+        not_match_actions: Optional[List[MergeAction]] = None,
         connection_name: str = "default",
+        response_format: ResponseFormat = "json",
         ctx: Context = None
     ) -> str:
         """
@@ -488,6 +796,8 @@ def register_dml_tools(mcp: FastMCP):
             match_actions: List of actions when records match (UPDATE/DELETE)
             not_match_actions: Optional list of actions when records don't match (INSERT)
             connection_name: Which connection to use for the operation
+            response_format: "json" for a compact JSON result (default) or
+                "pretty" for a formatted, human-readable summary
             
         Returns:
             Success message with merge operation details
@@ -511,88 +821,67 @@ def register_dml_tools(mcp: FastMCP):
                 }
             ]
         """
-        try:
-            await ctx.info(f"Performing MERGE operation on target table: {target_table}")
-            await ctx.info(f"Source: {source_table}")
-            await ctx.info(f"Merge condition: {merge_condition}")
-            
-            # Validate inputs
-            if not target_table or not target_table.strip():
-                raise ValidationException("Target table name cannot be empty", "target_table", target_table)
-            
-            if not source_table or not source_table.strip():
-                raise ValidationException("Source table name cannot be empty", "source_table", source_table)
-            
-            if not merge_condition or not merge_condition.strip():
-                raise ValidationException("Merge condition cannot be empty", "merge_condition", merge_condition)
-            
-            if not match_actions or len(match_actions) == 0:
-                raise ValidationException("At least one match action is required", "match_actions", str(match_actions))
-            
-            # Get Snowflake credentials and create DML manager
-            account_identifier, username, pat = get_snowflake_credentials()
-            dml_manager = DMLManager(
-                account_identifier=account_identifier,
-                username=username,
-                password=pat
+        if _DEBUG:
+            await ctx.info(
+                f"Performing MERGE operation on target table: {target_table}\n"
+                f"Source: {source_table}\n"
+                f"Merge condition: {merge_condition}"
             )
-            
-            # Perform MERGE using manager
-            dml_response = dml_manager.merge_data(
-                target_table=target_table,
-                source_table=source_table,
-                merge_condition=merge_condition,
-                match_actions=match_actions,
-                not_match_actions=not_match_actions
-            )
-            
-            if not dml_response["success"]:
-                raise DMLException(dml_response["message"], "MERGE", target_table)
-            
-            # Use response handler for consistent formatting
-            parsed_response = response_handler.parse_dml_response(dml_response)
-            response_data = json.loads(parsed_response)
-            
-            rows_affected = dml_response["rows_affected"]
-            
-            # Format action summary
-            match_summary = []
-            for action in match_actions:
-                match_summary.append(f"  • WHEN MATCHED: {action['action']}")
-            
-            not_match_summary = []
-            if not_match_actions:
-                for action in not_match_actions:
-                    not_match_summary.append(f"  • WHEN NOT MATCHED: {action['action']}")
-            
+        
+        # Validate inputs
+        if not target_table or not target_table.strip():
+            raise ValidationException("Target table name cannot be empty", "target_table", target_table)
+        
+        if not source_table or not source_table.strip():
+            raise ValidationException("Source table name cannot be empty", "source_table", source_table)
+        
+        if not merge_condition or not merge_condition.strip():
+            raise ValidationException("Merge condition cannot be empty", "merge_condition", merge_condition)
+        
+        if not match_actions or len(match_actions) == 0:
+            raise ValidationException("At least one match action is required", "match_actions", str(match_actions))
+        
+        dml_manager = _dml_manager()
+        
+        # Perform MERGE using manager
+        dml_response = await dml_manager.merge_data_async(
+            target_table=target_table,
+            source_table=source_table,
+            merge_condition=merge_condition,
+            match_actions=match_actions,
+            not_match_actions=not_match_actions
+        )
+        
+        if not dml_response["success"]:
+            raise DMLException(dml_response["message"], "MERGE", target_table)
+        
+        rows_affected = dml_response["rows_affected"]
+        
+        if _DEBUG:
             await ctx.info(f"MERGE operation completed successfully on {target_table}")
-            return f"""MERGE operation completed successfully!
-
-            🎯 Target table: {target_table}
-            📥 Source: {source_table}
-            🔗 Merge condition: {merge_condition}
-            
-            📋 Match actions:
-            {chr(10).join(match_summary)}
-            
-            {f'''📋 Not match actions:
-            {chr(10).join(not_match_summary)}''' if not_match_actions else '📋 No not-match actions specified'}
-            
-            📝 Rows affected: {rows_affected}
-            ✅ Operation completed successfully"""
-                
-        except ValidationException as e:
-            await ctx.error(f"Validation error: {str(e)}")
-            raise ToolError(f"Validation error: {str(e)}")
-        except DMLException as e:
-            await ctx.error(f"MERGE operation failed: {e.message}")
-            raise ToolError(f"MERGE operation failed: {e.message}")
-        except SnowflakeException as e:
-            # Convert generic Snowflake exceptions to DML exceptions for better context
-            dml_error = DMLException(f"MERGE operation failed: {e.message}", "MERGE", target_table)
-            await ctx.error(f"MERGE failed: {dml_error.message}")
-            raise ToolError(f"MERGE failed: {dml_error.message}")
-        except Exception as e:
-            dml_error = DMLException(f"Unexpected error during MERGE: {str(e)}", "MERGE", target_table)
-            await ctx.error(f"Unexpected MERGE error: {dml_error.message}")
-            raise ToolError(f"Unexpected MERGE error: {dml_error.message}")
\ No newline at end of file
+        if response_format == "json":
+            return _json_result(table=target_table, rows_affected=rows_affected)
+        
+        # Format action summary
+        lines = [
+            "MERGE operation completed successfully!",
+            "",
+            f"🎯 Target table: {target_table}",
+            f"📥 Source: {source_table}",
+            f"🔗 Merge condition: {merge_condition}",
+            "",
+            "📋 Match actions:",
+            *(f"  • WHEN MATCHED: {action['action']}" for action in match_actions),
+            ""
+        ]
+        if not_match_actions:
+            lines.append("📋 Not match actions:")
+            lines.extend(f"  • WHEN NOT MATCHED: {action['action']}" for action in not_match_actions)
+        else:
+            lines.append("📋 No not-match actions specified")
+        lines.extend([
+            "",
+            f"📝 Rows affected: {rows_affected}",
+            "✅ Operation completed successfully"
+        ])
+        return "\n".join(lines)
\ No newline at end of file
@@ -9,14 +9,271 @@ Tools handle operations like warehouse management, object inspection, and permis
 
 from fastmcp import FastMCP, Context
 from fastmcp.exceptions import ToolError
-from typing import Dict, List, Optional, Union
-import json
+from typing import Any, Dict, List, NoReturn, Optional, Tuple, Union
+import asyncio
+import functools
+import io
 from ..core.exceptions import SnowflakeException, OperationsException, ValidationException
 from ..core.response_handlers import SnowflakeResponse
-from ..helpers.operations_manager import OperationsManager
+from ..core.snowflake_utils import get_snowflake_credentials
+from ..helpers.operations_manager import OperationsManager, get_operations_manager
+import logging
 import os
 
 
+# Server-side log for operations tools; messages use lazy %-style args
+logger = logging.getLogger(__name__)
+
+# Progress messages to the client (ctx.info) cost a protocol round-trip each,
+# so they are only sent when MCP_OPERATIONS_DEBUG=1
+_DEBUG = os.getenv("MCP_OPERATIONS_DEBUG") == "1"
+
+# Rows execute_sql_query returns unless the caller asks for more
+DEFAULT_MAX_ROWS = 1000
+
+# Accepted values for the keyword arguments that are spliced into SQL,
+# normalized to upper case with single spaces
+_CONTEXT_TYPES = frozenset({"DATABASE", "SCHEMA", "WAREHOUSE", "ROLE"})
+_SCOPE_TYPES = frozenset({"ACCOUNT", "DATABASE", "SCHEMA", "TABLE", "VIEW"})
+_OBJECT_TYPES = frozenset({
+    "DATABASES", "SCHEMAS", "TABLES", "VIEWS", "MATERIALIZED VIEWS", "EXTERNAL TABLES",
+    "DYNAMIC TABLES", "ICEBERG TABLES", "EVENT TABLES", "COLUMNS", "OBJECTS", "WAREHOUSES",
+    "ROLES", "DATABASE ROLES", "USERS", "GRANTS", "STAGES", "FILE FORMATS", "SEQUENCES",
+    "STREAMS", "TASKS", "PIPES", "FUNCTIONS", "USER FUNCTIONS", "EXTERNAL FUNCTIONS",
+    "PROCEDURES", "INTEGRATIONS", "SHARES", "RESOURCE MONITORS", "NETWORK POLICIES",
+    "MASKING POLICIES", "ROW ACCESS POLICIES", "TAGS", "ALERTS", "SECRETS", "PARAMETERS"
+})
+_PRIVILEGES = frozenset({
+    "ALL", "ALL PRIVILEGES", "OWNERSHIP", "SELECT", "INSERT", "UPDATE", "DELETE", "TRUNCATE",
+    "REFERENCES", "USAGE", "OPERATE", "MONITOR", "MODIFY", "READ", "WRITE", "REBUILD",
+    "EVOLVE SCHEMA", "APPLYBUDGET", "IMPORTED PRIVILEGES", "APPLY MASKING POLICY",
+    "APPLY ROW ACCESS POLICY", "APPLY TAG", "EXECUTE TASK", "EXECUTE MANAGED TASK",
+    "MANAGE GRANTS", "CREATE DATABASE", "CREATE SCHEMA", "CREATE TABLE", "CREATE VIEW",
+    "CREATE MATERIALIZED VIEW", "CREATE EXTERNAL TABLE", "CREATE DYNAMIC TABLE",
+    "CREATE STAGE", "CREATE FILE FORMAT", "CREATE SEQUENCE", "CREATE FUNCTION",
+    "CREATE PROCEDURE", "CREATE STREAM", "CREATE TASK", "CREATE PIPE", "CREATE WAREHOUSE",
+    "CREATE ROLE", "CREATE DATABASE ROLE", "CREATE USER", "CREATE SHARE", "CREATE INTEGRATION",
+    "IMPORT SHARE"
+})
+_GRANTEE_TYPES = frozenset({"ROLE", "DATABASE ROLE", "USER", "SHARE"})
+_ON_TYPES = frozenset({
+    "ACCOUNT", "DATABASE", "SCHEMA", "TABLE", "VIEW", "MATERIALIZED VIEW", "EXTERNAL TABLE",
+    "DYNAMIC TABLE", "ICEBERG TABLE", "EVENT TABLE", "WAREHOUSE", "STAGE", "FILE FORMAT",
+    "SEQUENCE", "STREAM", "TASK", "PIPE", "FUNCTION", "PROCEDURE", "INTEGRATION",
+    "RESOURCE MONITOR", "MASKING POLICY", "ROW ACCESS POLICY", "TAG", "ALERT", "SECRET",
+    "ALL SCHEMAS IN DATABASE", "ALL TABLES IN SCHEMA", "ALL TABLES IN DATABASE",
+    "ALL VIEWS IN SCHEMA", "ALL VIEWS IN DATABASE", "FUTURE SCHEMAS IN DATABASE",
+    "FUTURE TABLES IN SCHEMA", "FUTURE TABLES IN DATABASE", "FUTURE VIEWS IN SCHEMA",
+    "FUTURE VIEWS IN DATABASE"
+})
+
+# Query issued by test_snowflake_connection
+_TEST_QUERY = "SELECT CURRENT_USER() as user, CURRENT_ACCOUNT() as account, CURRENT_REGION() as region, CURRENT_TIMESTAMP() as timestamp, CURRENT_VERSION() as version"
+
+# Tool tag sets, built once at import and shared by every registration
+_TEST_TAGS = frozenset({"database", "test", "connection", "diagnostics"})
+_QUERY_TAGS = frozenset({"database", "operations", "query", "sql"})
+_BATCH_TAGS = frozenset({"database", "query", "sql", "custom", "batch"})
+_SHOW_TAGS = frozenset({"database", "operations", "show", "inspect"})
+_DESCRIBE_TAGS = frozenset({"database", "operations", "describe", "inspect"})
+_DESCRIBE_BATCH_TAGS = frozenset({"database", "operations", "describe", "inspect", "batch"})
+_CONTEXT_TAGS = frozenset({"database", "operations", "context", "use"})
+_WAREHOUSE_TAGS = frozenset({"database", "operations", "warehouse", "performance"})
+_PRIVILEGE_TAGS = frozenset({"database", "operations", "security", "privileges"})
+
+# Static output skeletons, filled in with str.format by the tools
+_CONNECTION_OK_TEMPLATE = """🎉 Snowflake Connection Test SUCCESSFUL!
+
+🔗 Connection Details:
+Account: {account}
+User: {user}
+
+📊 Query Results:
+{row}
+
+✅ Connection Status: ACTIVE
+✅ Authentication: VERIFIED
+✅ Query Execution: WORKING
+
+Your Snowflake MCP server can successfully connect and execute queries!"""
+
+_CONNECTION_OK_NO_RESULTS_TEMPLATE = """✅ Snowflake Connection Test SUCCESSFUL!
+
+🔗 Connection Details:
+Account: {account}
+User: {user}
+
+✅ Connection Status: ACTIVE
+✅ Authentication: VERIFIED
+
+Your Snowflake connection is working properly!"""
+
+_CONNECTION_QUERY_FAILED_TEMPLATE = """❌ Snowflake Connection Test FAILED!
+
+🔗 Attempted Connection:
+Account: {account}
+User: {user}
+
+❌ Error: {error}
+
+Please check your credentials and network connectivity."""
+
+_CONNECTION_FAILED_TEMPLATE = """❌ Snowflake Connection Test FAILED!
+
+❌ Error: {error}
+
+Please verify:
+1. SNOWFLAKE_ACCOUNT is correct
+2. SNOWFLAKE_USER exists and has permissions
+3. SNOWFLAKE_PAT is valid and not expired
+4. Network connectivity to Snowflake"""
+
+_CONTEXT_SET_TEMPLATE = """Context updated successfully!
+
+🎯 Context Type: {context_type}
+📍 Context Name: {context_name}
+✅ Status: Active
+
+All subsequent operations will use this {context_label} context."""
+
+_WAREHOUSE_ALTERED_TEMPLATE = """Warehouse '{warehouse}' altered successfully!
+
+🏭 Warehouse: {warehouse}
+🔧 Changes applied:
+{changes}
+
+💡 The warehouse settings have been updated and will take effect immediately."""
+
+_GRANTED_TEMPLATE = """Privileges granted successfully!
+
+🔐 Privileges: {privileges}
+🎯 Object: {on_type} {on_name}
+👤 Grantee: {to_type} {to_name}
+✅ Status: Active
+
+The specified privileges have been granted and are now in effect."""
+
+_REVOKED_TEMPLATE = """Privileges revoked successfully!
+
+🔐 Privileges: {privileges}
+🎯 Object: {on_type} {on_name}
+👤 From: {from_type} {from_name}
+✅ Status: Revoked
+
+The specified privileges have been removed and are no longer in effect."""
+
+# Response handler for consistent operations response formatting
+response_handler = SnowflakeResponse()
+
+
+def _validate_choice(value: str, allowed: frozenset, field_name: str) -> str:
+    """Return value normalized to upper case with single spaces, if it is one of allowed.
+    
+    Raises:
+        ValidationException: If the normalized value is not in allowed
+    """
+    normalized = " ".join(value.upper().split())
+    if normalized not in allowed:
+        raise ValidationException(
+            f"Unsupported {field_name} '{value}'; expected one of: {', '.join(sorted(allowed))}",
+            field_name,
+            value
+        )
+    return normalized
+
+
+def _validate_privileges(privileges: Union[str, List[str]]) -> Tuple[str, ...]:
+    """Return the privileges as a tuple of validated, normalized privilege names.
+    
+    A single string may hold several comma-separated privileges.
+    """
+    names = privileges.split(",") if isinstance(privileges, str) else privileges
+    normalized = tuple(_validate_choice(name, _PRIVILEGES, "privileges") for name in names)
+    if not normalized:
+        raise ValidationException("At least one privilege is required", "privileges", privileges)
+    return normalized
+
+
+# Grant/revoke calls currently executing, keyed by the statements they issue
+_INFLIGHT: Dict[tuple, asyncio.Future] = {}
+
+
+async def _coalesced(key: tuple, start):
+    """Await the in-flight call for key, or start one with start() if there is none.
+    
+    Concurrent identical calls share a single execution and its result. The
+    entry is dropped once the call finishes, so later calls run again.
+    """
+    future = _INFLIGHT.get(key)
+    if future is None:
+        future = _INFLIGHT[key] = asyncio.ensure_future(start())
+        future.add_done_callback(lambda _: _INFLIGHT.pop(key, None))
+    # Shielded so one caller being cancelled doesn't cancel the shared call
+    return await asyncio.shield(future)
+
+
+async def _handle_operations_error(ctx: Context, error: Exception, failure: str) -> NoReturn:
+    """Report a failed operations tool call to the client and raise it as a ToolError.
+    
+    Args:
+        ctx: Tool context to report the error on
+        error: The exception raised by the tool body
+        failure: Description used for Snowflake errors, e.g. "Set context failed"
+    """
+    if isinstance(error, SnowflakeException):
+        message = f"{failure}: {error.message}"
+    elif isinstance(error, ValidationException):
+        message = f"Validation error: {str(error)}"
+    else:
+        message = f"Unexpected error: {str(error)}"
+    await ctx.error(message)
+    raise ToolError(message)
+
+
+def _reportable(error: BaseException, operation: str, object_name: str) -> BaseException:
+    """Return error as an exception the grant/revoke tools report to the client.
+    
+    Those tools only report Snowflake and validation errors, so any other
+    Exception is wrapped in an OperationsException; cancellation and other
+    BaseExceptions are returned unchanged so they still propagate.
+    """
+    if isinstance(error, (SnowflakeException, ValidationException)) or not isinstance(error, Exception):
+        return error
+    return OperationsException(str(error), operation, object_name)
+
+
+def _operations_tool(failure: str, errors: Tuple[type, ...] = (Exception,)):
+    """Decorate an operations tool so errors it raises are reported through _handle_operations_error.
+    
+    functools.wraps keeps the tool's signature, which FastMCP builds the
+    tool's schema from, so the decorator sits between @mcp.tool and the
+    tool function.
+    
+    Args:
+        failure: Description used for Snowflake errors, e.g. "Set context failed"
+        errors: Exception types that are reported; others propagate unchanged
+    """
+    def decorate(tool):
+        @functools.wraps(tool)
+        async def wrapper(*args, **kwargs):
+            try:
+                return await tool(*args, **kwargs)
+            except errors as e:
+                await _handle_operations_error(kwargs.get("ctx"), e, failure)
+        return wrapper
+    return decorate
+
+
+def _operations_manager() -> OperationsManager:
+    """Return the shared operations manager for the environment's Snowflake credentials."""
+    account_identifier, username, pat = get_snowflake_credentials()
+    return get_operations_manager(
+        account_identifier=account_identifier,
+        username=username,
+        password=pat
+    )
+
+
 def register_operations_tools(mcp: FastMCP):
     """
     Register Snowflake Operations as FastMCP tools.
@@ -25,24 +282,10 @@ def register_operations_tools(mcp: FastMCP):
         mcp: FastMCP server instance
     """
     
-    # Initialize response handler for consistent formatting
-    response_handler = SnowflakeResponse()
-    
-    def get_snowflake_credentials():
-        """Get Snowflake credentials from environment variables."""
-        account_identifier = os.getenv("SNOWFLAKE_ACCOUNT")
-        username = os.getenv("SNOWFLAKE_USER") 
-        pat = os.getenv("SNOWFLAKE_PAT") or os.getenv("SNOWFLAKE_PASSWORD")
-        
-        if not account_identifier or not username or not pat:
-            raise ValidationException("Missing required Snowflake credentials: SNOWFLAKE_ACCOUNT, SNOWFLAKE_USER, and SNOWFLAKE_PAT/SNOWFLAKE_PASSWORD", "credentials", "environment")
-        
-        return account_identifier, username, pat
-    
     @mcp.tool(
         name="test_snowflake_connection",
         description="Test the Snowflake connection and return basic account information",
-        tags={"database", "test", "connection", "diagnostics"}
+        tags=_TEST_TAGS
     )
     async def test_snowflake_connection(
         ctx: Context = None
@@ -57,82 +300,53 @@ def register_operations_tools(mcp: FastMCP):
             Connection test results and account information
         """
         try:
-            await ctx.info("Testing Snowflake connection...")
+            if _DEBUG:
+                await ctx.info("Testing Snowflake connection...")
             
-            # Get Snowflake credentials and create operations manager
+            # Get Snowflake credentials and the shared operations manager
             account_identifier, username, pat = get_snowflake_credentials()
-            ops_manager = OperationsManager(
+            ops_manager = get_operations_manager(
                 account_identifier=account_identifier,
                 username=username,
                 password=pat
             )
             
             # Execute a simple test query
-            test_query = "SELECT CURRENT_USER() as user, CURRENT_ACCOUNT() as account, CURRENT_REGION() as region, CURRENT_TIMESTAMP() as timestamp, CURRENT_VERSION() as version"
-            result = ops_manager.execute_query(test_query)
+            result = await ops_manager.execute_query_async(_TEST_QUERY)
             
             if result["success"]:
-                await ctx.info("✅ Snowflake connection successful!")
+                if _DEBUG:
+                    await ctx.info("✅ Snowflake connection successful!")
                 
-                # Parse the results
                 if result["results"]:
-                    # The result is a string representation, let's format it nicely
-                    return f"""🎉 Snowflake Connection Test SUCCESSFUL!
-                    
-                    🔗 Connection Details:
-                    Account: {account_identifier}
-                    User: {username}
-                    
-                    📊 Query Results:
-                    {result['results'][0] if result['results'] else 'No detailed results available'}
-
-                    ✅ Connection Status: ACTIVE
-                    ✅ Authentication: VERIFIED
-                    ✅ Query Execution: WORKING
-
-                    Your Snowflake MCP server can successfully connect and execute queries!"""
-                else:
-                    return f"""✅ Snowflake Connection Test SUCCESSFUL!
-                    
-                    🔗 Connection Details:
-                    Account: {account_identifier}
-                    User: {username}
-                    
-                    ✅ Connection Status: ACTIVE
-                    ✅ Authentication: VERIFIED
-
-                    Your Snowflake connection is working properly!"""
+                    return _CONNECTION_OK_TEMPLATE.format(
+                        account=account_identifier,
+                        user=username,
+                        row=result["results"][0]
+                    )
+                return _CONNECTION_OK_NO_RESULTS_TEMPLATE.format(account=account_identifier, user=username)
             else:
                 await ctx.error(f"Connection test query failed: {result['message']}")
-                return f"""❌ Snowflake Connection Test FAILED!
-                
-🔗 Attempted Connection:
-Account: {account_identifier}
-User: {username}
-
-❌ Error: {result['message']}
-
-Please check your credentials and network connectivity."""
+                return _CONNECTION_QUERY_FAILED_TEMPLATE.format(
+                    account=account_identifier,
+                    user=username,
+                    error=result["message"]
+                )
                 
         except Exception as e:
             await ctx.error(f"Connection test failed: {str(e)}")
-            return f"""❌ Snowflake Connection Test FAILED!
-            
-❌ Error: {str(e)}
-            
-Please verify:
-1. SNOWFLAKE_ACCOUNT is correct
-2. SNOWFLAKE_USER exists and has permissions
-3. SNOWFLAKE_PAT is valid and not expired
-4. Network connectivity to Snowflake"""
+            return _CONNECTION_FAILED_TEMPLATE.format(error=str(e))
     
     @mcp.tool(
         name="execute_sql_query",
         description="Execute a custom SQL query on Snowflake",
-        tags={"database", "operations", "query", "sql"}
+        tags=_QUERY_TAGS
     )
+    @_operations_tool("SQL query failed")
     async def execute_sql_query(
         query: str,
+        params: Optional[List[Any]] = None,
+        max_rows: Optional[int] = DEFAULT_MAX_ROWS,
         connection_name: str = "default",
         ctx: Context = None
     ) -> str:
@@ -141,95 +355,134 @@ Please verify:
         
         This tool allows you to run any SQL query against your Snowflake database.
         It's perfect for custom analysis, data exploration, or operations that
-        don't fit into the standard DDL/DML patterns.
+        don't fit into the standard DDL/DML patterns. At most max_rows rows are
+        read from the result, so an unbounded SELECT cannot exhaust memory.
+        Transaction and session statements (BEGIN, COMMIT, USE, ALTER SESSION)
+        are rejected, since the connection is shared by every caller.
         
         Args:
-            query: SQL query to execute
+            query: SQL query to execute, with %s placeholders for any params
+            params: Values bound to the query's %s placeholders, in order (a literal % must then be written %%)
+            max_rows: Maximum number of rows to return (None returns every row)
             connection_name: Which connection to use for the operation
             
         Returns:
             Formatted results from the query execution
             
         Example:
-            query = "SELECT COUNT(*) as total_records FROM my_table WHERE status = 'active'"
+            query = "SELECT COUNT(*) as total_records FROM my_table WHERE status = %s"
+            params = ["active"]
         """
-        try:
+        if max_rows is not None and max_rows < 1:
+            raise ValidationException("max_rows must be a positive integer", "max_rows", max_rows)
+        
+        if _DEBUG:
             await ctx.info(f"Executing SQL query: {query[:100]}...")
+        
+        operations_manager = _operations_manager()
+        
+        # Execute query using manager
+        result = await operations_manager.execute_query_async(query, max_rows=max_rows, params=params)
+        
+        if not result["success"]:
+            raise OperationsException(result["message"], "EXECUTE", query)
+        truncated = result["truncated"]
+        
+        # Use response handler for consistent formatting
+        response_data = response_handler.parse_snowflake_operation_response_dict(result)
+        
+        if response_data["success"]:
+            if _DEBUG:
+                await ctx.info("SQL query executed successfully")
             
-            # Get Snowflake credentials and create operations manager
-            account_identifier, username, pat = get_snowflake_credentials()
-            operations_manager = OperationsManager(
-                account_identifier=account_identifier,
-                username=username,
-                password=pat
-            )
-            
-            # Execute query using manager
-            result = operations_manager.execute_query(query)
-            
-            if not result["success"]:
-                raise OperationsException(result["message"], "EXECUTE", query)
-            
-            # Convert string results back to dict format for display
-            formatted_results = []
-            for result_str in result["results"]:
-                # For now, just treat each result as a row
-                formatted_results.append({"data": result_str})
-            
-            # Update result for consistency
-            result["results"] = formatted_results
+            # Format the results for display in a single pass, one row per line
+            if response_data["results"]:
+                buf = io.StringIO()
+                write = buf.write
+                write("SQL query executed successfully:\n\n")
+                write(f"📝 Query: {query}\n")
+                write(f"📊 Total rows: {len(result['results'])}\n\n")
+                write("📈 Results:")
+                for i, row in enumerate(result["results"], 1):
+                    write(f"\nRow {i}: ")
+                    write(row)
+                if truncated:
+                    write(f"\n\n⚠️ Output truncated to the first {max_rows} rows; more rows are available (raise max_rows to see them)")
+                return buf.getvalue()
+            else:
+                return f"SQL query executed successfully (no results returned):\n\n📝 Query: {query}"
+        else:
+            raise ToolError(f"SQL query failed: {result['message']}")
+    
+    @mcp.tool(
+        name="execute_sql_batch",
+        description="Execute several SQL queries in order in a single Snowflake round trip",
+        tags=_BATCH_TAGS
+    )
+    @_operations_tool("SQL batch failed")
+    async def execute_sql_batch(
+        queries: List[str],
+        connection_name: str = "default",
+        ctx: Context = None
+    ) -> str:
+        """
+        Execute a list of SQL queries in order as one batch.
+        
+        This tool sends several SQL statements to Snowflake as a single
+        multi-statement request, which is faster than calling execute_sql_query
+        once per statement. Execution stops at the first failing statement;
+        statements before it remain applied.
+        
+        Args:
+            queries: SQL queries to execute, in order
+            connection_name: Which connection to use for the operation
             
-            # Use response handler for consistent formatting
-            parsed_response = response_handler.parse_snowflake_operation_response(result)
-            response_data = json.loads(parsed_response)
+        Returns:
+            Formatted results from all queries, in execution order
             
-            if response_data["success"]:
-                await ctx.info("SQL query executed successfully")
-                
-                # Format the results for display
-                if response_data["results"]:
-                    formatted_results = []
-                    for i, row in enumerate(result["results"], 1):
-                        formatted_results.append(f"Row {i}: {json.dumps(row, indent=2, default=str)}")
-                    
-                    results_text = "\n\n".join(formatted_results)
-                    
-                    return f"""SQL query executed successfully:
-
-                    📝 Query: {query}
-                    📊 Total rows: {len(result['results'])}
-
-                    📈 Results:
-                    {results_text}"""
-                else:
-                    return f"SQL query executed successfully (no results returned):\n\n📝 Query: {query}"
-            else:
-                raise ToolError(f"SQL query failed: {result['message']}")
-                
-        except ValidationException as e:
-            await ctx.error(f"Validation error: {str(e)}")
-            raise ToolError(f"Validation error: {str(e)}")
-        except OperationsException as e:
-            await ctx.error(f"Operations failed: {e.message}")
-            raise ToolError(f"Operations failed: {e.message}")
-        except SnowflakeException as e:
-            # Convert generic Snowflake exceptions to Operations exceptions for better context
-            ops_error = OperationsException(f"SQL query failed: {e.message}", "EXECUTE", query)
-            await ctx.error(f"SQL query failed: {ops_error.message}")
-            raise ToolError(f"SQL query failed: {ops_error.message}")
-        except Exception as e:
-            ops_error = OperationsException(f"Unexpected error during SQL execution: {str(e)}", "EXECUTE", query)
-            await ctx.error(f"Unexpected SQL error: {ops_error.message}")
-            raise ToolError(f"Unexpected SQL error: {ops_error.message}")
+        Example:
+            queries = ["USE WAREHOUSE COMPUTE_WH", "SELECT CURRENT_WAREHOUSE()"]
+        """
+        if not queries:
+            raise ValidationException("At least one query is required", "queries", queries)
+        for query in queries:
+            if not query or not query.strip().rstrip(";"):
+                raise ValidationException("Query cannot be empty", "queries", query)
+        
+        if _DEBUG:
+            await ctx.info(f"Executing batch of {len(queries)} SQL queries")
+        
+        operations_manager = _operations_manager()
+        
+        # Execute all queries in one round trip using manager
+        result = await operations_manager.execute_query_batch_async(queries)
+        
+        if _DEBUG:
+            await ctx.info("SQL batch executed successfully")
+        
+        lines = [
+            "SQL batch executed successfully!",
+            "",
+            f"📝 Queries: {len(queries)}",
+            f"📊 Total rows: {len(result['results'])}"
+        ]
+        if result["results"]:
+            lines.append("")
+            lines.append("📈 Results:")
+            lines.extend(f"Row {i}: {row}" for i, row in enumerate(result["results"], 1))
+        return "\n".join(lines)
     
     @mcp.tool(
         name="show_database_objects",
         description="Show Snowflake objects of a specific type",
-        tags={"database", "operations", "show", "inspect"}
+        tags=_SHOW_TAGS
     )
+    @_operations_tool("Show objects failed")
     async def show_database_objects(
         object_type: str,
         pattern: Optional[str] = None,
+        scope_type: Optional[str] = None,
+        scope_name: Optional[str] = None,
         connection_name: str = "default",
         ctx: Context = None
     ) -> str:
@@ -237,11 +490,14 @@ Please verify:
         Show Snowflake objects of a specific type with optional filtering.
         
         This tool lists database objects like databases, schemas, tables, views,
-        warehouses, etc. You can optionally filter by name pattern.
+        warehouses, etc. You can optionally filter by name pattern and limit the
+        listing to one database, schema, table or view.
         
         Args:
-            object_type: Type of objects to show (DATABASES, SCHEMAS, TABLES, VIEWS, WAREHOUSES, etc.)
+            object_type: Type of objects to show (DATABASES, SCHEMAS, TABLES, VIEWS, WAREHOUSES, etc.; case-insensitive)
             pattern: Optional pattern to filter objects by name (e.g., 'MY_%')
+            scope_type: Optional container to list objects in (ACCOUNT, DATABASE, SCHEMA, TABLE, VIEW)
+            scope_name: Name of the container (e.g., 'MY_DB.PUBLIC'); required unless scope_type is ACCOUNT
             connection_name: Which connection to use for the operation
             
         Returns:
@@ -250,88 +506,61 @@ Please verify:
         Example:
             object_type = "TABLES"
             pattern = "CUSTOMER_%"
+            scope_type = "SCHEMA"
+            scope_name = "MY_DATABASE.PUBLIC"
         """
-        try:
+        object_type = _validate_choice(object_type, _OBJECT_TYPES, "object_type")
+        if scope_type is not None:
+            scope_type = _validate_choice(scope_type, _SCOPE_TYPES, "scope_type")
+            if scope_type != "ACCOUNT" and not scope_name:
+                raise ValidationException(f"scope_name is required for scope_type {scope_type}", "scope_name", scope_name)
+        elif scope_name:
+            raise ValidationException("scope_name requires a scope_type", "scope_type", scope_type)
+        
+        if _DEBUG:
             await ctx.info(f"Showing {object_type}" + (f" matching '{pattern}'" if pattern else ""))
-            
-            # Get Snowflake credentials and create operations manager
-            account_identifier, username, pat = get_snowflake_credentials()
-            operations_manager = OperationsManager(
-                account_identifier=account_identifier,
-                username=username,
-                password=pat
-            )
-            
-            # Show objects using manager
-            result = operations_manager.show_objects(
-                object_type=object_type.upper(),
-                pattern=pattern
-            )
-            
-            if not result["success"]:
-                raise OperationsException(result["message"], "SHOW", object_type)
-            
-            # Convert string results back to dict format for display
-            formatted_results = []
-            for result_str in result["results"]:
-                formatted_results.append({"data": result_str})
-            
-            # Update result for consistency
-            result = {
-                "success": True,
-                "message": f"Found {len(formatted_results)} {object_type.lower()}",
-                "results": formatted_results
-            }
-            
-            # Use response handler for consistent formatting
-            parsed_response = response_handler.parse_snowflake_operation_response(result)
-            response_data = json.loads(parsed_response)
-            
-            if response_data["success"]:
+        
+        operations_manager = _operations_manager()
+        
+        # Show objects using manager
+        result = await operations_manager.show_objects_async(
+            object_type=object_type,
+            pattern=pattern,
+            scope_type=scope_type,
+            scope_name=scope_name
+        )
+        
+        if not result["success"]:
+            raise OperationsException(result["message"], "SHOW", object_type)
+        
+        if result["success"]:
+            if _DEBUG:
                 await ctx.info(f"Found {len(result['results'])} {object_type.lower()}")
-                
-                # Format the results for display
-                if result["results"]:
-                    formatted_results = []
-                    for i, obj in enumerate(result["results"], 1):
-                        formatted_results.append(f"{i}. {json.dumps(obj, indent=2, default=str)}")
-                    
-                    results_text = "\n\n".join(formatted_results)
-                    
-                    return f"""Database objects found:
-
-                    🔍 Type: {object_type}
-                    🎯 Pattern: {pattern if pattern else 'All'}
-                    📊 Total found: {len(result['results'])}
-
-                    📈 Objects:
-                    {results_text}"""
-                else:
-                    return f"No {object_type.lower()} found" + (f" matching pattern '{pattern}'" if pattern else "")
+            
+            # Format the results for display in a single pass, one object per line
+            if result["results"]:
+                buf = io.StringIO()
+                write = buf.write
+                write("Database objects found:\n\n")
+                write(f"🔍 Type: {object_type}\n")
+                write(f"🎯 Pattern: {pattern if pattern else 'All'}\n")
+                write(f"📊 Total found: {len(result['results'])}\n\n")
+                write("📈 Objects:")
+                for i, obj in enumerate(result["results"], 1):
+                    write(f"\n{i}. ")
+                    write(obj)
+                return buf.getvalue()
             else:
-                raise ToolError(f"Show objects failed: {result['message']}")
-                
-        except ValidationException as e:
-            await ctx.error(f"Validation error: {str(e)}")
-            raise ToolError(f"Validation error: {str(e)}")
-        except OperationsException as e:
-            await ctx.error(f"Show objects failed: {e.message}")
-            raise ToolError(f"Show objects failed: {e.message}")
-        except SnowflakeException as e:
-            # Convert generic Snowflake exceptions to Operations exceptions for better context
-            ops_error = OperationsException(f"Show objects failed: {e.message}", "SHOW", object_type)
-            await ctx.error(f"Show objects failed: {ops_error.message}")
-            raise ToolError(f"Show objects failed: {ops_error.message}")
-        except Exception as e:
-            ops_error = OperationsException(f"Unexpected error during show objects: {str(e)}", "SHOW", object_type)
-            await ctx.error(f"Unexpected show error: {ops_error.message}")
-            raise ToolError(f"Unexpected show error: {ops_error.message}")
+                return f"No {object_type.lower()} found" + (f" matching pattern '{pattern}'" if pattern else "")
+        else:
+            raise ToolError(f"Show objects failed: {result['message']}")
     
     @mcp.tool(
         name="describe_database_object",
         description="Get detailed information about a database object",
-        tags={"database", "operations", "describe", "inspect"}
+        tags=_DESCRIBE_TAGS
     )
+    @_operations_tool("Describe object failed")
     async def describe_database_object(
         object_name: str,
         connection_name: str = "default",
@@ -353,79 +582,113 @@ Please verify:
         Example:
             object_name = "MY_DATABASE.PUBLIC.CUSTOMERS"
         """
-        try:
+        if _DEBUG:
             await ctx.info(f"Describing object: {object_name}")
+        
+        operations_manager = _operations_manager()
+        
+        # Describe object using manager
+        result = await operations_manager.describe_object_async(object_name)
+        
+        if not result["success"]:
+            raise OperationsException(result["message"], "DESCRIBE", object_name)
+        
+        if result["success"]:
+            if _DEBUG:
+                await ctx.info(f"Object description retrieved for {object_name}")
             
-            # Get Snowflake credentials and create operations manager
-            account_identifier, username, pat = get_snowflake_credentials()
-            operations_manager = OperationsManager(
-                account_identifier=account_identifier,
-                username=username,
-                password=pat
-            )
-            
-            # Describe object using manager
-            result = operations_manager.describe_object(object_name)
-            
-            if not result["success"]:
-                raise OperationsException(result["message"], "DESCRIBE", object_name)
-            
-            # Convert string results back to dict format for display
-            formatted_results = []
-            for result_str in result["results"]:
-                formatted_results.append({"data": result_str})
+            # Format the results for display in a single pass, one detail per line
+            if result["results"]:
+                buf = io.StringIO()
+                write = buf.write
+                write("Object description:\n\n")
+                write(f"🎯 Object: {object_name}\n")
+                write(f"📊 Details found: {len(result['results'])}\n\n")
+                write("📈 Description:")
+                for i, detail in enumerate(result["results"], 1):
+                    write(f"\n{i}. ")
+                    write(detail)
+                return buf.getvalue()
+            else:
+                return f"No description available for {object_name}"
+        else:
+            raise ToolError(f"Describe object failed: {result['message']}")
+    
+    @mcp.tool(
+        name="describe_database_objects",
+        description="Get detailed information about several database objects concurrently",
+        tags=_DESCRIBE_BATCH_TAGS
+    )
+    @_operations_tool("Describe objects failed")
+    async def describe_database_objects(
+        object_names: List[str],
+        connection_name: str = "default",
+        ctx: Context = None
+    ) -> str:
+        """
+        Get detailed information about several database objects at once.
+        
+        The DESCRIBE statements are issued concurrently, so describing N
+        objects takes roughly as long as the slowest one rather than the sum
+        of all of them. Objects that cannot be described are reported per
+        object and do not hide the descriptions of the others.
+        
+        Args:
+            object_names: Fully qualified names of the objects (DATABASE.SCHEMA.OBJECT)
+            connection_name: Which connection to use for the operation
             
-            # Update result for consistency
-            result = {
-                "success": True,
-                "message": f"Object description retrieved for {object_name}",
-                "results": formatted_results
-            }
+        Returns:
+            Detailed description of each object
             
-            if result["success"]:
-                await ctx.info(f"Object description retrieved for {object_name}")
-                
-                # Format the results for display
-                if result["results"]:
-                    formatted_results = []
-                    for i, detail in enumerate(result["results"], 1):
-                        formatted_results.append(f"{i}. {json.dumps(detail, indent=2, default=str)}")
-                    
-                    results_text = "\n\n".join(formatted_results)
-                    
-                    return f"""Object description:
-
-                    🎯 Object: {object_name}
-                    📊 Details found: {len(result['results'])}
-
-                    📈 Description:
-                    {results_text}"""
-                else:
-                    return f"No description available for {object_name}"
-            else:
-                raise ToolError(f"Describe object failed: {result['message']}")
-                
-        except ValidationException as e:
-            await ctx.error(f"Validation error: {str(e)}")
-            raise ToolError(f"Validation error: {str(e)}")
-        except OperationsException as e:
-            await ctx.error(f"Describe object failed: {e.message}")
-            raise ToolError(f"Describe object failed: {e.message}")
-        except SnowflakeException as e:
-            # Convert generic Snowflake exceptions to Operations exceptions for better context
-            ops_error = OperationsException(f"Describe object failed: {e.message}", "DESCRIBE", object_name)
-            await ctx.error(f"Describe failed: {ops_error.message}")
-            raise ToolError(f"Describe failed: {ops_error.message}")
-        except Exception as e:
-            ops_error = OperationsException(f"Unexpected error during describe: {str(e)}", "DESCRIBE", object_name)
-            await ctx.error(f"Unexpected describe error: {ops_error.message}")
-            raise ToolError(f"Unexpected describe error: {ops_error.message}")
+        Example:
+            object_names = ["MY_DATABASE.PUBLIC.CUSTOMERS", "MY_DATABASE.PUBLIC.ORDERS"]
+        """
+        if not object_names:
+            raise ValidationException("At least one object name is required", "object_names", object_names)
+        
+        if _DEBUG:
+            await ctx.info(f"Describing {len(object_names)} objects")
+        
+        operations_manager = _operations_manager()
+        
+        # Describe objects concurrently; each blocking call runs in a worker thread
+        outcomes = await asyncio.gather(
+            *(operations_manager.describe_object_async(object_name) for object_name in object_names),
+            return_exceptions=True
+        )
+        
+        failures = [
+            f"{object_name}: {getattr(outcome, 'message', str(outcome))}"
+            for object_name, outcome in zip(object_names, outcomes)
+            if isinstance(outcome, BaseException)
+        ]
+        if len(failures) == len(object_names):
+            raise OperationsException("; ".join(failures), "DESCRIBE", ", ".join(object_names))
+        
+        if _DEBUG:
+            await ctx.info(f"Object descriptions retrieved for {len(object_names) - len(failures)} of {len(object_names)} objects")
+        
+        # Format the results for display in a single pass, one detail per line
+        buf = io.StringIO()
+        write = buf.write
+        write(f"Object descriptions ({len(object_names)} objects):")
+        for object_name, outcome in zip(object_names, outcomes):
+            write(f"\n\n🎯 Object: {object_name}")
+            if isinstance(outcome, BaseException):
+                write(f"\n❌ Error: {getattr(outcome, 'message', str(outcome))}")
+                continue
+            write(f"\n📊 Details found: {len(outcome['results'])}")
+            for i, detail in enumerate(outcome["results"], 1):
+                write(f"\n{i}. ")
+                write(detail)
+        return buf.getvalue()
     
     @mcp.tool(
         name="set_context",
         description="Set the current database context (database, schema, warehouse, role)",
-        tags={"database", "operations", "context", "use"}
+        tags=_CONTEXT_TAGS
     )
+    @_operations_tool("Set context failed")
     async def set_context(
         context_type: str,
         context_name: str,
@@ -450,59 +713,39 @@ Please verify:
             context_type = "DATABASE"
             context_name = "MY_DATABASE"
         """
-        try:
+        context_type = _validate_choice(context_type, _CONTEXT_TYPES, "context_type")
+        
+        if _DEBUG:
             await ctx.info(f"Setting {context_type} context to: {context_name}")
-            
-            # Get Snowflake credentials and create operations manager
-            account_identifier, username, pat = get_snowflake_credentials()
-            operations_manager = OperationsManager(
-                account_identifier=account_identifier,
-                username=username,
-                password=pat
-            )
-            
-            # Set context using manager
-            result = operations_manager.use_context(
-                context_type=context_type.upper(),
-                context_name=context_name
-            )
-            
-            if not result["success"]:
-                raise OperationsException(result["message"], "USE", f"{context_type} {context_name}")
-            
-            if result["success"]:
+        
+        operations_manager = _operations_manager()
+        
+        # Set context using manager
+        result = await operations_manager.use_context_async(
+            context_type=context_type,
+            context_name=context_name
+        )
+        
+        if not result["success"]:
+            raise OperationsException(result["message"], "USE", f"{context_type} {context_name}")
+        
+        if result["success"]:
+            if _DEBUG:
                 await ctx.info(f"Context set successfully to {context_type} {context_name}")
-                return f"""Context updated successfully!
-
-                🎯 Context Type: {context_type}
-                📍 Context Name: {context_name}
-                ✅ Status: Active
-
-                All subsequent operations will use this {context_type.lower()} context."""
-            else:
-                raise ToolError(f"Set context failed: {result['message']}")
-                
-        except ValidationException as e:
-            await ctx.error(f"Validation error: {str(e)}")
-            raise ToolError(f"Validation error: {str(e)}")
-        except OperationsException as e:
-            await ctx.error(f"Set context failed: {e.message}")
-            raise ToolError(f"Set context failed: {e.message}")
-        except SnowflakeException as e:
-            # Convert generic Snowflake exceptions to Operations exceptions for better context
-            ops_error = OperationsException(f"Set context failed: {e.message}", "USE", f"{context_type} {context_name}")
-            await ctx.error(f"Set context failed: {ops_error.message}")
-            raise ToolError(f"Set context failed: {ops_error.message}")
-        except Exception as e:
-            ops_error = OperationsException(f"Unexpected error during context change: {str(e)}", "USE", f"{context_type} {context_name}")
-            await ctx.error(f"Unexpected context error: {ops_error.message}")
-            raise ToolError(f"Unexpected context error: {ops_error.message}")
+            return _CONTEXT_SET_TEMPLATE.format(
+                context_type=context_type,
+                context_name=context_name,
+                context_label=context_type.lower()
+            )
+        else:
+            raise ToolError(f"Set context failed: {result['message']}")
     
     @mcp.tool(
         name="alter_warehouse",
         description="Modify warehouse settings for performance optimization",
-        tags={"database", "operations", "warehouse", "performance"}
+        tags=_WAREHOUSE_TAGS
     )
+    @_operations_tool("Alter warehouse failed")
     async def alter_warehouse(
         warehouse_name: str,
         size: Optional[str] = None,
@@ -533,81 +776,56 @@ Please verify:
             auto_suspend = 300
             auto_resume = True
         """
-        try:
+        if _DEBUG:
             await ctx.info(f"Altering warehouse: {warehouse_name}")
+        
+        # Validate that at least one parameter is provided
+        if not any([size, auto_suspend is not None, auto_resume is not None]):
+            raise ValidationException("No warehouse parameters specified for alteration", "parameters", "all_none")
+        
+        operations_manager = _operations_manager()
+        
+        # Alter warehouse using manager
+        result = await operations_manager.alter_warehouse_async(
+            warehouse_name=warehouse_name,
+            size=size,
+            auto_suspend=auto_suspend,
+            auto_resume=auto_resume
+        )
+        
+        if not result["success"]:
+            raise OperationsException(result["message"], "ALTER_WAREHOUSE", warehouse_name)
+        
+        if result["success"]:
+            if _DEBUG:
+                await ctx.info(f"Warehouse {warehouse_name} altered successfully")
             
-            # Validate that at least one parameter is provided
-            if not any([size, auto_suspend is not None, auto_resume is not None]):
-                raise ValidationException("No warehouse parameters specified for alteration", "parameters", "all_none")
-            
-            # Get Snowflake credentials and create operations manager
-            account_identifier, username, pat = get_snowflake_credentials()
-            operations_manager = OperationsManager(
-                account_identifier=account_identifier,
-                username=username,
-                password=pat
-            )
-            
-            # Alter warehouse using manager
-            result = operations_manager.alter_warehouse(
-                warehouse_name=warehouse_name,
-                size=size,
-                auto_suspend=auto_suspend,
-                auto_resume=auto_resume
+            # Format the changes made
+            changes = []
+            if size:
+                changes.append(f"Size: {size}")
+            if auto_suspend is not None:
+                changes.append(f"Auto-suspend: {auto_suspend} seconds")
+            if auto_resume is not None:
+                changes.append(f"Auto-resume: {'Enabled' if auto_resume else 'Disabled'}")
+            
+            return _WAREHOUSE_ALTERED_TEMPLATE.format(
+                warehouse=warehouse_name,
+                changes="\n".join(f"  • {change}" for change in changes)
             )
-            
-            if not result["success"]:
-                raise OperationsException(result["message"], "ALTER_WAREHOUSE", warehouse_name)
-            
-            if result["success"]:
-                await ctx.info(f"Warehouse {warehouse_name} altered successfully")
-                
-                # Format the changes made
-                changes = []
-                if size:
-                    changes.append(f"Size: {size}")
-                if auto_suspend is not None:
-                    changes.append(f"Auto-suspend: {auto_suspend} seconds")
-                if auto_resume is not None:
-                    changes.append(f"Auto-resume: {'Enabled' if auto_resume else 'Disabled'}")
-                
-                changes_text = "\n".join([f"  • {change}" for change in changes])
-                
-                return f"""Warehouse '{warehouse_name}' altered successfully!
-
-                🏭 Warehouse: {warehouse_name}
-                🔧 Changes applied:
-                {changes_text}
-
-                💡 The warehouse settings have been updated and will take effect immediately."""
-            else:
-                raise ToolError(f"Alter warehouse failed: {result['message']}")
-                
-        except ValidationException as e:
-            await ctx.error(f"Validation error: {str(e)}")
-            raise ToolError(f"Validation error: {str(e)}")
-        except OperationsException as e:
-            await ctx.error(f"Alter warehouse failed: {e.message}")
-            raise ToolError(f"Alter warehouse failed: {e.message}")
-        except SnowflakeException as e:
-            # Convert generic Snowflake exceptions to Operations exceptions for better context
-            ops_error = OperationsException(f"Alter warehouse failed: {e.message}", "ALTER_WAREHOUSE", warehouse_name)
-            await ctx.error(f"Alter warehouse failed: {ops_error.message}")
-            raise ToolError(f"Alter warehouse failed: {ops_error.message}")
-        except Exception as e:
-            ops_error = OperationsException(f"Unexpected error during warehouse alteration: {str(e)}", "ALTER_WAREHOUSE", warehouse_name)
-            await ctx.error(f"Unexpected warehouse error: {ops_error.message}")
-            raise ToolError(f"Unexpected warehouse error: {ops_error.message}")
+        else:
+            raise ToolError(f"Alter warehouse failed: {result['message']}")
     
     @mcp.tool(
         name="grant_privileges",
         description="Grant privileges to a role or user",
-        tags={"database", "operations", "security", "privileges"}
+        tags=_PRIVILEGE_TAGS
     )
+    @_operations_tool("Grant privileges failed", errors=(SnowflakeException, ValidationException))
     async def grant_privileges(
         privileges: Union[str, List[str]],
         on_type: str,
-        on_name: str,
+        on_name: Union[str, List[str]],
         to_type: str,
         to_name: str,
         connection_name: str = "default",
@@ -621,9 +839,9 @@ Please verify:
         
         Args:
             privileges: Single privilege or list of privileges to grant (SELECT, INSERT, UPDATE, etc.)
-            on_type: Type of object to grant privileges on (DATABASE, SCHEMA, TABLE, VIEW, etc.)
-            on_name: Name of the object to grant privileges on
-            to_type: Type of grantee (ROLE, USER)
+            on_type: Type of object to grant privileges on (DATABASE, SCHEMA, TABLE, VIEW, ALL TABLES IN SCHEMA, etc.)
+            on_name: Name of the object to grant privileges on, or a list of objects of on_type
+            to_type: Type of grantee (ROLE, DATABASE ROLE, USER, SHARE)
             to_name: Name of the role or user to grant privileges to
             connection_name: Which connection to use for the operation
             
@@ -637,70 +855,71 @@ Please verify:
             to_type = "ROLE"
             to_name = "ANALYST_ROLE"
         """
-        try:
-            await ctx.info(f"Granting privileges {privileges} on {on_type} {on_name} to {to_type} {to_name}")
-            
-            # Get Snowflake credentials and create operations manager
-            account_identifier, username, pat = get_snowflake_credentials()
-            operations_manager = OperationsManager(
-                account_identifier=account_identifier,
-                username=username,
-                password=pat
-            )
-            
-            # Grant privileges using manager
-            result = operations_manager.grant_privilege(
+        privileges = _validate_privileges(privileges)
+        on_type = _validate_choice(on_type, _ON_TYPES, "on_type")
+        to_type = _validate_choice(to_type, _GRANTEE_TYPES, "to_type")
+        if not on_name:
+            raise ValidationException("At least one object name is required", "on_name", on_name)
+        
+        logger.debug("Granting privileges %s on %s %s to %s %s", privileges, on_type, on_name, to_type, to_name)
+        
+        operations_manager = _operations_manager()
+        
+        # Grant privileges using manager; several objects are handled concurrently,
+        # each blocking call running in a worker thread, and an identical call
+        # already in flight (for the same credentials, i.e. the same shared
+        # manager) is joined rather than repeated
+        on_names = [on_name] if isinstance(on_name, str) else on_name
+        key = ("GRANT", operations_manager, tuple(sorted(privileges)), on_type, tuple(on_names), to_type, to_name)
+        outcomes = await _coalesced(key, lambda: asyncio.gather(
+            *(operations_manager.grant_privilege_async(
                 privileges=privileges,
                 on_type=on_type,
-                on_name=on_name,
+                on_name=name,
                 to_type=to_type,
                 to_name=to_name
+              ) for name in on_names),
+            return_exceptions=True
+        ))
+        
+        failures = [
+            f"{name}: {getattr(outcome, 'message', str(outcome))}"
+            for name, outcome in zip(on_names, outcomes)
+            if isinstance(outcome, BaseException)
+        ]
+        if failures:
+            if len(on_names) == 1:
+                raise _reportable(outcomes[0], "GRANT", on_names[0])
+            raise OperationsException(
+                f"{len(failures)} of {len(on_names)} objects failed ({len(on_names) - len(failures)} succeeded): " + "; ".join(failures),
+                "GRANT",
+                f"{privileges} on {', '.join(on_names)}"
             )
-            
-            if not result["success"]:
-                raise OperationsException(result["message"], "GRANT", f"{privileges} on {on_name}")
-            
-            # Format privileges for display
-            if isinstance(privileges, list):
-                privileges_str = ", ".join(privileges)
-            else:
-                privileges_str = privileges
-            
-            await ctx.info(f"Privileges granted successfully")
-            return f"""Privileges granted successfully!
-
-            🔐 Privileges: {privileges_str}
-            🎯 Object: {on_type} {on_name}
-            👤 Grantee: {to_type} {to_name}
-            ✅ Status: Active
-
-            The specified privileges have been granted and are now in effect."""
-                
-        except ValidationException as e:
-            await ctx.error(f"Validation error: {str(e)}")
-            raise ToolError(f"Validation error: {str(e)}")
-        except OperationsException as e:
-            await ctx.error(f"Grant privileges failed: {e.message}")
-            raise ToolError(f"Grant privileges failed: {e.message}")
-        except SnowflakeException as e:
-            # Convert generic Snowflake exceptions to Operations exceptions for better context
-            ops_error = OperationsException(f"Grant privileges failed: {e.message}", "GRANT", f"{privileges} on {on_name}")
-            await ctx.error(f"Grant failed: {ops_error.message}")
-            raise ToolError(f"Grant failed: {ops_error.message}")
-        except Exception as e:
-            ops_error = OperationsException(f"Unexpected error during privilege grant: {str(e)}", "GRANT", f"{privileges} on {on_name}")
-            await ctx.error(f"Unexpected grant error: {ops_error.message}")
-            raise ToolError(f"Unexpected grant error: {ops_error.message}")
+        on_name = ", ".join(on_names)
+        
+        # Format privileges for display
+        privileges_str = ", ".join(privileges)
+        
+        if _DEBUG:
+            await ctx.info("Privileges granted successfully")
+        return _GRANTED_TEMPLATE.format(
+            privileges=privileges_str,
+            on_type=on_type,
+            on_name=on_name,
+            to_type=to_type,
+            to_name=to_name
+        )
     
     @mcp.tool(
         name="revoke_privileges",
         description="Revoke privileges from a role or user",
-        tags={"database", "operations", "security", "privileges"}
+        tags=_PRIVILEGE_TAGS
     )
+    @_operations_tool("Revoke privileges failed", errors=(SnowflakeException, ValidationException))
     async def revoke_privileges(
         privileges: Union[str, List[str]],
         on_type: str,
-        on_name: str,
+        on_name: Union[str, List[str]],
         from_type: str,
         from_name: str,
         connection_name: str = "default",
@@ -714,9 +933,9 @@ Please verify:
         
         Args:
             privileges: Single privilege or list of privileges to revoke (SELECT, INSERT, UPDATE, etc.)
-            on_type: Type of object to revoke privileges from (DATABASE, SCHEMA, TABLE, VIEW, etc.)
-            on_name: Name of the object to revoke privileges from
-            from_type: Type of grantee (ROLE, USER)
+            on_type: Type of object to revoke privileges from (DATABASE, SCHEMA, TABLE, VIEW, ALL TABLES IN SCHEMA, etc.)
+            on_name: Name of the object to revoke privileges from, or a list of objects of on_type
+            from_type: Type of grantee (ROLE, DATABASE ROLE, USER, SHARE)
             from_name: Name of the role or user to revoke privileges from
             connection_name: Which connection to use for the operation
             
@@ -730,57 +949,57 @@ Please verify:
             from_type = "ROLE"
             from_name = "TEMP_ROLE"
         """
-        try:
-            await ctx.info(f"Revoking privileges {privileges} on {on_type} {on_name} from {from_type} {from_name}")
-            
-            # Get Snowflake credentials and create operations manager
-            account_identifier, username, pat = get_snowflake_credentials()
-            operations_manager = OperationsManager(
-                account_identifier=account_identifier,
-                username=username,
-                password=pat
-            )
-            
-            # Revoke privileges using manager
-            result = operations_manager.revoke_privilege(
+        privileges = _validate_privileges(privileges)
+        on_type = _validate_choice(on_type, _ON_TYPES, "on_type")
+        from_type = _validate_choice(from_type, _GRANTEE_TYPES, "from_type")
+        if not on_name:
+            raise ValidationException("At least one object name is required", "on_name", on_name)
+        
+        logger.debug("Revoking privileges %s on %s %s from %s %s", privileges, on_type, on_name, from_type, from_name)
+        
+        operations_manager = _operations_manager()
+        
+        # Revoke privileges using manager; several objects are handled concurrently,
+        # each blocking call running in a worker thread, and an identical call
+        # already in flight (for the same credentials, i.e. the same shared
+        # manager) is joined rather than repeated
+        on_names = [on_name] if isinstance(on_name, str) else on_name
+        key = ("REVOKE", operations_manager, tuple(sorted(privileges)), on_type, tuple(on_names), from_type, from_name)
+        outcomes = await _coalesced(key, lambda: asyncio.gather(
+            *(operations_manager.revoke_privilege_async(
                 privileges=privileges,
                 on_type=on_type,
-                on_name=on_name,
+                on_name=name,
                 from_type=from_type,
                 from_name=from_name
+              ) for name in on_names),
+            return_exceptions=True
+        ))
+        
+        failures = [
+            f"{name}: {getattr(outcome, 'message', str(outcome))}"
+            for name, outcome in zip(on_names, outcomes)
+            if isinstance(outcome, BaseException)
+        ]
+        if failures:
+            if len(on_names) == 1:
+                raise _reportable(outcomes[0], "REVOKE", on_names[0])
+            raise OperationsException(
+                f"{len(failures)} of {len(on_names)} objects failed ({len(on_names) - len(failures)} succeeded): " + "; ".join(failures),
+                "REVOKE",
+                f"{privileges} on {', '.join(on_names)}"
             )
-            
-            if not result["success"]:
-                raise OperationsException(result["message"], "REVOKE", f"{privileges} on {on_name}")
-            
-            # Format privileges for display
-            if isinstance(privileges, list):
-                privileges_str = ", ".join(privileges)
-            else:
-                privileges_str = privileges
-            
-            await ctx.info(f"Privileges revoked successfully")
-            return f"""Privileges revoked successfully!
-
-            🔐 Privileges: {privileges_str}
-            🎯 Object: {on_type} {on_name}
-            👤 From: {from_type} {from_name}
-            ✅ Status: Revoked
-
-            The specified privileges have been removed and are no longer in effect."""
-                
-        except ValidationException as e:
-            await ctx.error(f"Validation error: {str(e)}")
-            raise ToolError(f"Validation error: {str(e)}")
-        except OperationsException as e:
-            await ctx.error(f"Revoke privileges failed: {e.message}")
-            raise ToolError(f"Revoke privileges failed: {e.message}")
-        except SnowflakeException as e:
-            # Convert generic Snowflake exceptions to Operations exceptions for better context
-            ops_error = OperationsException(f"Revoke privileges failed: {e.message}", "REVOKE", f"{privileges} on {on_name}")
-            await ctx.error(f"Revoke failed: {ops_error.message}")
-            raise ToolError(f"Revoke failed: {ops_error.message}")
-        except Exception as e:
-            ops_error = OperationsException(f"Unexpected error during privilege revocation: {str(e)}", "REVOKE", f"{privileges} on {on_name}")
-            await ctx.error(f"Unexpected revoke error: {ops_error.message}")
-            raise ToolError(f"Unexpected revoke error: {ops_error.message}")
\ No newline at end of file
+        on_name = ", ".join(on_names)
+        
+        # Format privileges for display
+        privileges_str = ", ".join(privileges)
+        
+        if _DEBUG:
+            await ctx.info("Privileges revoked successfully")
+        return _REVOKED_TEMPLATE.format(
+            privileges=privileges_str,
+            on_type=on_type,
+            on_name=on_name,
+            from_type=from_type,
+            from_name=from_name
+        )